@@ -0,0 +1,152 @@
+"""
+Сравнение стоимости маршрутизации callback-запросов:
+линейная проверка F.data/StateFilter (как было раньше) против
+таблицы префиксов CallbackDispatcher.
+
+Запуск из корня проекта:
+    ADMIN_ID=0 python -m benchmarks.bench_callback_routing
+"""
+import asyncio
+import random
+import time
+
+from aiogram import F, Router
+from aiogram.filters import StateFilter
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from handlers.callback_dispatcher import CallbackDispatcher
+from keyboards.callback_data import Cb, pack
+from states import AdminStates, PickTeamStates
+
+ITERATIONS = 20000
+
+# (старый callback_data, это префикс?, состояние, новый префикс, кол-во int-аргументов)
+# в том же порядке, в котором хэндлеры были зарегистрированы в handlers/private_user.py
+ROUTES = [
+    ("back_to_main_menu", False, None, Cb.MAIN_MENU, 0),
+    ("pickteam", False, None, Cb.PICKTEAM, 0),
+    ("back_to_pickteam", False, PickTeamStates.choosing_player, Cb.BACK_TO_PICKTEAM, 0),
+    ("myteam", False, None, Cb.MYTEAM, 0),
+    ("schedule", False, None, Cb.SCHEDULE, 0),
+    ("match_results", False, None, Cb.MATCH_RESULTS, 0),
+    ("match_results_page_", True, None, Cb.MATCH_RESULTS, 1),
+    ("match_details_", True, None, Cb.MATCH_DETAILS, 2),
+    ("leaderboard", False, None, Cb.LEADERBOARD, 0),
+    ("weekly_leaderboard", False, None, Cb.WEEKLY_LEADERBOARD, 0),
+    ("resetteam", False, None, Cb.RESETTEAM, 0),
+    ("select_position_", True, PickTeamStates.choosing_position, Cb.SELECT_POSITION, 1),
+    ("player_select_", True, PickTeamStates.choosing_player, Cb.PLAYER_SELECT, 1),
+    ("remove_player", False, PickTeamStates.choosing_position, Cb.REMOVE_PLAYER, 0),
+    ("player_remove_", True, PickTeamStates.removing_player, Cb.PLAYER_REMOVE, 1),
+    ("cancel_remove_player", False, PickTeamStates.removing_player, Cb.CANCEL_REMOVE_PLAYER, 0),
+    ("confirm_team", False, PickTeamStates.choosing_position, Cb.CONFIRM_TEAM, 0),
+    ("admin_back_to_main_menu", False, AdminStates, Cb.ADMIN_MENU, 0),
+    ("admin_manage_players", False, AdminStates.admin_menu, Cb.ADMIN_MANAGE_PLAYERS, 0),
+    ("admin_view_players", False, AdminStates.managing_players, Cb.ADMIN_VIEW_PLAYERS, 0),
+    ("admin_remove_all_players", False, AdminStates.managing_players, Cb.ADMIN_REMOVE_ALL_PLAYERS, 0),
+    ("confirm_delete_all_players_yes", False, AdminStates.confirming_delete_all_players,
+     Cb.ADMIN_REMOVE_ALL_PLAYERS_CONFIRM, 0),
+    ("admin_add_player", False, AdminStates.managing_players, Cb.ADMIN_ADD_PLAYER, 0),
+    ("admin_select_position_", True, AdminStates.adding_player_position, Cb.ADMIN_ADD_PLAYER_POSITION, 1),
+    ("admin_edit_player", False, AdminStates.managing_players, Cb.ADMIN_EDIT_PLAYER, 0),
+    ("admin_selected_player_edit_", True, AdminStates.selecting_player_to_edit, Cb.ADMIN_EDIT_PLAYER_SELECTED, 1),
+    ("admin_edited_position_", True, AdminStates.editing_player_position, Cb.ADMIN_EDIT_PLAYER_POSITION, 1),
+    ("admin_delete_player", False, AdminStates.managing_players, Cb.ADMIN_DELETE_PLAYER, 0),
+    ("admin_selected_player_delete_", True, AdminStates.selecting_player_to_delete,
+     Cb.ADMIN_DELETE_PLAYER_SELECTED, 1),
+    ("confirm_delete_player_", True, AdminStates.confirming_player_delete, Cb.ADMIN_DELETE_PLAYER_CONFIRM, 1),
+    ("admin_manage_matches", False, AdminStates.admin_menu, Cb.ADMIN_MANAGE_MATCHES, 0),
+    ("admin_add_match", False, AdminStates.managing_matches, Cb.ADMIN_ADD_MATCH, 0),
+    ("admin_edit_matches", False, AdminStates.managing_matches, Cb.ADMIN_EDIT_MATCHES, 0),
+    ("admin_selected_match_edit_", True, AdminStates.selecting_match_to_edit, Cb.ADMIN_EDIT_MATCH_SELECTED, 1),
+    ("admin_score_matches", False, AdminStates.admin_menu, Cb.ADMIN_SCORE_MATCHES, 0),
+    ("admin_score_match_", True, AdminStates.selecting_match_to_score, Cb.ADMIN_SCORE_MATCH_SELECTED, 1),
+    ("admin_send_notification_yes", False, AdminStates.confirming_notification_send,
+     Cb.ADMIN_SEND_NOTIFICATION, 0),
+    ("admin_send_notification_no", False, AdminStates.confirming_notification_send,
+     Cb.ADMIN_SKIP_NOTIFICATION, 0),
+    ("admin_change_password", False, AdminStates.admin_menu, Cb.ADMIN_CHANGE_PASSWORD, 0),
+    ("admin_exit", False, AdminStates.admin_menu, Cb.ADMIN_EXIT, 0),
+    ("admin_cancel_admin_flow", False, AdminStates, Cb.ADMIN_CANCEL, 0),
+    ("notifications", False, None, Cb.NOTIFICATIONS, 0),
+    ("notifications_toggle_", True, None, Cb.NOTIFICATIONS_TOGGLE, 1),
+]
+
+
+async def legacy_handler(callback: CallbackQuery):
+    # старые хэндлеры заново разбирали callback.data
+    return callback.data.split("_")
+
+
+async def new_handler(callback: CallbackQuery, **kwargs):
+    return kwargs
+
+
+def build_legacy_router() -> Router:
+    router = Router()
+    for old_data, is_prefix, state, _, _ in ROUTES:
+        data_filter = F.data.startswith(old_data) if is_prefix else F.data == old_data
+        if state is None:
+            router.callback_query.register(legacy_handler, data_filter)
+        else:
+            router.callback_query.register(legacy_handler, data_filter, StateFilter(state))
+    return router
+
+
+def build_prefix_router() -> Router:
+    router = Router()
+    dispatcher = CallbackDispatcher()
+    for _, _, state, prefix, arg_count in ROUTES:
+        states = (state,) if state is not None else ()
+        fields = tuple(f"arg{i}" for i in range(arg_count))
+        dispatcher.register(prefix, *states, fields=fields)(new_handler)
+    dispatcher.attach(router)
+    return router
+
+
+def raw_state_of(state) -> str:
+    if state is None:
+        return None
+    if isinstance(state, type):
+        return state.__all_states_names__[0]
+    return state.state
+
+
+def make_callback(data: str) -> CallbackQuery:
+    user = User(id=1, is_bot=False, first_name="bench")
+    message = Message(message_id=1, date=0, chat=Chat(id=1, type="private"))
+    return CallbackQuery(id="1", from_user=user, chat_instance="1", data=data, message=message)
+
+
+def build_workload(rng: random.Random):
+    legacy, new = [], []
+    for _ in range(ITERATIONS):
+        old_data, is_prefix, state, prefix, arg_count = rng.choice(ROUTES)
+        args = [rng.randint(1, 500) for _ in range(arg_count)]
+        old = old_data + "_".join(map(str, args)) if is_prefix else old_data
+        legacy.append((make_callback(old), raw_state_of(state)))
+        new.append((make_callback(pack(prefix, *args)), raw_state_of(state)))
+    return legacy, new
+
+
+async def run(router: Router, workload) -> float:
+    observer = router.callback_query
+    started = time.perf_counter()
+    for callback, raw_state in workload:
+        await observer.trigger(callback, raw_state=raw_state)
+    return time.perf_counter() - started
+
+
+async def main():
+    legacy_workload, new_workload = build_workload(random.Random(42))
+    legacy_time = await run(build_legacy_router(), legacy_workload)
+    prefix_time = await run(build_prefix_router(), new_workload)
+
+    print(f"Маршрутов: {len(ROUTES)}, callback-запросов: {ITERATIONS}")
+    print(f"F.data + StateFilter (линейно): {legacy_time / ITERATIONS * 1e6:8.2f} мкс/запрос")
+    print(f"CallbackDispatcher (префиксы):  {prefix_time / ITERATIONS * 1e6:8.2f} мкс/запрос")
+    print(f"Ускорение: x{legacy_time / prefix_time:.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
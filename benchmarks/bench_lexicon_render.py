@@ -0,0 +1,84 @@
+"""
+Сравнение стоимости рендера строк лексикона: str.format на каждом вызове
+(как было раньше) против шаблонов, заранее скомпилированных Lexicon.
+
+Запуск из корня проекта:
+    ADMIN_ID=0 python -m benchmarks.bench_lexicon_render
+"""
+import random
+import time
+
+from lexicon import LEXICON, LEXICON_RU
+
+ITERATIONS = 200000
+# Берется лучший из нескольких прогонов: на общей машине разброс между прогонами больше разницы
+REPEATS = 5
+
+# (ключ, позиционные аргументы, именованные аргументы) — строки из горячих хэндлеров
+CASES = [
+    ("leaderboard_entry", (7,), {"username": "user_42", "score": 123.5}),
+    ("match_player_score_entry", (3,), {"player_name": "Mohamed Salah (🇪🇬)", "points": 12.0, "emoji": "🌟"}),
+    ("picked_players_count", (4,), {}),
+    ("match_entry", (), {"date": "21.12", "opponent": "Arsenal"}),
+]
+
+
+def build_workload(rng: random.Random):
+    return [rng.choice(CASES) for _ in range(ITERATIONS)]
+
+
+def run_str_format(workload) -> float:
+    started = time.perf_counter()
+    for key, args, kwargs in workload:
+        LEXICON_RU[key].format(*args, **kwargs)
+    return time.perf_counter() - started
+
+
+def run_render(workload) -> float:
+    render = LEXICON.render
+    started = time.perf_counter()
+    for key, args, kwargs in workload:
+        render(key, *args, **kwargs)
+    return time.perf_counter() - started
+
+
+def run_templates(workload) -> float:
+    # Одиночный рендер в хэндлере: поиск шаблона по ключу на каждом вызове
+    templates = LEXICON.templates
+    started = time.perf_counter()
+    for key, args, kwargs in workload:
+        templates[key](*args, **kwargs)
+    return time.perf_counter() - started
+
+
+def run_template(workload) -> float:
+    # Как в хэндлерах: шаблон берется один раз, дальше вызывается в цикле
+    templates = {key: LEXICON.template(key) for key, _, _ in CASES}
+    workload = [(templates[key], args, kwargs) for key, args, kwargs in workload]
+    started = time.perf_counter()
+    for template, args, kwargs in workload:
+        template(*args, **kwargs)
+    return time.perf_counter() - started
+
+
+def main():
+    workload = build_workload(random.Random(42))
+    for key, args, kwargs in CASES:
+        assert LEXICON.render(key, *args, **kwargs) == LEXICON_RU[key].format(*args, **kwargs), key
+
+    format_time = min(run_str_format(workload) for _ in range(REPEATS))
+    render_time = min(run_render(workload) for _ in range(REPEATS))
+    templates_time = min(run_templates(workload) for _ in range(REPEATS))
+    template_time = min(run_template(workload) for _ in range(REPEATS))
+
+    print(f"Шаблонов: {len(CASES)}, рендеров: {ITERATIONS}")
+    print(f"str.format:        {format_time / ITERATIONS * 1e9:8.1f} нс/рендер")
+    print(f"Lexicon.render:    {render_time / ITERATIONS * 1e9:8.1f} нс/рендер")
+    print(f"templates[key]:    {templates_time / ITERATIONS * 1e9:8.1f} нс/рендер "
+          f"(x{format_time / templates_time:.2f} к str.format)")
+    print(f"Lexicon.template:  {template_time / ITERATIONS * 1e9:8.1f} нс/рендер "
+          f"(x{format_time / template_time:.2f} к str.format)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Пропускная способность обработки апдейтов в профилях выполнения standard
+(asyncio + json) и fast (uvloop + orjson, см. utils/runtime.py) на одном и
+том же трафике.
+
+Каждый ответ getUpdates проходит путь, как при polling: разбор ответа
+сессией, диспетчер aiogram, хэндлер собирает клавиатуру и сериализует
+параметры ответа (как перед отправкой в Bot API). Сетевых запросов нет.
+
+Запуск из корня проекта:
+    ADMIN_ID=0 python -m benchmarks.bench_runtime_profile [записанный_трафик.jsonl]
+
+Файл трафика — тела ответов getUpdates, по одному JSON на строку. Без файла
+используется синтетическая запись с фиксированным seed.
+"""
+import json
+import random
+import sys
+import time
+from typing import List
+
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods import GetUpdates
+from aiogram.types import CallbackQuery, Message
+
+from keyboards.callback_data import Cb, pack
+from keyboards.flow_kb import leaderboard_keyboard, pickteam_positions_keyboard
+from lexicon import LEXICON
+from utils.runtime import get_runtime_profile
+
+BATCHES = 100
+BATCH_SIZE = 100
+REPEATS = 3
+TOKEN = "123456:benchmark-token"
+
+
+def record_traffic(rng: random.Random) -> List[str]:
+    """Синтетическая запись: команды, текст и нажатия кнопок от 5000 пользователей."""
+    bodies = []
+    update_id = 1
+    callbacks = [pack(Cb.PICKTEAM), pack(Cb.LEADERBOARD), pack(Cb.MATCH_RESULTS, 2),
+                 pack(Cb.SELECT_POSITION, 1), pack(Cb.PLAYER_SELECT, 17)]
+    for _ in range(BATCHES):
+        result = []
+        for _ in range(BATCH_SIZE):
+            user_id = rng.randint(1, 5000)
+            user = {"id": user_id, "is_bot": False, "first_name": f"Fan {user_id}",
+                    "username": f"fan_{user_id}", "language_code": rng.choice(["ru", "en"])}
+            chat = {"id": user_id, "type": "private", "first_name": f"Fan {user_id}"}
+            message = {"message_id": update_id, "date": 1760000000 + update_id, "chat": chat, "from": user}
+            if rng.random() < 0.6:
+                update = {"update_id": update_id, "callback_query": {
+                    "id": str(update_id), "from": user, "chat_instance": str(user_id),
+                    "data": rng.choice(callbacks),
+                    "message": {**message, "from": {"id": 1, "is_bot": True, "first_name": "Bot"},
+                                "text": LEXICON["pickteam_intro"]}}}
+            else:
+                text = rng.choice(["/start", "/pickteam", "/leaderboard", "Mohamed Salah"])
+                update = {"update_id": update_id, "message": {**message, "text": text}}
+            result.append(update)
+            update_id += 1
+        bodies.append(json.dumps({"ok": True, "result": result}, ensure_ascii=False))
+    return bodies
+
+
+def create_dispatcher(bot: Bot) -> Dispatcher:
+    router = Router()
+
+    def reply_payload(chat_id: int, text: str, markup) -> None:
+        # Та же сериализация, что перед отправкой SendMessage/EditMessageText
+        bot.session.prepare_value({"chat_id": chat_id, "text": text, "reply_markup": markup}, bot=bot, files={})
+
+    @router.message(F.text.startswith("/"))
+    async def command(message: Message):
+        reply_payload(message.chat.id, LEXICON["pickteam_intro"], pickteam_positions_keyboard(3, LEXICON))
+
+    @router.message()
+    async def text(message: Message):
+        reply_payload(message.chat.id, LEXICON["error_general"], None)
+
+    @router.callback_query()
+    async def callback(callback: CallbackQuery):
+        reply_payload(callback.from_user.id, LEXICON["leaderboard_header"],
+                      leaderboard_keyboard(callback.from_user.id, callback.from_user.id + 10, True, True, LEXICON))
+
+    dp = Dispatcher()
+    dp.include_router(router)
+    return dp
+
+
+async def replay(profile, bodies: List[str]) -> float:
+    bot = Bot(TOKEN, session=AiohttpSession(**profile.session_kwargs()))
+    dp = create_dispatcher(bot)
+    method = GetUpdates()
+    started = time.perf_counter()
+    for body in bodies:
+        response = bot.session.check_response(bot, method, 200, body)
+        for update in response.result:
+            await dp.feed_update(bot, update)
+    elapsed = time.perf_counter() - started
+    await bot.session.close()
+    return elapsed
+
+
+def load_traffic(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        return [line for line in f if line.strip()]
+
+
+def main():
+    bodies = load_traffic(sys.argv[1]) if len(sys.argv) > 1 else record_traffic(random.Random(42))
+    updates = sum(len(json.loads(body)["result"]) for body in bodies)
+    print(f"Ответов getUpdates: {len(bodies)}, апдейтов: {updates}")
+
+    results = {}
+    for name in ("standard", "fast"):
+        profile = get_runtime_profile(name)
+        # лучший из нескольких прогонов, первый заодно прогревает кэши aiogram
+        results[name] = min(profile.run(replay(profile, bodies)) for _ in range(REPEATS))
+        print(f"{name:<9} ({profile.loop_name} + {profile.json_name}): "
+              f"{updates / results[name]:9.0f} апдейтов/с, {results[name] / updates * 1e6:6.1f} мкс/апдейт")
+    print(f"fast / standard: x{results['standard'] / results['fast']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
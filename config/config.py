@@ -14,6 +14,33 @@ class Config:
     DB_NAME = os.getenv("DB_NAME")
     DB_USER = os.getenv("DB_USER")
     DB_PASS = os.getenv("DB_PASS")
+    # Размер пула соединений; при WORKERS > 1 максимум делится между процессами
+    DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "5"))
+    DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+    # Соединения пула, которые держатся для критичных записей (сохранение
+    # состава, сброс, регистрация); остальные запросы делят оставшиеся
+    DB_POOL_RESERVED_CRITICAL = int(os.getenv("DB_POOL_RESERVED_CRITICAL", "2"))
+    # Сколько секунд некритичный запрос пользователя ждет соединение пула,
+    # прежде чем получить экран из кэша или ответ "бот перегружен"
+    DB_READ_ACQUIRE_TIMEOUT = float(os.getenv("DB_READ_ACQUIRE_TIMEOUT", "2"))
+    # Канал LISTEN/NOTIFY, через который процессы сообщают друг другу об изменении
+    # данных (см. services/cache_invalidation.py), и пауза (сек) перед переподключением слушателя
+    CACHE_NOTIFY_CHANNEL = os.getenv("CACHE_NOTIFY_CHANNEL", "lf_bot_cache")
+    CACHE_LISTENER_RECONNECT = float(os.getenv("CACHE_LISTENER_RECONNECT", "5"))
+
+    # Профиль выполнения (см. utils/runtime.py): "standard" — asyncio и json,
+    # "fast" — uvloop и orjson, если они установлены
+    RUNTIME_PROFILE = os.getenv("RUNTIME_PROFILE", "standard")
+
+    # Число процессов-воркеров (см. services/sharding.py); 1 — обычный polling в одном процессе
+    WORKERS = int(os.getenv("WORKERS", "1"))
+    # Как часто (сек) воркеры присылают метрики в приемник
+    WORKER_METRICS_INTERVAL = float(os.getenv("WORKER_METRICS_INTERVAL", "60"))
+    # Таймаут long polling приемника (сек)
+    POLLING_TIMEOUT = int(os.getenv("POLLING_TIMEOUT", "30"))
+
+    # Язык интерфейса для пользователей, чей язык не поддерживается (см. lexicon/templates.py)
+    DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "ru")
 
     POSITIONS = {
         "goalkeeper": "Вратари 🧤",
@@ -22,4 +49,72 @@ class Config:
         "forward": "Нападающие 🎯"
     }
 
-    MATCHES_PER_PAGE = 5
\ No newline at end of file
+    MATCHES_PER_PAGE = 5
+    LEADERBOARD_PAGE_SIZE = 10
+    # История сезона пользователя: матчей на странице и сколько страниц держать в кэше
+    SEASON_HISTORY_PAGE_SIZE = int(os.getenv("SEASON_HISTORY_PAGE_SIZE", "10"))
+    SEASON_HISTORY_CACHE_SIZE = int(os.getenv("SEASON_HISTORY_CACHE_SIZE", "5000"))
+    # Приблизительное место по гистограмме очков: ширина корзины (в очках),
+    # допустимая погрешность (доля от числа пользователей) и сколько первых мест
+    # всегда считать точно
+    RANK_HISTOGRAM_BUCKET_WIDTH = float(os.getenv("RANK_HISTOGRAM_BUCKET_WIDTH", "1"))
+    RANK_MAX_ERROR = float(os.getenv("RANK_MAX_ERROR", "0.01"))
+    RANK_EXACT_TOP = 100
+    # Постраничные списки админки: элементов на странице и сколько секунд
+    # кэш страницы живет без изменения данных
+    ADMIN_LIST_PAGE_SIZE = int(os.getenv("ADMIN_LIST_PAGE_SIZE", "10"))
+    ADMIN_LIST_CACHE_TTL = float(os.getenv("ADMIN_LIST_CACHE_TTL", "60"))
+    # Сколько секунд доли выбравших игрока (match_pick_counts) живут в памяти; свои
+    # сохранения составов обновляют кэш сразу, чужие процессы — не позже этого срока
+    PICK_COUNTS_CACHE_TTL = float(os.getenv("PICK_COUNTS_CACHE_TTL", "30"))
+    # Сколько последних закрытых сезонов оставлять подключенными партициями (см. Database.close_season)
+    SEASONS_KEEP_ATTACHED = int(os.getenv("SEASONS_KEEP_ATTACHED", "1"))
+    # Сколько последних оцененных матчей показывать при исправлении очков
+    CORRECTABLE_MATCHES_LIMIT = 10
+    # Максимальный размер CSV-файла с очками за матч
+    POINTS_FILE_MAX_BYTES = 64 * 1024
+
+    # За сколько минут до начала матча закрывается редактирование состава
+    TEAM_DEADLINE_MINUTES = 30
+    # Как часто (сек) планировщик заморозки составов перепроверяет ближайший дедлайн
+    DEADLINE_LOCK_RECHECK = float(os.getenv("DEADLINE_LOCK_RECHECK", "60"))
+
+    # Отложенная запись последних выбранных составов: интервал сброса (сек) и размер пачки
+    LAST_TEAM_FLUSH_INTERVAL = float(os.getenv("LAST_TEAM_FLUSH_INTERVAL", "0.3"))
+    LAST_TEAM_FLUSH_BATCH = int(os.getenv("LAST_TEAM_FLUSH_BATCH", "500"))
+    # После неудачной записи пауза удваивается до LAST_TEAM_RETRY_MAX_DELAY (сек);
+    # состав, не записанный LAST_TEAM_FLUSH_RETRIES раз подряд, отбрасывается
+    LAST_TEAM_FLUSH_RETRIES = int(os.getenv("LAST_TEAM_FLUSH_RETRIES", "8"))
+    LAST_TEAM_RETRY_MAX_DELAY = float(os.getenv("LAST_TEAM_RETRY_MAX_DELAY", "30"))
+
+    # Пакетное обновление изменившихся username: не чаще раза в N секунд или при накоплении пачки
+    USERNAME_FLUSH_INTERVAL = float(os.getenv("USERNAME_FLUSH_INTERVAL", "5"))
+    USERNAME_FLUSH_BATCH = int(os.getenv("USERNAME_FLUSH_BATCH", "100"))
+    # Сколько пользователей держать в кэше идентичности (telegram_id -> id, username)
+    IDENTITY_CACHE_SIZE = int(os.getenv("IDENTITY_CACHE_SIZE", "50000"))
+
+    # Планировщик исходящих запросов к Bot API
+    OUTBOUND_GLOBAL_RATE = float(os.getenv("OUTBOUND_GLOBAL_RATE", "25"))  # запросов в секунду на весь бот
+    OUTBOUND_GLOBAL_BURST = float(os.getenv("OUTBOUND_GLOBAL_BURST", "30"))
+    OUTBOUND_CHAT_INTERVAL = float(os.getenv("OUTBOUND_CHAT_INTERVAL", "1.0"))  # секунд между сообщениями в чат
+    OUTBOUND_CHAT_BURST = float(os.getenv("OUTBOUND_CHAT_BURST", "3"))
+    OUTBOUND_MAX_RETRIES = int(os.getenv("OUTBOUND_MAX_RETRIES", "2"))  # повторов после RetryAfter
+
+    # Ограничение частоты запросов одного пользователя: токенов в секунду и
+    # запас; стоимость тяжелых команд задается флагом throttle_cost хэндлера
+    THROTTLE_RATE = float(os.getenv("THROTTLE_RATE", "1"))
+    THROTTLE_BURST = float(os.getenv("THROTTLE_BURST", "5"))
+    THROTTLE_MAX_USERS = 10000
+    THROTTLE_REPORT_INTERVAL = float(os.getenv("THROTTLE_REPORT_INTERVAL", "60"))
+
+    # Сброс нагрузки: процесс считается перегруженным, если апдейтов в работе
+    # не меньше SHED_MAX_IN_FLIGHT, соединение пула ждут SHED_POOL_WAITERS
+    # корутин или среднее ожидание соединения дольше SHED_POOL_WAIT секунд
+    SHED_MAX_IN_FLIGHT = int(os.getenv("SHED_MAX_IN_FLIGHT", "200"))
+    SHED_POOL_WAITERS = int(os.getenv("SHED_POOL_WAITERS", "20"))
+    SHED_POOL_WAIT = float(os.getenv("SHED_POOL_WAIT", "0.5"))
+    SHED_SCREEN_CACHE_SIZE = 5000
+
+    # Пул соединений aiohttp к Bot API
+    BOT_SESSION_LIMIT = int(os.getenv("BOT_SESSION_LIMIT", "100"))
+    BOT_SESSION_KEEPALIVE = float(os.getenv("BOT_SESSION_KEEPALIVE", "60"))
\ No newline at end of file
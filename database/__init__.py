@@ -1,3 +1,6 @@
-from .connection import create_db_pool
+from .connection import create_db_connection, create_db_pool
 from .db import Database
 from .models import create_tables, insert_initial_data
+from .write_behind import LastSelectedTeamBuffer
+from .score_histogram import ScoreHistogram, RankEstimate
+from .pool import InstrumentedPool, PoolBusyError, db_access
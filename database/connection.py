@@ -1,7 +1,7 @@
 import asyncpg
 from config import Config
 
-async def create_db_pool():
+async def create_db_pool(min_size: int = Config.DB_POOL_MIN_SIZE, max_size: int = Config.DB_POOL_MAX_SIZE):
     """Создание пула подключений к бд."""
     try:
         pool = await asyncpg.create_pool(
@@ -10,8 +10,8 @@ async def create_db_pool():
             database=Config.DB_NAME,
             user=Config.DB_USER,
             password=Config.DB_PASS,
-            min_size=5,
-            max_size=10
+            min_size=min(min_size, max_size),
+            max_size=max_size
         )
         print("Подключение к базе данных успешно установлено.")
         return pool
@@ -20,3 +20,12 @@ async def create_db_pool():
         return None
 
 
+async def create_db_connection() -> asyncpg.Connection:
+    """Отдельное подключение вне пула (для LISTEN); ошибки подключения пробрасываются."""
+    return await asyncpg.connect(
+        host=Config.DB_HOST,
+        port=Config.DB_PORT,
+        database=Config.DB_NAME,
+        user=Config.DB_USER,
+        password=Config.DB_PASS
+    )
@@ -1,33 +1,203 @@
+import asyncio
 import asyncpg
 import datetime
-from typing import List, Dict, Optional, Any
+import time
+import uuid
+from typing import AsyncIterable, AsyncIterator, List, Dict, Optional, Any, Tuple
 from config import Config
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from utils.file_stream import csv_rows
 from utils.timezone import naive_now
+from .models import PARTITIONED_TABLES
+from .score_histogram import ScoreHistogram
 
 
 class Database:
+    # Выгрузки для экспорта: имя файла -> запрос для COPY ... TO STDOUT
+    EXPORT_QUERIES = {
+        "users": "SELECT id, telegram_id, username, total_score, registration_date, receive_notifications "
+                 "FROM users ORDER BY id",
+        "user_teams": "SELECT user_id, match_id, player_ids, created_at, updated_at "
+                      "FROM user_teams ORDER BY user_id, match_id",
+        "user_match_scores": "SELECT user_id, match_id, score FROM user_match_scores ORDER BY user_id, match_id",
+    }
+    # Для скольких матчей держать в памяти счетчики выбравших игроков
+    PICK_COUNTS_CACHED_MATCHES = 16
+
     def __init__(self, pool: asyncpg.Pool):
         self.pool = pool
+        # Буфер отложенной записи last_selected_team_ids, подключается в main.py
+        self.last_team_buffer = None
+        # Слушатель уведомлений об изменениях из других процессов, подключается в main.py
+        self.cache_listener = None
+        # Кэш идентичности: telegram_id -> {"id", "telegram_id", "username"},
+        # LRU не больше Config.IDENTITY_CACHE_SIZE пользователей
+        self._identity_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        # Изменившиеся username, которые запишем одной пачкой: telegram_id -> username
+        self._pending_usernames: Dict[int, str] = {}
+        self._usernames_flushed_at = time.monotonic()
+        # Гистограмма total_score для приблизительного места в рейтинге
+        self.score_histogram = ScoreHistogram()
+        # Версии данных для кэшей админских списков (keyboards/paged_list.py):
+        # "players" и "matches" растут при каждом изменении таблицы
+        self.data_versions: Dict[str, int] = defaultdict(int)
+        # Сколько составов выбрали игрока: match_id -> (время загрузки, {player_id: pick_count});
+        # ключ 0 — число составов на матч (см. match_pick_counts)
+        self._pick_counts: Dict[int, Tuple[float, Dict[int, int]]] = {}
+        # Страницы истории сезона: (user_id, cursor, forward) -> (версия "scores", страница)
+        self._season_history: "OrderedDict[Tuple[int, Optional[int], bool], Tuple[int, Dict[str, Any]]]" = \
+            OrderedDict()
+        # Метка процесса в уведомлениях об изменениях, чтобы слушатель пропускал свои же
+        self.instance_id = uuid.uuid4().hex[:12]
+
+    def bump_data_version(self, source: str) -> None:
+        self.data_versions[source] += 1
+
+    async def publish_change(self, conn: asyncpg.Connection, *sources: str) -> None:
+        """
+        Отмечает изменение данных: поднимает версии в этом процессе и через
+        NOTIFY сообщает остальным (services/cache_invalidation.py). Внутри
+        транзакции уведомление уйдет только после COMMIT.
+        """
+        for source in sources:
+            self.bump_data_version(source)
+        try:
+            await conn.execute(
+                "SELECT pg_notify($1, source || ':' || $3) FROM unnest($2::text[]) AS source",
+                Config.CACHE_NOTIFY_CHANNEL, list(sources), self.instance_id
+            )
+        except Exception as e:
+            # Сами данные уже записаны; остальные процессы догонят при переподключении слушателя
+            print(f"Ошибка при отправке уведомления об изменении {sources}: {e}")
+
+    @staticmethod
+    def _affected_rows(status: str) -> int:
+        """Число строк из статуса conn.execute ("INSERT 0 1", "UPDATE 3", "DELETE 0")."""
+        return int(status.split()[-1])
+
+    def _with_pending_team(self, row: Dict[str, Any], user_id: int) -> Dict[str, Any]:
+        """Подставляет last_selected_team_ids из буфера отложенной записи, если он еще не в базе."""
+        if self.last_team_buffer is not None:
+            pending = self.last_team_buffer.get_pending(user_id)
+            if pending is not None:
+                row['last_selected_team_ids'] = pending
+        return row
+
+    def _remember_identity(self, user: Dict[str, Any]) -> None:
+        self._identity_cache[user['telegram_id']] = {
+            'id': user['id'], 'telegram_id': user['telegram_id'], 'username': user['username']
+        }
+        self._identity_cache.move_to_end(user['telegram_id'])
+        if len(self._identity_cache) > Config.IDENTITY_CACHE_SIZE:
+            self._identity_cache.popitem(last=False)
+
+    def _cached_identity(self, telegram_id: int) -> Optional[Dict[str, Any]]:
+        cached = self._identity_cache.get(telegram_id)
+        if cached:
+            self._identity_cache.move_to_end(telegram_id)
+        return cached
 
     async def get_user(self, telegram_id: int) -> Optional[Dict[str, Any]]:
         async with self.pool.acquire() as conn:
             user = await conn.fetchrow("SELECT *, last_selected_team_ids, receive_notifications FROM users WHERE telegram_id = $1", telegram_id)
-            return dict(user) if user else None
+        if not user:
+            return None
+        user = self._with_pending_team(dict(user), user['id'])
+        self._remember_identity(user)
+        return user
+
+    async def get_user_id(self, telegram_id: int) -> Optional[int]:
+        cached = self._cached_identity(telegram_id)
+        if cached:
+            return cached['id']
+        async with self.pool.acquire() as conn:
+            user = await conn.fetchrow("SELECT id, telegram_id, username FROM users WHERE telegram_id = $1", telegram_id)
+        if not user:
+            return None
+        self._remember_identity(dict(user))
+        return user['id']
 
     async def register_user(self, telegram_id: int, username: str) -> Optional[Dict[str, Any]]:
+        cached = self._cached_identity(telegram_id)
+        if cached and cached['username'] == username:
+            # Пользователь уже известен и ничего не поменялось — запись не нужна
+            return dict(cached)
         async with self.pool.acquire() as conn:
             try:
+                # Строка переписывается только при реальном изменении username,
+                # иначе возвращается текущая строка без создания мертвого кортежа
                 user = await conn.fetchrow(
-                    "INSERT INTO users (telegram_id, username, last_selected_team_ids, receive_notifications) VALUES ($1, $2, ARRAY[]::INTEGER[], TRUE) "
-                    "ON CONFLICT (telegram_id) DO UPDATE SET username = $2 RETURNING *",
+                    """
+                    WITH upsert AS (
+                        INSERT INTO users (telegram_id, username, last_selected_team_ids, receive_notifications)
+                        VALUES ($1, $2, ARRAY[]::INTEGER[], TRUE)
+                        ON CONFLICT (telegram_id) DO UPDATE SET username = EXCLUDED.username
+                        WHERE users.username IS DISTINCT FROM EXCLUDED.username
+                        RETURNING *, (xmax = 0) AS inserted
+                    )
+                    SELECT * FROM upsert
+                    UNION ALL
+                    SELECT *, FALSE FROM users WHERE telegram_id = $1 AND NOT EXISTS (SELECT 1 FROM upsert)
+                    """,
                     telegram_id, username
                 )
-                return dict(user)
+                if user is None:
+                    # Строку только что вставил параллельный запрос, и она не попала в снимок
+                    # этого запроса: ни upsert, ни SELECT ее не вернули — читаем заново
+                    user = await conn.fetchrow("SELECT *, FALSE AS inserted FROM users WHERE telegram_id = $1",
+                                               telegram_id)
+                    if user is None:
+                        print(f"Пользователь {telegram_id} не найден после регистрации")
+                        return None
+                user = dict(user)
+                if user.pop('inserted'):
+                    self.score_histogram.add(user['total_score'])
+                self._remember_identity(user)
+                self._pending_usernames.pop(telegram_id, None)
+                return self._with_pending_team(user, user['id'])
             except Exception as e:
                 print(f"Ошибка при регистрации/обновлении пользователя: {e}")
                 return None
 
+    def note_username(self, telegram_id: int, username: str) -> None:
+        """
+        Запоминает username из входящего апдейта. Если он отличается от
+        известного, обновление попадет в ближайшую пакетную запись.
+        """
+        cached = self._cached_identity(telegram_id)
+        if cached and cached['username'] != username:
+            self._pending_usernames[telegram_id] = username
+
+    def usernames_flush_due(self) -> bool:
+        if not self._pending_usernames:
+            return False
+        return (len(self._pending_usernames) >= Config.USERNAME_FLUSH_BATCH
+                or time.monotonic() - self._usernames_flushed_at >= Config.USERNAME_FLUSH_INTERVAL)
+
+    async def flush_usernames(self) -> None:
+        if not self._pending_usernames:
+            return
+        batch, self._pending_usernames = self._pending_usernames, {}
+        self._usernames_flushed_at = time.monotonic()
+        telegram_ids = list(batch)
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE users AS u SET username = v.username
+                    FROM unnest($1::bigint[], $2::text[]) AS v(telegram_id, username)
+                    WHERE u.telegram_id = v.telegram_id AND u.username IS DISTINCT FROM v.username
+                    """,
+                    telegram_ids, [batch[t] for t in telegram_ids]
+                )
+        except Exception as e:
+            print(f"Ошибка при пакетном обновлении username: {e}")
+            return
+        for telegram_id, username in batch.items():
+            cached = self._identity_cache.get(telegram_id)
+            if cached:
+                cached['username'] = username
+
     async def get_next_match(self) -> Optional[Dict[str, Any]]:
         async with self.pool.acquire() as conn:
             current_time = naive_now()
@@ -60,6 +230,44 @@ class Database:
             players = await conn.fetch("SELECT * FROM players WHERE position = $1 ORDER BY order_index ASC", position)
             return [dict(p) for p in players]
 
+    async def get_pickteam_context(self, telegram_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Одним запросом возвращает всё, что нужно экранам выбора состава:
+        пользователя, ближайший матч, дедлайн (считается на стороне БД),
+        текущий состав на матч и последний выбранный состав.
+        Возвращает None, если пользователь не зарегистрирован.
+        """
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                WITH u AS (
+                    SELECT id, last_selected_team_ids FROM users WHERE telegram_id = $1
+                ),
+                m AS (
+                    SELECT id, match_datetime, lineups_locked,
+                           match_datetime - make_interval(mins => $3) AS deadline
+                    FROM matches
+                    WHERE match_datetime > $2 AND status = 'upcoming'
+                    ORDER BY match_datetime ASC
+                    LIMIT 1
+                )
+                SELECT u.id AS user_id,
+                       u.last_selected_team_ids,
+                       m.id AS match_id,
+                       m.match_datetime,
+                       m.deadline,
+                       m.deadline < $2 OR m.lineups_locked AS deadline_passed,
+                       ut.player_ids
+                FROM u
+                LEFT JOIN m ON TRUE
+                LEFT JOIN user_teams ut ON ut.user_id = u.id AND ut.match_id = m.id
+                """,
+                telegram_id, naive_now(), Config.TEAM_DEADLINE_MINUTES
+            )
+        if not row:
+            return None
+        return self._with_pending_team(dict(row), row['user_id'])
+
     async def get_user_team(self, user_id: int, match_id: int) -> Optional[Dict[str, Any]]:
         async with self.pool.acquire() as conn:
             team = await conn.fetchrow(
@@ -68,23 +276,124 @@ class Database:
             )
             return dict(team) if team else None
 
-    async def save_user_team(self, user_id: int, match_id: int, player_ids: List[int]) -> None:
+    async def save_user_team(self, user_id: int, match_id: int, player_ids: List[int]) -> bool:
+        """
+        Сохраняет состав. Возвращает False, если составы на матч уже заморожены
+        (дедлайн прошел). FOR SHARE на строке матча не дает записи проскочить
+        между проверкой и снимком составов в lock_match_lineups.
+        """
         async with self.pool.acquire() as conn:
             current_time = naive_now()
-            await conn.execute(
-                "INSERT INTO user_teams (user_id, match_id, player_ids) VALUES ($1, $2, $3) "
-                "ON CONFLICT (user_id, match_id) DO UPDATE SET player_ids = $3, updated_at = $4",
-                user_id, match_id, player_ids, current_time
+            # Счетчики match_pick_counts меняются на разницу старого и нового состава
+            row = await conn.fetchrow(
+                """
+                WITH m AS (
+                    SELECT id FROM matches
+                    WHERE id = $2 AND NOT lineups_locked
+                      AND match_datetime - make_interval(mins => $5) > $4
+                    FOR SHARE
+                ),
+                old AS (
+                    SELECT player_ids FROM user_teams WHERE user_id = $1 AND match_id = $2 FOR UPDATE
+                ),
+                saved AS (
+                    INSERT INTO user_teams (user_id, match_id, player_ids)
+                    SELECT $1, m.id, $3 FROM m
+                    ON CONFLICT (user_id, match_id) DO UPDATE SET player_ids = $3, updated_at = $4
+                    RETURNING match_id
+                ),
+                delta AS (
+                    SELECT 0 AS player_id, 1 AS d FROM saved WHERE NOT EXISTS (SELECT 1 FROM old)
+                    UNION ALL
+                    SELECT unnest($3::int[]), 1 FROM saved
+                    UNION ALL
+                    SELECT unnest(old.player_ids), -1 FROM old, saved
+                ),
+                counted AS (
+                    INSERT INTO match_pick_counts (match_id, player_id, pick_count)
+                    SELECT $2, player_id, SUM(d) FROM delta
+                    GROUP BY player_id HAVING SUM(d) <> 0
+                    ORDER BY player_id
+                    ON CONFLICT (match_id, player_id)
+                    DO UPDATE SET pick_count = match_pick_counts.pick_count + EXCLUDED.pick_count
+                    RETURNING player_id, pick_count
+                )
+                SELECT EXISTS (SELECT 1 FROM saved) AS saved,
+                       array_agg(player_id) AS player_ids, array_agg(pick_count) AS pick_counts
+                FROM counted
+                """,
+                user_id, match_id, player_ids, current_time, Config.TEAM_DEADLINE_MINUTES
             )
+        self._update_pick_counts(match_id, row['player_ids'], row['pick_counts'])
+        return row['saved']
 
-    async def delete_user_team(self, user_id: int, match_id: int) -> None:
+    async def delete_user_team(self, user_id: int, match_id: int) -> bool:
         async with self.pool.acquire() as conn:
-            await conn.execute(
-                "DELETE FROM user_teams WHERE user_id = $1 AND match_id = $2",
+            row = await conn.fetchrow(
+                """
+                WITH m AS (
+                    SELECT id FROM matches WHERE id = $2 AND NOT lineups_locked FOR SHARE
+                ),
+                deleted AS (
+                    DELETE FROM user_teams WHERE user_id = $1 AND match_id IN (SELECT id FROM m)
+                    RETURNING player_ids
+                ),
+                counted AS (
+                    INSERT INTO match_pick_counts (match_id, player_id, pick_count)
+                    SELECT $2, d.player_id, -COUNT(*)
+                    FROM (
+                        SELECT 0 AS player_id FROM deleted
+                        UNION ALL
+                        SELECT unnest(player_ids) FROM deleted
+                    ) d
+                    GROUP BY d.player_id
+                    ORDER BY d.player_id
+                    ON CONFLICT (match_id, player_id)
+                    DO UPDATE SET pick_count = match_pick_counts.pick_count + EXCLUDED.pick_count
+                    RETURNING player_id, pick_count
+                )
+                SELECT EXISTS (SELECT 1 FROM deleted) AS deleted,
+                       array_agg(player_id) AS player_ids, array_agg(pick_count) AS pick_counts
+                FROM counted
+                """,
                 user_id, match_id
             )
+        self._update_pick_counts(match_id, row['player_ids'], row['pick_counts'])
+        return row['deleted']
+
+    def _update_pick_counts(self, match_id: int, player_ids: Optional[List[int]],
+                            pick_counts: Optional[List[int]]) -> None:
+        """Переносит в кэш счетчики, которые вернула запись состава (они уже учитывают чужие записи)."""
+        cached = self._pick_counts.get(match_id)
+        if cached is not None and player_ids:
+            cached[1].update(zip(player_ids, pick_counts))
+
+    async def get_pick_shares(self, match_id: int) -> Dict[int, float]:
+        """
+        Доля составов на матч (в процентах), в которых есть игрок: player_id -> %.
+        Счетчики берутся из match_pick_counts и держатся в памяти PICK_COUNTS_CACHE_TTL секунд.
+        """
+        cached = self._pick_counts.get(match_id)
+        if cached is None or time.monotonic() - cached[0] > Config.PICK_COUNTS_CACHE_TTL:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    "SELECT player_id, pick_count FROM match_pick_counts WHERE match_id = $1", match_id
+                )
+            # Кэш нужен ближайшему и недавним матчам, самая старая загрузка вытесняется
+            if match_id not in self._pick_counts and len(self._pick_counts) >= self.PICK_COUNTS_CACHED_MATCHES:
+                self._pick_counts.pop(min(self._pick_counts, key=lambda m: self._pick_counts[m][0]))
+            cached = (time.monotonic(), {row['player_id']: row['pick_count'] for row in rows})
+            self._pick_counts[match_id] = cached
+        counts = cached[1]
+        teams = counts.get(0, 0)
+        if teams <= 0:
+            return {}
+        return {player_id: 100 * count / teams for player_id, count in counts.items() if player_id and count > 0}
 
     async def get_last_user_team(self, user_id: int) -> Optional[Dict[str, Any]]:
+        pending = self.last_team_buffer.get_pending(user_id) if self.last_team_buffer is not None else None
+        if pending is not None:
+            return {'player_ids': pending}
         async with self.pool.acquire() as conn:
             # Теперь "last_user_team" хранится непосредственно в таблице users
             user_data = await conn.fetchrow(
@@ -102,6 +411,31 @@ class Database:
                 player_ids, user_id
             )
 
+    async def save_last_selected_teams(self, teams: Dict[int, List[int]]) -> None:
+        """Сохраняет последние составы нескольких пользователей одним UPDATE."""
+        if not teams:
+            return
+        user_ids = list(teams)
+        # Составы разной длины не ложатся в двумерный int[][], поэтому передаем
+        # их как литералы массивов и приводим к INTEGER[] на стороне БД
+        player_ids = ["{" + ",".join(str(p) for p in teams[u]) + "}" for u in user_ids]
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE users AS u SET last_selected_team_ids = v.player_ids::INTEGER[]
+                FROM unnest($1::int[], $2::text[]) AS v(user_id, player_ids)
+                WHERE u.id = v.user_id
+                """,
+                user_ids, player_ids
+            )
+
+    async def queue_last_selected_team(self, user_id: int, player_ids: List[int]) -> None:
+        """Ставит последний состав в буфер отложенной записи (или пишет сразу, если буфера нет)."""
+        if self.last_team_buffer is not None:
+            self.last_team_buffer.put(user_id, player_ids)
+        else:
+            await self.save_last_selected_team(user_id, player_ids)
+
     async def get_player_names_from_ids(self, player_ids: List[int]) -> List[str]:
         if not player_ids:
             return []
@@ -119,12 +453,167 @@ class Database:
             team_data['player_names'] = player_names
         return team_data
 
-    async def get_leaderboard(self) -> List[Dict[str, Any]]:
+    # Матчи текущего сезона; у матчей закрытых сезонов проставлен season_id (см. close_season)
+    _CURRENT_SEASON_MATCHES = "(SELECT id FROM matches WHERE season_id IS NULL)"
+    # Условие на matches: составы и очки матча еще в подключенных секциях (сезон не отсоединен)
+    _ATTACHED_MATCH = "(season_id IS NULL OR season_id IN (SELECT id FROM seasons WHERE NOT detached))"
+
+    # Позиция пользователя в порядке (total_score DESC, id): два счета по индексу idx_users_leaderboard
+    _RANK_QUERY = """
+        WITH c AS (SELECT id, total_score FROM users WHERE id = $1)
+        SELECT c.total_score,
+               1 + (SELECT COUNT(*) FROM users u WHERE u.total_score > c.total_score)
+                 + (SELECT COUNT(*) FROM users u WHERE u.total_score = c.total_score AND u.id < c.id) AS rank
+        FROM c
+    """
+
+    async def get_leaderboard_page(self, cursor_id: Optional[int] = None, forward: bool = True,
+                                   limit: int = Config.LEADERBOARD_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Страница общего рейтинга с keyset-пагинацией по (total_score DESC, id):
+        forward — строки после пользователя cursor_id, иначе — перед ним.
+        Возвращает строки с местами и признаки наличия соседних страниц.
+        """
         async with self.pool.acquire() as conn:
-            leaderboard = await conn.fetch(
-                "SELECT username, total_score FROM users ORDER BY total_score DESC LIMIT 10"
+            if cursor_id is None:
+                rows = await conn.fetch(
+                    "SELECT id, username, total_score FROM users ORDER BY total_score DESC, id LIMIT $1",
+                    limit + 1
+                )
+            elif forward:
+                rows = await conn.fetch(
+                    """
+                    WITH c AS (SELECT id, total_score FROM users WHERE id = $1)
+                    SELECT u.id, u.username, u.total_score FROM users u, c
+                    WHERE u.total_score <= c.total_score AND (u.total_score < c.total_score OR u.id > c.id)
+                    ORDER BY u.total_score DESC, u.id
+                    LIMIT $2
+                    """,
+                    cursor_id, limit + 1
+                )
+            else:
+                rows = await conn.fetch(
+                    """
+                    WITH c AS (SELECT id, total_score FROM users WHERE id = $1)
+                    SELECT u.id, u.username, u.total_score FROM users u, c
+                    WHERE u.total_score >= c.total_score AND (u.total_score > c.total_score OR u.id < c.id)
+                    ORDER BY u.total_score ASC, u.id DESC
+                    LIMIT $2
+                    """,
+                    cursor_id, limit + 1
+                )
+
+            has_more = len(rows) > limit
+            rows = [dict(row) for row in rows[:limit]]
+            if cursor_id is not None and not forward:
+                rows.reverse()
+            if not rows:
+                return {"rows": [], "has_prev": False, "has_next": False}
+
+            first_rank = (await conn.fetchrow(self._RANK_QUERY, rows[0]['id']))['rank']
+            for offset, row in enumerate(rows):
+                row['rank'] = first_rank + offset
+            return {
+                "rows": rows,
+                "has_prev": first_rank > 1,
+                "has_next": has_more if forward or cursor_id is None else True,
+            }
+
+    async def get_user_rank(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Место пользователя в общем рейтинге и его очки."""
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(self._RANK_QUERY, user_id)
+            return dict(row) if row else None
+
+    async def get_user_standing(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Место пользователя для строки «вы на N-м месте»: оценка по гистограмме
+        очков, а для первых RANK_EXACT_TOP мест или при погрешности больше
+        RANK_MAX_ERROR — точное место по индексу.
+        """
+        async with self.pool.acquire() as conn:
+            total_score = await conn.fetchval("SELECT total_score FROM users WHERE id = $1", user_id)
+        if total_score is None:
+            return None
+
+        histogram = self.score_histogram
+        estimate = histogram.estimate(total_score)
+        if (estimate is not None
+                and estimate.rank - estimate.error > Config.RANK_EXACT_TOP
+                and estimate.error <= Config.RANK_MAX_ERROR * histogram.total):
+            return {"rank": estimate.rank, "total_score": total_score,
+                    "percentile": estimate.percentile, "approximate": True}
+
+        exact = await self.get_user_rank(user_id)
+        if exact is None:
+            return None
+        total = histogram.total or exact['rank']
+        return {"rank": exact['rank'], "total_score": exact['total_score'],
+                "percentile": 100 * exact['rank'] / max(total, exact['rank']), "approximate": False}
+
+    async def refresh_score_histogram(self) -> None:
+        """Перестраивает гистограмму очков целиком по users.total_score."""
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT floor(total_score / $1)::int AS bucket, COUNT(*) AS users FROM users GROUP BY 1",
+                self.score_histogram.bucket_width
+            )
+        self.score_histogram.rebuild((row['bucket'], row['users']) for row in rows)
+
+    async def get_season_history_page(self, user_id: int, cursor: Optional[int] = None, forward: bool = True,
+                                      limit: int = Config.SEASON_HISTORY_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Страница истории сезона пользователя: оцененные матчи с его очками и
+        накопленным итогом в порядке (match_datetime, id) — id матчей не
+        хронологичны. Keyset-пагинация: cursor — id матча, forward — матчи после
+        него, иначе — перед ним; без курсора — последние матчи. Страница живет
+        в кэше до следующего изменения очков или матчей.
+        """
+        key = (user_id, cursor, forward)
+        version = (self.data_versions["scores"], self.data_versions["matches"])
+        cached = self._season_history.get(key)
+        if cached is not None and cached[0] == version:
+            self._season_history.move_to_end(key)
+            return cached[1]
+
+        descending = cursor is None or not forward
+        compare, order = ("<", "DESC") if descending else (">", "ASC")
+        async with self.pool.acquire() as conn:
+            # Накопленный итог считается окном по всем матчам пользователя текущего сезона:
+            # очки — index-only scan по idx_user_match_scores_history, даты — по первичному
+            # ключу matches; строк не больше числа матчей сезона
+            rows = await conn.fetch(
+                f"""
+                WITH h AS (
+                    SELECT ums.match_id, ums.score, m.opponent, m.match_datetime,
+                           SUM(ums.score) OVER (ORDER BY m.match_datetime, ums.match_id) AS running_total
+                    FROM user_match_scores ums
+                    JOIN matches m ON m.id = ums.match_id
+                    WHERE ums.user_id = $1 AND m.season_id IS NULL
+                )
+                SELECT h.match_id, h.score, h.running_total, h.opponent, h.match_datetime
+                FROM h
+                WHERE $2::int IS NULL
+                   OR (h.match_datetime, h.match_id) {compare} (SELECT match_datetime, id FROM matches WHERE id = $2)
+                ORDER BY h.match_datetime {order}, h.match_id {order}
+                LIMIT $3
+                """,
+                user_id, cursor, limit + 1
             )
-            return [dict(row) for row in leaderboard]
+
+        has_more = len(rows) > limit
+        rows = [dict(row) for row in rows[:limit]]
+        if descending:
+            rows.reverse()
+        page = {
+            "rows": rows,
+            "has_prev": has_more if descending else True,
+            "has_next": cursor is not None and (has_more if forward else True),
+        }
+        self._season_history[key] = (version, page)
+        if len(self._season_history) > Config.SEASON_HISTORY_CACHE_SIZE:
+            self._season_history.popitem(last=False)
+        return page
 
     async def get_weekly_leaderboard(self) -> List[Dict[str, Any]]:
         async with self.pool.acquire() as conn:
@@ -160,6 +649,7 @@ class Database:
                 "ON CONFLICT (setting_name) DO UPDATE SET setting_value = $2",
                 setting_name, setting_value
             )
+            await self.publish_change(conn, "settings")
 
     async def add_match(self, opponent: str, match_datetime: datetime.datetime) -> bool:
         async with self.pool.acquire() as conn:
@@ -170,6 +660,8 @@ class Database:
                     "ON CONFLICT (opponent, match_datetime) DO NOTHING",
                     opponent, match_datetime
                 )
+                if self._affected_rows(result):
+                    await self.publish_change(conn, "matches")
                 return result == 'INSERT 0 1'
             except Exception as e:
                 print(f"Ошибка при добавлении матча: {e}")
@@ -199,11 +691,20 @@ class Database:
     async def update_match(self, match_id: int, opponent: str, match_datetime: datetime.datetime) -> bool:
         async with self.pool.acquire() as conn:
             try:
-                result = await conn.execute(
-                    "UPDATE matches SET opponent = $1, match_datetime = $2 WHERE id = $3",
-                    opponent, match_datetime, match_id
-                )
-                return result == 'UPDATE 1'
+                async with conn.transaction():
+                    # Если матч перенесли и дедлайн снова в будущем — размораживаем составы
+                    locked = await conn.fetchval(
+                        "UPDATE matches SET opponent = $1, match_datetime = $2, "
+                        "lineups_locked = lineups_locked AND $2 - make_interval(mins => $4) <= $5 "
+                        "WHERE id = $3 RETURNING lineups_locked",
+                        opponent, match_datetime, match_id, Config.TEAM_DEADLINE_MINUTES, naive_now()
+                    )
+                    if locked is None:
+                        return False
+                    if not locked:
+                        await conn.execute("DELETE FROM lineup_snapshots WHERE match_id = $1", match_id)
+                await self.publish_change(conn, "matches")
+                return True
             except Exception as e:
                 print(f"Ошибка при обновлении матча {match_id}: {e}")
                 return False
@@ -216,7 +717,8 @@ class Database:
                 current_time
             )
             matches = await conn.fetch(
-                "SELECT * FROM matches WHERE status = 'finished' AND is_scored = FALSE ORDER BY match_datetime DESC"
+                "SELECT * FROM matches WHERE status = 'finished' AND is_scored = FALSE AND season_id IS NULL "
+                "ORDER BY match_datetime DESC"
             )
             return [dict(m) for m in matches]
 
@@ -228,17 +730,187 @@ class Database:
     async def add_player(self, name: str, position: str) -> Optional[Dict[str, Any]]:
         async with self.pool.acquire() as conn:
             try:
-                max_order_index = await conn.fetchval("SELECT COALESCE(MAX(order_index), -1) FROM players")
-                new_order_index = max_order_index + 1
                 player = await conn.fetchrow(
-                    "INSERT INTO players (name, position, order_index) VALUES ($1, $2, $3) ON CONFLICT (name) DO NOTHING RETURNING *",
-                    name, position, new_order_index
+                    "INSERT INTO players (name, position, order_index) "
+                    "SELECT $1, $2, COALESCE(MAX(order_index), -1) + 1 FROM players "
+                    "ON CONFLICT (name) DO NOTHING RETURNING *",
+                    name, position
                 )
-                return dict(player) if player else None
+                if player is None:
+                    return None
+                await self.publish_change(conn, "players")
+                return dict(player)
             except Exception as e:
                 print(f"Ошибка при добавлении игрока: {e}")
                 return None
 
+    @staticmethod
+    async def _copy_csv_to_staging(conn: asyncpg.Connection, table: str, columns: List[str],
+                                   source: AsyncIterable[bytes], delimiter: str) -> int:
+        """
+        Создает временную таблицу (line_no + текстовые колонки) и заливает в нее
+        строки CSV через COPY. Вызывать внутри транзакции. Возвращает число строк.
+
+        CSV разбирается на нашей стороне построчно: COPY ... FORMAT csv падает
+        на первой строке с лишней колонкой или кавычкой, а так битая строка
+        ложится в таблицу с NULL и считается отклоненной.
+        """
+        column_defs = ", ".join(f"{column} TEXT" for column in columns)
+        await conn.execute(f"CREATE TEMP TABLE {table} (line_no SERIAL, {column_defs}) ON COMMIT DROP")
+        result = await conn.copy_records_to_table(
+            table, records=csv_rows(source, delimiter, len(columns)), columns=columns
+        )
+        return int(result.split()[-1])
+
+    async def import_players(self, source: AsyncIterable[bytes], delimiter: str) -> Optional[Dict[str, int]]:
+        """
+        Импорт игроков из CSV (name, position): COPY во временную таблицу и один
+        MERGE-запрос. Существующим игрокам меняется только позиция, новые
+        получают order_index по порядку строк файла после текущих игроков.
+        """
+        async with self.pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    total = await self._copy_csv_to_staging(
+                        conn, "players_import", ["name", "position"], source, delimiter
+                    )
+                    # Параллельный add_player не должен занять тот же order_index
+                    await conn.execute("LOCK TABLE players IN SHARE ROW EXCLUSIVE MODE")
+                    counts = await conn.fetchrow(
+                        """
+                        WITH src AS (
+                            SELECT DISTINCT ON (btrim(name)) btrim(name) AS name,
+                                   lower(btrim(position)) AS position, line_no
+                            FROM players_import
+                            WHERE btrim(name) <> '' AND lower(btrim(position)) = ANY($1::text[])
+                            ORDER BY btrim(name), line_no
+                        ),
+                        numbered AS (
+                            SELECT src.name, src.position,
+                                   COALESCE(p.order_index,
+                                            (SELECT COALESCE(MAX(order_index), -1) FROM players)
+                                            + row_number() OVER (PARTITION BY p.id IS NULL ORDER BY src.line_no)
+                                   ) AS order_index
+                            FROM src
+                            LEFT JOIN players p ON p.name = src.name
+                        ),
+                        merged AS (
+                            INSERT INTO players (name, position, order_index)
+                            SELECT name, position, order_index FROM numbered
+                            ON CONFLICT (name) DO UPDATE SET position = EXCLUDED.position
+                            WHERE players.position IS DISTINCT FROM EXCLUDED.position
+                            RETURNING (xmax = 0) AS inserted
+                        )
+                        SELECT (SELECT COUNT(*) FROM src) AS accepted,
+                               COUNT(*) FILTER (WHERE inserted) AS inserted,
+                               COUNT(*) FILTER (WHERE NOT inserted) AS updated
+                        FROM merged
+                        """,
+                        list(Config.POSITIONS)
+                    )
+                if counts['inserted'] or counts['updated']:
+                    await self.publish_change(conn, "players")
+                return self._import_report(total, counts)
+            except Exception as e:
+                print(f"Ошибка при импорте игроков: {e}")
+                return None
+
+    async def import_matches(self, source: AsyncIterable[bytes], delimiter: str) -> Optional[Dict[str, int]]:
+        """
+        Импорт расписания из CSV (opponent, match_datetime в формате
+        ГГГГ-ММ-ДД ЧЧ:ММ): COPY во временную таблицу и один INSERT ... SELECT.
+        Уже существующие матчи (тот же соперник и время) пропускаются, матчи
+        в прошлом отклоняются, как и при ручном добавлении.
+        """
+        async with self.pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    total = await self._copy_csv_to_staging(
+                        conn, "matches_import", ["opponent", "match_datetime"], source, delimiter
+                    )
+                    counts = await conn.fetchrow(
+                        r"""
+                        WITH parsed AS (
+                            -- Вложенные CASE задают порядок проверок: приведение к timestamp только для
+                            -- строк нужного формата с существующим днем месяца (2025-02-30 отбрасывается)
+                            SELECT btrim(opponent) AS opponent,
+                                   CASE WHEN raw ~ '^[1-9]\d{3}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])[ T]([01]\d|2[0-3]):[0-5]\d(:[0-5]\d)?$'
+                                        THEN CASE WHEN substr(raw, 9, 2)::int <= extract(day FROM
+                                                           make_date(substr(raw, 1, 4)::int, substr(raw, 6, 2)::int, 1)
+                                                           + interval '1 month - 1 day')
+                                                  THEN raw::timestamp
+                                             END
+                                   END AS match_datetime
+                            FROM matches_import, btrim(match_datetime) AS raw
+                            WHERE btrim(opponent) <> ''
+                        ),
+                        src AS (
+                            SELECT DISTINCT opponent, match_datetime
+                            FROM parsed
+                            WHERE match_datetime > $1
+                        ),
+                        merged AS (
+                            INSERT INTO matches (opponent, match_datetime, status, is_scored)
+                            SELECT opponent, match_datetime, 'upcoming', FALSE FROM src
+                            ON CONFLICT (opponent, match_datetime) DO NOTHING
+                            RETURNING id
+                        )
+                        SELECT (SELECT COUNT(*) FROM src) AS accepted,
+                               COUNT(*) AS inserted,
+                               0 AS updated
+                        FROM merged
+                        """,
+                        naive_now()
+                    )
+                if counts['inserted']:
+                    await self.publish_change(conn, "matches")
+                return self._import_report(total, counts)
+            except Exception as e:
+                print(f"Ошибка при импорте матчей: {e}")
+                return None
+
+    async def stream_export(self, name: str, max_chunks: int = 16) -> AsyncIterator[bytes]:
+        """
+        Отдает выгрузку EXPORT_QUERIES[name] в CSV по частям через COPY ... TO STDOUT.
+        Между COPY и потребителем стоит очередь на max_chunks частей, поэтому
+        память не зависит от размера таблицы: пока потребитель не забрал
+        данные, COPY ждет.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_chunks)
+        finished = object()
+
+        async def produce() -> None:
+            cancelled = False
+            try:
+                async with self.pool.acquire() as conn:
+                    await conn.copy_from_query(self.EXPORT_QUERIES[name], output=queue.put, format="csv", header=True)
+            except asyncio.CancelledError:
+                # Потребитель ушел: очередь может быть полной, а сигнал конца уже никто не прочитает
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    await queue.put(finished)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (chunk := await queue.get()) is not finished:
+                yield chunk
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+    @staticmethod
+    def _import_report(total: int, counts: asyncpg.Record) -> Dict[str, int]:
+        return {
+            "inserted": counts['inserted'],
+            "updated": counts['updated'],
+            "unchanged": counts['accepted'] - counts['inserted'] - counts['updated'],
+            "rejected": total - counts['accepted'],
+        }
+
     async def update_player(self, player_id: int, name: str, position: str) -> bool:
         async with self.pool.acquire() as conn:
             try:
@@ -248,6 +920,8 @@ class Database:
                     "UPDATE players SET name = $1, position = $2 WHERE id = $3",
                     name, position, player_id
                 )
+                if self._affected_rows(result):
+                    await self.publish_change(conn, "players")
                 return result == 'UPDATE 1'
             except asyncpg.exceptions.UniqueViolationError:
                 print(f"Ошибка: Игрок с именем '{name}' уже существует.")
@@ -259,11 +933,15 @@ class Database:
     async def delete_player(self, player_id: int) -> bool:
         async with self.pool.acquire() as conn:
             result = await conn.execute("DELETE FROM players WHERE id = $1", player_id)
+            if self._affected_rows(result):
+                await self.publish_change(conn, "players")
             return result == 'DELETE 1'
 
     async def delete_all_players(self) -> bool:
         async with self.pool.acquire() as conn:
             result = await conn.execute("DELETE FROM players")
+            if self._affected_rows(result):
+                await self.publish_change(conn, "players")
             return result == 'DELETE 0' or result.startswith('DELETE')
 
     async def save_player_points(self, match_id: int, player_id: int, points: float) -> None:
@@ -274,53 +952,278 @@ class Database:
                 match_id, player_id, points
             )
 
-    async def update_user_scores_for_match(self, match_id: int) -> None:
+    async def get_next_match_to_lock(self) -> Optional[Dict[str, Any]]:
+        """Ближайший матч, составы на который еще не заморожены, и его дедлайн."""
         async with self.pool.acquire() as conn:
-            player_points = await conn.fetch(
-                "SELECT player_id, points FROM match_player_points WHERE match_id = $1", match_id
+            match = await conn.fetchrow(
+                "SELECT id, match_datetime - make_interval(mins => $1) AS deadline FROM matches "
+                "WHERE NOT lineups_locked ORDER BY match_datetime ASC LIMIT 1",
+                Config.TEAM_DEADLINE_MINUTES
             )
-            player_points_map = {p['player_id']: p['points'] for p in player_points}
+            return dict(match) if match else None
 
-            user_teams = await conn.fetch(
-                "SELECT user_id, player_ids FROM user_teams WHERE match_id = $1", match_id
+    @staticmethod
+    async def _lock_match_lineups(conn: asyncpg.Connection, match_id: int) -> Optional[int]:
+        """
+        Замораживает составы: помечает матч и раскладывает user_teams.player_ids
+        в lineup_snapshots. Вызывать внутри транзакции. Возвращает число
+        замороженных составов или None, если матч уже был заморожен.
+        """
+        locked = await conn.fetchval(
+            "UPDATE matches SET lineups_locked = TRUE WHERE id = $1 AND NOT lineups_locked RETURNING id",
+            match_id
+        )
+        if locked is None:
+            return None
+        return await conn.fetchval(
+            """
+            WITH snap AS (
+                INSERT INTO lineup_snapshots (match_id, player_id, user_id)
+                SELECT ut.match_id, p.player_id, ut.user_id
+                FROM user_teams ut
+                CROSS JOIN LATERAL unnest(ut.player_ids) AS p(player_id)
+                WHERE ut.match_id = $1
+                ON CONFLICT DO NOTHING
+                RETURNING user_id
             )
+            SELECT COUNT(DISTINCT user_id) FROM snap
+            """,
+            match_id
+        )
+
+    async def lock_match_lineups(self, match_id: int) -> Optional[int]:
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                return await self._lock_match_lineups(conn, match_id)
 
-            user_scores = {}
-            for team in user_teams:
-                user_id = team['user_id']
-                team_score = 0.0
-                for player_id in team['player_ids']:
-                    team_score += player_points_map.get(player_id, 0.0)
-                user_scores[user_id] = team_score
+    async def update_user_scores_for_match(self, match_id: int) -> None:
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await self._rescore_match(conn, match_id)
+            print(f"Очки пользователей и общий рейтинг обновлены для матча {match_id}")
+            await self.publish_change(conn, "matches", "scores")
+        await self.refresh_score_histogram()
 
+    async def score_match(self, match_id: int, points: Dict[int, float]) -> None:
+        """
+        Сохраняет очки всех игроков матча одним запросом и пересчитывает
+        рейтинг в той же транзакции.
+        """
+        player_ids = list(points)
+        async with self.pool.acquire() as conn:
             async with conn.transaction():
-                for user_id, score in user_scores.items():
-                    await conn.execute(
-                        "INSERT INTO user_match_scores (user_id, match_id, score) VALUES ($1, $2, $3) "
-                        "ON CONFLICT (user_id, match_id) DO UPDATE SET score = $3",
-                        user_id, match_id, score
+                await conn.execute(
+                    """
+                    INSERT INTO match_player_points (match_id, player_id, points)
+                    SELECT $1, p.player_id, p.points
+                    FROM unnest($2::int[], $3::float8[]) AS p(player_id, points)
+                    ON CONFLICT (match_id, player_id) DO UPDATE SET points = EXCLUDED.points
+                    """,
+                    match_id, player_ids, [points[player_id] for player_id in player_ids]
+                )
+                await self._rescore_match(conn, match_id)
+            print(f"Сохранены очки {len(player_ids)} игроков и обновлен рейтинг для матча {match_id}")
+            await self.publish_change(conn, "matches", "scores")
+        await self.refresh_score_histogram()
+
+    @classmethod
+    async def _rescore_match(cls, conn: asyncpg.Connection, match_id: int) -> None:
+        """Пересчитывает очки пользователей за матч и их общий счет. Вызывать внутри транзакции."""
+        # Матч, который оценивают, уже сыгран; на случай пропущенного дедлайна замораживаем здесь
+        await cls._lock_match_lineups(conn, match_id)
+
+        await conn.execute(
+            """
+            INSERT INTO user_match_scores (user_id, match_id, score)
+            SELECT ls.user_id, ls.match_id, COALESCE(SUM(mpp.points), 0)
+            FROM lineup_snapshots ls
+            LEFT JOIN match_player_points mpp
+                   ON mpp.match_id = ls.match_id AND mpp.player_id = ls.player_id
+            WHERE ls.match_id = $1
+            GROUP BY ls.user_id, ls.match_id
+            ON CONFLICT (user_id, match_id) DO UPDATE SET score = EXCLUDED.score
+            """,
+            match_id
+        )
+        await conn.execute(
+            """
+            UPDATE users u SET total_score = s.total_score
+            FROM (
+                SELECT ums.user_id, SUM(ums.score) AS total_score
+                FROM user_match_scores ums
+                WHERE ums.user_id IN (SELECT user_id FROM lineup_snapshots WHERE match_id = $1)
+                  AND ums.match_id IN """ + cls._CURRENT_SEASON_MATCHES + """
+                GROUP BY ums.user_id
+            ) s
+            WHERE u.id = s.user_id
+            """,
+            match_id
+        )
+        await conn.execute(
+            "UPDATE matches SET is_scored = TRUE WHERE id = $1", match_id
+        )
+
+    async def correct_player_points(self, match_id: int, player_id: int, new_points: float) -> Dict[str, Any]:
+        """
+        Исправляет очки одного игрока в уже оцененном матче и переносит разницу
+        только на тех пользователей, у кого этот игрок был в замороженном составе.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                old_points = await conn.fetchval(
+                    "SELECT points FROM match_player_points WHERE match_id = $1 AND player_id = $2 FOR UPDATE",
+                    match_id, player_id
+                )
+                await conn.execute(
+                    "INSERT INTO match_player_points (match_id, player_id, points) VALUES ($1, $2, $3) "
+                    "ON CONFLICT (match_id, player_id) DO UPDATE SET points = $3",
+                    match_id, player_id, new_points
+                )
+                delta = new_points - (old_points or 0.0)
+                updated_users = []
+                if delta:
+                    updated_users = await conn.fetch(
+                        """
+                        WITH affected AS (
+                            UPDATE user_match_scores ums SET score = ums.score + $3
+                            FROM lineup_snapshots ls
+                            WHERE ls.match_id = $1 AND ls.player_id = $2
+                              AND ums.user_id = ls.user_id AND ums.match_id = ls.match_id
+                            RETURNING ums.user_id
+                        )
+                        UPDATE users u SET total_score = u.total_score + $3
+                        FROM affected a
+                        WHERE u.id = a.user_id
+                        RETURNING u.id, u.total_score
+                        """,
+                        match_id, player_id, delta
                     )
+            if updated_users:
+                await self.publish_change(conn, "scores")
+        for user in updated_users:
+            self.score_histogram.move(user['total_score'] - delta, user['total_score'])
+        return {
+            "old_points": old_points,
+            "delta": delta,
+            "updated_users": [dict(u) for u in updated_users],
+        }
 
-                    total_score = await conn.fetchval(
-                        "SELECT SUM(score) FROM user_match_scores WHERE user_id = $1", user_id
+    async def close_season(self, name: str) -> Dict[str, Any]:
+        """
+        Закрывает сезон: в него входят все уже начавшиеся матчи текущего сезона
+        (по match_datetime, а не по id). Итоги пользователей сохраняются в
+        season_summaries, строки по матчам сезона переезжают из DEFAULT-партиций в
+        партиции сезона, общий счет обнуляется. Партиции сезонов старше
+        SEASONS_KEEP_ATTACHED последних отсоединяются и остаются отдельными
+        таблицами <таблица>_s<id сезона>.
+        Возвращает {"error": ...} или сведения о закрытом сезоне.
+        """
+        async with self.pool.acquire() as conn:
+            try:
+                async with conn.transaction():
+                    # Два закрытия одновременно поделили бы одни и те же матчи
+                    await conn.execute("LOCK TABLE seasons IN EXCLUSIVE MODE")
+                    # Неоцененный прошедший матч без составов (отменен, не состоялся) сезону не мешает,
+                    # а с составами — мешает: после закрытия его очки ушли бы в следующий сезон
+                    matches = await conn.fetch(
+                        """
+                        SELECT m.id, m.is_scored,
+                               EXISTS (SELECT 1 FROM user_teams ut WHERE ut.match_id = m.id) AS has_teams
+                        FROM matches m
+                        WHERE m.season_id IS NULL AND m.match_datetime <= $1
+                        """,
+                        naive_now()
                     )
-                    await conn.execute(
-                        "UPDATE users SET total_score = $1 WHERE id = $2",
-                        total_score if total_score is not None else 0.0, user_id
+                    if not any(match['is_scored'] for match in matches):
+                        return {"error": "no_matches"}
+                    unscored = sum(1 for match in matches if not match['is_scored'] and match['has_teams'])
+                    if unscored:
+                        return {"error": "unscored", "unscored": unscored}
+                    match_ids = [match['id'] for match in matches]
+
+                    season_id = await conn.fetchval("INSERT INTO seasons (name) VALUES ($1) RETURNING id", name)
+                    await conn.execute("UPDATE matches SET season_id = $1 WHERE id = ANY($2::int[])", season_id, match_ids)
+                    participants = await conn.fetchval(
+                        """
+                        WITH s AS (
+                            INSERT INTO season_summaries (season_id, user_id, total_score, matches_played, rank)
+                            SELECT $1, user_id, SUM(score), COUNT(*), RANK() OVER (ORDER BY SUM(score) DESC)
+                            FROM user_match_scores
+                            WHERE match_id = ANY($2::int[])
+                            GROUP BY user_id
+                            RETURNING 1
+                        )
+                        SELECT COUNT(*) FROM s
+                        """,
+                        season_id, match_ids
                     )
+                    values = ", ".join(str(int(match_id)) for match_id in match_ids)
+                    for table in PARTITIONED_TABLES:
+                        # {table}_current — DEFAULT-партиция с текущим сезоном (см. models.create_tables)
+                        partition = f"{table}_s{season_id}"
+                        await conn.execute(
+                            f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING INDEXES)"
+                        )
+                        await conn.execute(
+                            f"WITH moved AS (DELETE FROM {table}_current WHERE match_id = ANY($1::int[]) "
+                            f"RETURNING *) INSERT INTO {partition} SELECT * FROM moved",
+                            match_ids
+                        )
+                        await conn.execute(f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES IN ({values})")
+                    await conn.execute("UPDATE users SET total_score = 0 WHERE total_score <> 0")
 
-                await conn.execute(
-                    "UPDATE matches SET is_scored = TRUE WHERE id = $1", match_id
-                )
-            print(f"Очки пользователей и общий рейтинг обновлены для матча {match_id}")
+                    detached = await conn.fetch(
+                        "UPDATE seasons SET detached = TRUE WHERE id IN ("
+                        "    SELECT id FROM seasons WHERE NOT detached ORDER BY id DESC OFFSET $1"
+                        ") RETURNING id",
+                        Config.SEASONS_KEEP_ATTACHED
+                    )
+                    for season in detached:
+                        for table in PARTITIONED_TABLES:
+                            await conn.execute(f"ALTER TABLE {table} DETACH PARTITION {table}_s{season['id']}")
+                await self.publish_change(conn, "matches", "scores")
+            except Exception as e:
+                print(f"Ошибка при закрытии сезона: {e}")
+                return {"error": "failed"}
+        await self.refresh_score_histogram()
+        return {
+            "season_id": season_id,
+            "matches": len(match_ids),
+            "participants": participants,
+            "detached": [season['id'] for season in detached],
+        }
+
+    async def get_scored_matches(self, limit: int) -> List[Dict[str, Any]]:
+        async with self.pool.acquire() as conn:
+            matches = await conn.fetch(
+                "SELECT * FROM matches WHERE is_scored = TRUE AND season_id IS NULL "
+                "ORDER BY match_datetime DESC LIMIT $1",
+                limit
+            )
+            return [dict(m) for m in matches]
+
+    async def get_player_points(self, match_id: int, player_id: int) -> Optional[float]:
+        async with self.pool.acquire() as conn:
+            return await conn.fetchval(
+                "SELECT points FROM match_player_points WHERE match_id = $1 AND player_id = $2",
+                match_id, player_id
+            )
 
     async def set_match_status(self, match_id: int, status: str) -> None:
         async with self.pool.acquire() as conn:
-            await conn.execute("UPDATE matches SET status = $1 WHERE id = $2", status, match_id)
+            result = await conn.execute(
+                "UPDATE matches SET status = $1 WHERE id = $2 AND status IS DISTINCT FROM $1", status, match_id
+            )
+            if self._affected_rows(result):
+                await self.publish_change(conn, "matches")
 
-    async def get_match_details(self, match_id: int) -> Optional[Dict[str, Any]]:
+    async def get_match_details(self, match_id: int, attached_only: bool = False) -> Optional[Dict[str, Any]]:
+        """attached_only — только матчи, чьи составы не ушли в архив вместе с сезоном."""
+        query = "SELECT * FROM matches WHERE id = $1"
+        if attached_only:
+            query += " AND " + self._ATTACHED_MATCH
         async with self.pool.acquire() as conn:
-            match = await conn.fetchrow("SELECT * FROM matches WHERE id = $1", match_id)
+            match = await conn.fetchrow(query, match_id)
             return dict(match) if match else None
 
     async def update_user_notification_preference(self, user_id: int, preference: bool) -> None:
@@ -344,12 +1247,14 @@ class Database:
                 "UPDATE matches SET status = 'finished' WHERE match_datetime < $1 AND status = 'upcoming'",
                 current_time
             )
+            # Матчи отсоединенных сезонов не показываем: их составов в основных таблицах уже нет
             total_count = await conn.fetchval(
-                "SELECT COUNT(*) FROM matches WHERE status = 'finished' AND is_scored = TRUE"
+                "SELECT COUNT(*) FROM matches WHERE status = 'finished' AND is_scored = TRUE AND "
+                + self._ATTACHED_MATCH
             )
             matches = await conn.fetch(
-                "SELECT * FROM matches WHERE status = 'finished' AND is_scored = TRUE "
-                "ORDER BY match_datetime DESC OFFSET $1 LIMIT $2",
+                "SELECT * FROM matches WHERE status = 'finished' AND is_scored = TRUE AND "
+                + self._ATTACHED_MATCH + " ORDER BY match_datetime DESC OFFSET $1 LIMIT $2",
                 offset, limit
             )
             return {
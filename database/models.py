@@ -2,6 +2,15 @@ import asyncpg
 import datetime
 from config import Config
 
+# Таблицы, которые растут вместе с числом матчей и секционируются по сезонам:
+# таблица -> (ключ, который переносится на секционированную таблицу, есть ли user_id)
+PARTITIONED_TABLES = {
+    "user_teams": ("UNIQUE (user_id, match_id)", True),
+    "user_match_scores": ("UNIQUE (user_id, match_id)", True),
+    "lineup_snapshots": ("PRIMARY KEY (match_id, player_id, user_id)", True),
+    "match_pick_counts": ("PRIMARY KEY (match_id, player_id)", False),
+}
+
 
 async def create_tables(conn):
     await conn.execute('''
@@ -68,6 +77,113 @@ async def create_tables(conn):
         );
     ''')
 
+    # Снимок составов, замороженный в дедлайн матча: по строке на (матч, игрок, пользователь)
+    await conn.execute('''
+        ALTER TABLE matches ADD COLUMN IF NOT EXISTS lineups_locked BOOLEAN DEFAULT FALSE;
+
+        CREATE INDEX IF NOT EXISTS idx_user_teams_match_id ON user_teams (match_id);
+
+        CREATE TABLE IF NOT EXISTS lineup_snapshots (
+            match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
+            player_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            PRIMARY KEY (match_id, player_id, user_id)
+        );
+    ''')
+
+    # Общий рейтинг листается по (total_score DESC, id), место считается по этому же индексу.
+    # NOT NULL ставится один раз: ALTER блокирует users целиком и сканирует всю таблицу
+    await conn.execute('''
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM information_schema.columns
+                       WHERE table_schema = current_schema() AND table_name = 'users'
+                         AND column_name = 'total_score' AND is_nullable = 'YES') THEN
+                UPDATE users SET total_score = 0 WHERE total_score IS NULL;
+                ALTER TABLE users ALTER COLUMN total_score SET NOT NULL;
+            END IF;
+        END $$;
+
+        CREATE INDEX IF NOT EXISTS idx_users_leaderboard ON users (total_score DESC, id);
+    ''')
+
+    # История сезона пользователя читается только из этого индекса (index-only scan)
+    await conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_user_match_scores_history ON user_match_scores (user_id, match_id) INCLUDE (score);
+    ''')
+
+    # Сколько составов на матч выбрали каждого игрока; поддерживается в save_user_team/delete_user_team.
+    # Строка с player_id = 0 хранит число составов на матч: она обновляется тем же
+    # INSERT, что и игроки, и блокируется первой, поэтому встречные сохранения не дают дедлок
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS match_pick_counts (
+            match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
+            player_id INTEGER NOT NULL,
+            pick_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (match_id, player_id)
+        );
+
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM match_pick_counts) THEN
+                INSERT INTO match_pick_counts (match_id, player_id, pick_count)
+                SELECT match_id, 0, COUNT(*) FROM user_teams GROUP BY match_id
+                UNION ALL
+                SELECT ut.match_id, p.player_id, COUNT(*)
+                FROM user_teams ut, unnest(ut.player_ids) AS p(player_id)
+                GROUP BY ut.match_id, p.player_id;
+            END IF;
+        END $$;
+    ''')
+
+    # Сезоны: матчи закрытого сезона помечены matches.season_id, итоги пользователей
+    # лежат в season_summaries, а строки по этим матчам — в партициях сезона.
+    # Матчи с season_id IS NULL — текущий сезон
+    await conn.execute('''
+        CREATE TABLE IF NOT EXISTS seasons (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            closed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            detached BOOLEAN NOT NULL DEFAULT FALSE
+        );
+
+        ALTER TABLE matches ADD COLUMN IF NOT EXISTS season_id INTEGER REFERENCES seasons(id);
+
+        CREATE TABLE IF NOT EXISTS season_summaries (
+            season_id INTEGER NOT NULL REFERENCES seasons(id) ON DELETE CASCADE,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            total_score REAL NOT NULL,
+            matches_played INTEGER NOT NULL,
+            rank INTEGER NOT NULL,
+            PRIMARY KEY (season_id, user_id)
+        );
+    ''')
+
+    # Таблицы PARTITIONED_TABLES секционируются списками match_id (LIST): у закрытого сезона
+    # своя партиция со всеми его матчами. Прежняя таблица становится DEFAULT-партицией
+    # <таблица>_current с текущим сезоном; ее индексы и последовательность id
+    # переходят к секционированной таблице
+    for table, (key, has_user) in PARTITIONED_TABLES.items():
+        user_fk = (f"ALTER TABLE {table} ADD FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE;"
+                   if has_user else "")
+        await conn.execute(f'''
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = '{table}'::regclass) THEN
+                    ALTER TABLE {table} RENAME TO {table}_current;
+                    CREATE TABLE {table} (LIKE {table}_current INCLUDING DEFAULTS) PARTITION BY LIST (match_id);
+                    ALTER TABLE {table} ADD {key};
+                    ALTER TABLE {table} ATTACH PARTITION {table}_current DEFAULT;
+                    {user_fk}
+                    ALTER TABLE {table} ADD FOREIGN KEY (match_id) REFERENCES matches(id) ON DELETE CASCADE;
+                END IF;
+            END $$;
+        ''')
+    await conn.execute('''
+        CREATE INDEX IF NOT EXISTS user_teams_match_id_idx ON user_teams (match_id);
+        CREATE INDEX IF NOT EXISTS user_match_scores_history_idx ON user_match_scores (user_id, match_id) INCLUDE (score);
+    ''')
+
     await conn.execute('''
         CREATE TABLE IF NOT EXISTS admin_settings (
             id SERIAL PRIMARY KEY,
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional, Tuple
+
+import asyncpg
+
+from config import Config
+
+# (критичный ли запрос, сколько секунд ждать соединение) для кода внутри db_access()
+_access: ContextVar[Tuple[bool, Optional[float]]] = ContextVar("db_access", default=(False, None))
+
+
+class PoolBusyError(Exception):
+    """Соединение пула не освободилось за отведенное время."""
+
+
+@contextmanager
+def db_access(critical: bool = False, timeout: Optional[float] = None):
+    """
+    Соединения внутри блока берутся с указанным приоритетом: критичные
+    запросы могут занять резерв пула, остальные ждут не дольше timeout
+    секунд и получают PoolBusyError.
+    """
+    token = _access.set((critical, timeout))
+    try:
+        yield
+    finally:
+        _access.reset(token)
+
+
+class _AcquireContext:
+    def __init__(self, owner: "InstrumentedPool", timeout: Optional[float]):
+        self._owner = owner
+        self._timeout = timeout
+        self._conn: Optional[asyncpg.Connection] = None
+        self._slot = False
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        owner = self._owner
+        critical, timeout = _access.get()
+        if self._timeout is not None:
+            timeout = self._timeout
+        started = time.monotonic()
+        owner.waiting += 1
+        try:
+            if not critical:
+                await asyncio.wait_for(owner.shared_slots.acquire(), timeout)
+                self._slot = True
+            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - started))
+            self._conn = await owner.pool.acquire(timeout=remaining)
+        except asyncio.TimeoutError:
+            self._release_slot()
+            raise PoolBusyError(f"нет свободного соединения за {timeout} с") from None
+        except BaseException:
+            self._release_slot()
+            raise
+        finally:
+            owner.waiting -= 1
+            owner.record_wait(time.monotonic() - started)
+        return self._conn
+
+    async def __aexit__(self, *exc_info) -> None:
+        try:
+            await self._owner.pool.release(self._conn)
+        finally:
+            self._release_slot()
+
+    def _release_slot(self) -> None:
+        if self._slot:
+            self._slot = False
+            self._owner.shared_slots.release()
+
+
+class InstrumentedPool:
+    """
+    Обертка над asyncpg.Pool для Database: то же acquire(), плюс сколько
+    корутин сейчас ждут соединение и сглаженное (EWMA) время ожидания.
+    По этим метрикам AdmissionController решает, что пул перегружен.
+    Остальные атрибуты берутся у исходного пула.
+
+    Между замерами среднее затухает вдвое за half_life секунд: когда под
+    перегрузкой запросы к пулу прекращаются, оценка сама возвращается к нулю.
+
+    reserved соединений достаются только критичным запросам (см. db_access):
+    остальные делят shared_slots, поэтому сохранение состава не стоит в
+    одной очереди с чтением, даже когда пул забит.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, smoothing: float = 0.2, half_life: float = 2.0,
+                 reserved: int = Config.DB_POOL_RESERVED_CRITICAL):
+        self.pool = pool
+        self.smoothing = smoothing
+        self.half_life = half_life
+        self.waiting = 0
+        self.shared_slots = asyncio.Semaphore(max(1, pool.get_max_size() - reserved))
+        self._wait_ewma = 0.0
+        self._sampled_at = time.monotonic()
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _AcquireContext:
+        return _AcquireContext(self, timeout)
+
+    @property
+    def wait_ewma(self) -> float:
+        return self._wait_ewma * 0.5 ** ((time.monotonic() - self._sampled_at) / self.half_life)
+
+    def record_wait(self, seconds: float) -> None:
+        current = self.wait_ewma
+        self._wait_ewma = current + self.smoothing * (seconds - current)
+        self._sampled_at = time.monotonic()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool, name)
@@ -0,0 +1,60 @@
+import math
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from config import Config
+
+
+class RankEstimate(NamedTuple):
+    rank: int
+    error: int
+    percentile: float
+
+
+class ScoreHistogram:
+    """
+    Гистограмма users.total_score в памяти: корзина шириной bucket_width
+    очков -> число пользователей. Позволяет оценить место пользователя по
+    его очкам за O(число корзин) без запроса в Postgres.
+
+    Строится целиком при оценке матча (Database.refresh_score_histogram),
+    между перестройками поддерживается дельтами (регистрация, исправление очков).
+    Погрешность оценки — не больше половины заполненности корзины пользователя.
+    """
+
+    def __init__(self, bucket_width: float = Config.RANK_HISTOGRAM_BUCKET_WIDTH):
+        self.bucket_width = bucket_width
+        self._counts: Dict[int, int] = {}
+        self.total = 0
+        self.ready = False
+
+    def bucket(self, score: float) -> int:
+        return math.floor(score / self.bucket_width)
+
+    def rebuild(self, counts: Iterable[Tuple[int, int]]) -> None:
+        self._counts = {bucket: count for bucket, count in counts if count}
+        self.total = sum(self._counts.values())
+        self.ready = True
+
+    def add(self, score: float, count: int = 1) -> None:
+        bucket = self.bucket(score)
+        new_count = self._counts.get(bucket, 0) + count
+        if new_count > 0:
+            self._counts[bucket] = new_count
+        else:
+            self._counts.pop(bucket, None)
+        self.total += count
+
+    def move(self, old_score: float, new_score: float) -> None:
+        if self.bucket(old_score) != self.bucket(new_score):
+            self.add(old_score, -1)
+            self.add(new_score)
+
+    def estimate(self, score: float) -> Optional[RankEstimate]:
+        """Оценка места: середина диапазона мест, которые занимает корзина с этим счетом."""
+        if not self.ready or not self.total:
+            return None
+        own_bucket = self.bucket(score)
+        above = sum(count for bucket, count in self._counts.items() if bucket > own_bucket)
+        own = self._counts.get(own_bucket, 0)
+        rank = above + (own + 1) // 2 if own else above + 1
+        return RankEstimate(rank=max(rank, 1), error=own // 2, percentile=100 * rank / self.total)
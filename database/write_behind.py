@@ -0,0 +1,115 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from config import Config
+
+
+class LastSelectedTeamBuffer:
+    """
+    Отложенная запись last_selected_team_ids.
+
+    Вместо отдельного UPDATE users на каждый выход из выбора состава
+    последние составы копятся в памяти (по одному на пользователя, новый
+    перезаписывает старый) и сбрасываются одним запросом раз в
+    flush_interval секунд или как только накопится max_pending записей.
+
+    Если запись падает, пачка возвращается в буфер, а пауза перед следующей
+    попыткой удваивается (до retry_max_delay). Состав, который не удалось
+    записать max_retries раз подряд, отбрасывается с сообщением в лог.
+    """
+
+    def __init__(self, db, flush_interval: float = Config.LAST_TEAM_FLUSH_INTERVAL,
+                 max_pending: int = Config.LAST_TEAM_FLUSH_BATCH,
+                 max_retries: int = Config.LAST_TEAM_FLUSH_RETRIES,
+                 retry_max_delay: float = Config.LAST_TEAM_RETRY_MAX_DELAY):
+        self.db = db
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.retry_max_delay = retry_max_delay
+        self._pending: Dict[int, List[int]] = {}
+        # Пачка, которую сейчас пишет flush: до конца записи ее значения еще не в базе
+        self._in_flight: Dict[int, List[int]] = {}
+        # Неудачные попытки записи по пользователю и неудачные сбросы подряд
+        self._attempts: Dict[int, int] = {}
+        self._failures = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def put(self, user_id: int, player_ids: List[int]) -> None:
+        self._pending[user_id] = list(player_ids)
+        self._attempts.pop(user_id, None)
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    def get_pending(self, user_id: int) -> Optional[List[int]]:
+        """Несохраненный состав пользователя, чтобы чтение видело свою же запись."""
+        pending = self._pending.get(user_id)
+        return pending if pending is not None else self._in_flight.get(user_id)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        self._in_flight = batch
+        saved = failed = False
+        try:
+            await self.db.save_last_selected_teams(batch)
+            saved = True
+        except Exception as e:
+            failed = True
+            self._failures += 1
+            print(f"Ошибка при сохранении последних составов ({len(batch)} шт., попытка {self._failures}): {e}")
+        finally:
+            self._in_flight = {}
+            if saved:
+                self._failures = 0
+                for user_id in batch:
+                    self._attempts.pop(user_id, None)
+            else:
+                self._requeue(batch, count_attempt=failed)
+
+    def _requeue(self, batch: Dict[int, List[int]], count_attempt: bool) -> None:
+        dropped = 0
+        for user_id, player_ids in batch.items():
+            if user_id in self._pending:
+                # Более свежее значение, пришедшее во время записи, не перетираем
+                continue
+            if count_attempt:
+                attempts = self._attempts.get(user_id, 0) + 1
+                if attempts >= self.max_retries:
+                    self._attempts.pop(user_id, None)
+                    dropped += 1
+                    continue
+                self._attempts[user_id] = attempts
+            self._pending[user_id] = player_ids
+        if dropped:
+            print(f"Последние составы {dropped} пользователей отброшены после {self.max_retries} неудачных попыток записи")
+
+    async def _run(self) -> None:
+        while True:
+            if self._failures:
+                # База не принимает запись: пауза растет, наполнение буфера ее не сокращает
+                await asyncio.sleep(min(self.flush_interval * 2 ** self._failures, self.retry_max_delay))
+            else:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def close(self) -> None:
+        """Останавливает фоновую задачу и дописывает всё, что осталось в буфере."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
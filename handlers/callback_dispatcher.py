@@ -0,0 +1,100 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from aiogram import Router
+from aiogram.dispatcher.event.handler import CallableObject
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.types import CallbackQuery
+
+from keyboards.callback_data import Cb, unpack
+
+StateLike = Union[State, Type[StatesGroup]]
+
+
+@dataclass
+class CallbackRoute:
+    handler: CallableObject
+    states: Tuple[StateLike, ...] = ()
+    fields: Tuple[str, ...] = ()
+    flags: Dict[str, Any] = field(default_factory=dict)
+
+    def matches_state(self, raw_state: Optional[str]) -> bool:
+        if not self.states:
+            return True
+        for state in self.states:
+            if isinstance(state, State):
+                if state.state == raw_state:
+                    return True
+            elif raw_state in state:
+                return True
+        return False
+
+
+class CallbackDispatcher:
+    """
+    Маршрутизация callback-запросов по префиксу callback_data за O(1).
+
+    Вместо десятков хэндлеров с F.data.startswith(...), которые aiogram
+    проверяет по очереди, в роутере регистрируется один хэндлер. Он разбирает
+    callback_data один раз, находит маршруты по префиксу в словаре и
+    передает хэндлеру уже распарсенные аргументы как именованные параметры.
+    Callback без маршрута получает хэндлер из fallback(), если он задан.
+    """
+
+    def __init__(self):
+        self._routes: Dict[str, List[CallbackRoute]] = defaultdict(list)
+        self._fallback: Optional[Callable] = None
+
+    def register(self, prefix: Cb, *states: StateLike, fields: Tuple[str, ...] = (),
+                 **flags: Any) -> Callable:
+        """
+        Декоратор. states работают как StateFilter: без состояний маршрут
+        срабатывает в любом состоянии. fields — имена целочисленных аргументов
+        из callback_data, которые будут переданы хэндлеру.
+        """
+        def decorator(callback: Callable) -> Callable:
+            self._routes[prefix.value].append(
+                CallbackRoute(CallableObject(callback), tuple(states), tuple(fields), flags)
+            )
+            return callback
+        return decorator
+
+    def fallback(self, callback: Callable) -> Callable:
+        """
+        Декоратор: хэндлер для callback_data, которой не нашлось маршрута, —
+        кнопки старого формата в уже отправленных сообщениях или кнопки из
+        другого состояния. Без него такой callback остается без ответа.
+        """
+        self._fallback = callback
+        return callback
+
+    def resolve(self, data: Optional[str], raw_state: Optional[str]) -> Optional[Tuple[CallbackRoute, Dict[str, int]]]:
+        if not data:
+            return None
+        parsed = unpack(data)
+        if parsed is None:
+            return None
+        prefix, args = parsed
+        for route in self._routes.get(prefix, ()):
+            if len(args) == len(route.fields) and route.matches_state(raw_state):
+                return route, dict(zip(route.fields, args))
+        return None
+
+    async def _filter(self, callback: CallbackQuery, raw_state: Optional[str] = None) -> Union[bool, Dict[str, Any]]:
+        resolved = self.resolve(callback.data, raw_state)
+        if resolved is None:
+            return False
+        route, args = resolved
+        return {"callback_route": route, "callback_args": args}
+
+    async def _handle(self, callback: CallbackQuery, callback_route: CallbackRoute,
+                      callback_args: Dict[str, int], **kwargs: Any) -> Any:
+        return await callback_route.handler.call(callback, **kwargs, **callback_args)
+
+    def attach(self, router: Router) -> None:
+        """Регистрирует диспетчер в роутере как единственный callback-хэндлер (плюс fallback)."""
+        router.callback_query.register(self._handle, self._filter)
+        if self._fallback is not None:
+            router.callback_query.register(self._fallback)
+
@@ -1,52 +1,67 @@
 import datetime
+import html
 from datetime import timedelta
-from aiogram import Router, F, Bot
+from typing import Optional
+from aiogram import Router, Bot
 from aiogram.filters import Command, CommandStart, StateFilter
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, FSInputFile, InlineKeyboardMarkup
 from aiogram.fsm.context import FSMContext
 from collections import defaultdict
 
 from config import Config
-from lexicon import LEXICON_RU
+from lexicon import LEXICON, LEXICON_RU, Lexicon
 from utils.timezone import naive_now, parse_datetime_naive
+from utils.users import display_username
+from utils.edit_dedup import edit_text, edit_reply_markup
+from utils.outbound import Lane, outbound_lane
+from utils.points_table import parse_points_table
+from utils.file_stream import stream_document, sniff_csv_delimiter
 from keyboards import (
     main_menu_keyboard, pickteam_positions_keyboard,
     create_players_keyboard, create_remove_players_keyboard,
-    admin_main_menu_keyboard, admin_matches_to_score_keyboard,
-    admin_player_management_keyboard, create_players_list_keyboard,
+    admin_main_menu_keyboard, admin_player_management_keyboard,
     create_positions_selection_keyboard, admin_match_management_keyboard,
-    create_matches_list_keyboard, admin_confirm_delete_keyboard,
+    admin_confirm_delete_keyboard, ListPage, PagedList, cancel_footer,
     admin_confirm_delete_all_players_keyboard, match_results_keyboard,
-    match_details_keyboard, notifications_keyboard, admin_confirm_notification_keyboard
+    match_details_keyboard, notifications_keyboard, admin_confirm_notification_keyboard,
+    admin_confirm_points_keyboard, leaderboard_keyboard, season_history_keyboard,
+    Cb, position_key as get_position_key
 )
 from database import Database
+from services import export_to_gzip_files
 from states import PickTeamStates, AdminStates
+from .callback_dispatcher import CallbackDispatcher
 
 router = Router()
+callbacks = CallbackDispatcher()
 
 
-async def send_main_menu(message: Message, text: str = LEXICON_RU["welcome"]):
+async def send_main_menu(message: Message, lexicon: Lexicon = LEXICON, text: Optional[str] = None):
     print(f"DEBUG: send_main_menu called for user {message.from_user.id}")
-    await message.answer(text=text, reply_markup=main_menu_keyboard())
+    await message.answer(text=text or lexicon["welcome"], reply_markup=main_menu_keyboard(lexicon))
 
 
-def format_timedelta(td: timedelta) -> str:
+def format_timedelta(td: timedelta, lexicon: Lexicon = LEXICON) -> str:
     days = td.days
     hours = td.seconds // 3600
     minutes = (td.seconds % 3600) // 60
     parts = []
     if days > 0:
-        parts.append(f"{days} д.")
+        parts.append(lexicon.templates["duration_days"](days))
     if hours > 0:
-        parts.append(f"{hours} ч.")
+        parts.append(lexicon.templates["duration_hours"](hours))
     if minutes > 0:
-        parts.append(f"{minutes} мин.")
-    return " ".join(parts) if parts else "менее минуты"
+        parts.append(lexicon.templates["duration_minutes"](minutes))
+    return " ".join(parts) if parts else lexicon["duration_less_than_minute"]
 
 
-async def get_team_display_text(player_ids: list, db: Database) -> str:
+def position_name(position_key: str, lexicon: Lexicon = LEXICON) -> str:
+    return lexicon.get(f"position_{position_key}") or Config.POSITIONS.get(position_key, position_key.capitalize())
+
+
+async def get_team_display_text(player_ids: list, db: Database, lexicon: Lexicon = LEXICON) -> str:
     if not player_ids:
-        return "Ваш состав пуст."
+        return lexicon["team_empty"]
 
     async with db.pool.acquire() as conn:
         players = await conn.fetch(
@@ -63,73 +78,70 @@ async def get_team_display_text(player_ids: list, db: Database) -> str:
     for player in players:
         grouped_players[player['position']].append(player['name'])
 
-    display_text_parts = ["Ваш текущий состав:"]
+    display_text_parts = [lexicon["team_current_header"]]
 
     position_keys_ordered = ["goalkeeper", "defender", "midfielder", "forward"]
 
     for position_key in position_keys_ordered:
         if grouped_players[position_key]:
-            position_display_name = Config.POSITIONS.get(position_key, position_key.capitalize())
-            display_text_parts.append(f"\n{position_display_name}:")
+            display_text_parts.append(f"\n{position_name(position_key, lexicon)}:")
             for player_name in grouped_players[position_key]:
                 display_text_parts.append(f"• {player_name}")
 
     return "\n".join(display_text_parts)
 
 
-@router.message(CommandStart())
-async def cmd_start(message: Message, db: Database):
+@router.message(CommandStart(), flags={"critical": True})
+async def cmd_start(message: Message, lexicon: Lexicon, db: Database):
     print(f"DEBUG: cmd_start called for user {message.from_user.id}")
-    user = await db.register_user(message.from_user.id, message.from_user.username or f"user_{message.from_user.id}")
+    user = await db.register_user(message.from_user.id, display_username(message.from_user))
     if user:
-        await send_main_menu(message, LEXICON_RU["welcome"])
+        await send_main_menu(message, lexicon)
     else:
-        await message.answer(LEXICON_RU["error_general"])
+        await message.answer(lexicon["error_general"])
 
 
-@router.callback_query(F.data == "back_to_main_menu")
-async def back_to_main_menu_handler(callback: CallbackQuery, state: FSMContext, db: Database):
+@callbacks.register(Cb.MAIN_MENU)
+async def back_to_main_menu_handler(callback: CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database):
     # Логика сохранения последнего состава при выходе из PickTeamStates
     current_state = await state.get_state()
     if current_state and current_state.startswith("PickTeamStates"):
         data = await state.get_data()
         selected_players_ids: list = data.get("selected_players", [])
-        user_id = (await db.get_user(callback.from_user.id))['id']
+        user_id = await db.get_user_id(callback.from_user.id)
         if selected_players_ids:
-            await db.save_last_selected_team(user_id, selected_players_ids)
+            await db.queue_last_selected_team(user_id, selected_players_ids)
 
     await state.clear()
-    await callback.message.edit_text(LEXICON_RU["welcome"], reply_markup=main_menu_keyboard())
+    await edit_text(callback.message, lexicon["welcome"], reply_markup=main_menu_keyboard(lexicon))
     await callback.answer()
 
 
 @router.message(Command("pickteam"))
-@router.callback_query(F.data == "pickteam")
-async def cmd_pickteam(event: Message | CallbackQuery, state: FSMContext, db: Database):
-    chat_id = event.from_user.id
-    user_data = await db.get_user(chat_id)
-    user_id = user_data['id']
+@callbacks.register(Cb.PICKTEAM, manual_answer=True)
+async def cmd_pickteam(event: Message | CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database):
+    context = await db.get_pickteam_context(event.from_user.id)
+    if not context:
+        await event.answer(lexicon["error_general"])
+        return
 
-    next_match = await db.get_next_match()
-    if not next_match:
-        await event.answer(LEXICON_RU["no_upcoming_matches"])
+    if not context['match_id']:
+        await event.answer(lexicon["no_upcoming_matches"])
         return
 
-    match_id = next_match['id']
-    deadline = next_match['match_datetime'] - timedelta(minutes=30)
+    match_id = context['match_id']
 
-    if datetime.datetime.now() > deadline:
-        await event.answer(LEXICON_RU["deadline_passed"],
+    if context['deadline_passed']:
+        await event.answer(lexicon["deadline_passed"],
                            show_alert=True if isinstance(event, CallbackQuery) else False)
         if isinstance(event, CallbackQuery):
-            await event.message.edit_reply_markup(reply_markup=None)
+            await edit_reply_markup(event.message, reply_markup=None)
         return
 
-    current_team = await db.get_user_team(user_id, match_id)
-    player_ids = current_team['player_ids'] if current_team else []
+    player_ids = context['player_ids'] or []
 
     if not player_ids:
-        player_ids = user_data.get('last_selected_team_ids', [])
+        player_ids = context['last_selected_team_ids'] or []
 
     await state.set_state(PickTeamStates.choosing_position)
     await state.update_data(
@@ -138,109 +150,106 @@ async def cmd_pickteam(event: Message | CallbackQuery, state: FSMContext, db: Da
     )
 
     selected_count = len(player_ids)
-    text = LEXICON_RU["pickteam_intro"] + f"\n{LEXICON_RU['picked_players_count'].format(selected_count)}"
-    text += "\n\n" + await get_team_display_text(player_ids, db)
+    text = lexicon["pickteam_intro"] + "\n" + lexicon.templates["picked_players_count"](selected_count)
+    text += "\n\n" + await get_team_display_text(player_ids, db, lexicon)
 
     if isinstance(event, Message):
-        await event.answer(text=text, reply_markup=pickteam_positions_keyboard(selected_count))
+        await event.answer(text=text, reply_markup=pickteam_positions_keyboard(selected_count, lexicon))
     elif isinstance(event, CallbackQuery):
-        await event.message.edit_text(text=text, reply_markup=pickteam_positions_keyboard(selected_count))
+        await edit_text(event.message, text=text, reply_markup=pickteam_positions_keyboard(selected_count, lexicon))
         await event.answer()
 
 
-@router.callback_query(F.data == "back_to_pickteam", StateFilter(PickTeamStates.choosing_player))
-async def back_to_pickteam_from_players(callback: CallbackQuery, state: FSMContext, db: Database):
+@callbacks.register(Cb.BACK_TO_PICKTEAM, PickTeamStates.choosing_player)
+async def back_to_pickteam_from_players(callback: CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database):
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
 
     selected_count = len(selected_players_ids)
-    text = LEXICON_RU["pickteam_intro"] + f"\n{LEXICON_RU['picked_players_count'].format(selected_count)}"
-    text += "\n\n" + await get_team_display_text(selected_players_ids, db)
+    text = lexicon["pickteam_intro"] + "\n" + lexicon.templates["picked_players_count"](selected_count)
+    text += "\n\n" + await get_team_display_text(selected_players_ids, db, lexicon)
 
     await state.set_state(PickTeamStates.choosing_position)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=pickteam_positions_keyboard(selected_count)
+        reply_markup=pickteam_positions_keyboard(selected_count, lexicon)
     )
     await callback.answer()
 
 
 @router.message(Command("myteam"))
-@router.callback_query(F.data == "myteam")
-async def cmd_myteam(event: Message | CallbackQuery, db: Database):
-    chat_id = event.from_user.id
-    user_id = (await db.get_user(chat_id))['id']
+@callbacks.register(Cb.MYTEAM, manual_answer=True)
+async def cmd_myteam(event: Message | CallbackQuery, lexicon: Lexicon, db: Database):
+    context = await db.get_pickteam_context(event.from_user.id)
+    if not context:
+        await event.answer(lexicon["error_general"])
+        return
 
-    next_match = await db.get_next_match()
-    if not next_match:
-        await event.answer(LEXICON_RU["no_upcoming_matches"])
+    if not context['match_id']:
+        await event.answer(lexicon["no_upcoming_matches"])
         return
 
-    match_id = next_match['id']
-    current_team = await db.get_user_team(user_id, match_id)
-    player_ids = current_team['player_ids'] if current_team else []
+    player_ids = context['player_ids'] or []
 
     if player_ids:
-        text = await get_team_display_text(player_ids, db)
+        text = await get_team_display_text(player_ids, db, lexicon)
     else:
-        text = LEXICON_RU["team_not_found"]
+        text = lexicon["team_not_found"]
 
     if isinstance(event, Message):
-        await event.answer(text=text, reply_markup=main_menu_keyboard())
+        await event.answer(text=text, reply_markup=main_menu_keyboard(lexicon))
     elif isinstance(event, CallbackQuery):
-        await event.message.edit_text(text=text, reply_markup=main_menu_keyboard())
+        await edit_text(event.message, text=text, reply_markup=main_menu_keyboard(lexicon))
         await event.answer()
 
 
-@router.message(Command("schedule"))
-@router.callback_query(F.data == "schedule")
-async def cmd_schedule(event: Message | CallbackQuery, db: Database):
+@router.message(Command("schedule"), flags={"throttle_cost": 2, "read_screen": "shared"})
+@callbacks.register(Cb.SCHEDULE, throttle_cost=2, read_screen="shared")
+async def cmd_schedule(event: Message | CallbackQuery, lexicon: Lexicon, db: Database):
     next_match = await db.get_next_match()
     text = ""
 
     if next_match:
         match_dt = next_match['match_datetime']
-        deadline_dt = match_dt - timedelta(minutes=30)
+        deadline_dt = match_dt - timedelta(minutes=Config.TEAM_DEADLINE_MINUTES)
         now = naive_now()
 
         time_left = match_dt - now
         deadline_countdown = deadline_dt - now
 
-        text += LEXICON_RU["upcoming_match_info"].format(
+        text += lexicon.templates["upcoming_match_info"](
             opponent=next_match['opponent'],
             date=match_dt.strftime("%d.%m.%Y"),
             time=match_dt.strftime("%H:%M"),
-            time_left=format_timedelta(time_left),
+            time_left=format_timedelta(time_left, lexicon),
             deadline_time=deadline_dt.strftime("%d.%m.%Y %H:%M"),
-            deadline_countdown=format_timedelta(deadline_countdown)
+            deadline_countdown=format_timedelta(deadline_countdown, lexicon)
         )
     else:
-        text += LEXICON_RU["no_upcoming_matches"]
+        text += lexicon["no_upcoming_matches"]
 
     matches_for_month = await db.get_matches_for_month()
     if matches_for_month:
-        text += LEXICON_RU["matches_for_month"]
+        text += lexicon["matches_for_month"]
+        match_entry = lexicon.template("match_entry")
         for match in matches_for_month:
             match_dt = match['match_datetime']
-            text += LEXICON_RU["match_entry"].format(
+            text += match_entry(
                 date=match_dt.strftime("%d.%m"),
                 opponent=match['opponent']
             ) + "\n"
 
     if isinstance(event, Message):
-        await event.answer(text=text, reply_markup=main_menu_keyboard())
+        await event.answer(text=text, reply_markup=main_menu_keyboard(lexicon))
     elif isinstance(event, CallbackQuery):
-        await event.message.edit_text(text=text, reply_markup=main_menu_keyboard())
+        await edit_text(event.message, text=text, reply_markup=main_menu_keyboard(lexicon))
         await event.answer()
 
 
-@router.callback_query(F.data == "match_results")
-@router.callback_query(F.data.startswith("match_results_page_"))
-async def cmd_match_results(callback: CallbackQuery, db: Database):
-    page = 0
-    if callback.data.startswith("match_results_page_"):
-        page = int(callback.data.split("_")[-1])
-
+@callbacks.register(Cb.MATCH_RESULTS, throttle_cost=2, read_screen="shared")
+@callbacks.register(Cb.MATCH_RESULTS, fields=("page",), throttle_cost=2, read_screen="shared")
+async def cmd_match_results(callback: CallbackQuery, lexicon: Lexicon, db: Database, page: int = 0):
     offset = page * Config.MATCHES_PER_PAGE
     limit = Config.MATCHES_PER_PAGE
 
@@ -248,35 +257,35 @@ async def cmd_match_results(callback: CallbackQuery, db: Database):
     matches = result["matches"]
     total_count = result["total_count"]
 
-    text = LEXICON_RU["finished_matches_header"]
+    text = lexicon["finished_matches_header"]
 
     if not matches:
-        text += "\n" + LEXICON_RU["no_finished_matches"]
+        text += "\n" + lexicon["no_finished_matches"]
     else:
-        text += "\nВыберите матч для просмотра деталей:"
+        text += "\n" + lexicon["finished_matches_choose"]
 
     total_pages = (total_count + Config.MATCHES_PER_PAGE - 1) // Config.MATCHES_PER_PAGE
 
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=match_results_keyboard(matches, page, total_pages)
+        reply_markup=match_results_keyboard(matches, page, total_pages, lexicon)
     )
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("match_details_"))
-async def cmd_match_details(callback: CallbackQuery, db: Database):
-    data_parts = callback.data.split("_")
-    match_id = int(data_parts[2])
-    current_page_from_callback = int(data_parts[3]) if len(data_parts) > 3 else 0
-    user_id = (await db.get_user(callback.from_user.id))['id']
+@callbacks.register(Cb.MATCH_DETAILS, fields=("match_id", "page"), manual_answer=True, throttle_cost=2,
+                    read_screen="personal")
+async def cmd_match_details(callback: CallbackQuery, lexicon: Lexicon, db: Database, match_id: int, page: int):
+    user_id = await db.get_user_id(callback.from_user.id)
 
-    match_details = await db.get_match_details(match_id)
+    match_details = await db.get_match_details(match_id, attached_only=True)
     if not match_details:
-        await callback.answer(LEXICON_RU["admin_match_not_found"], show_alert=True)
+        await callback.answer(lexicon["match_not_found"], show_alert=True)
         return
 
     player_data = await db.get_match_player_scores_and_user_teams(match_id, user_id)
+    pick_shares = await db.get_pick_shares(match_id)
     player_scores = player_data["player_scores"]
     user_team_player_ids = player_data["user_team_player_ids"]
 
@@ -284,7 +293,7 @@ async def cmd_match_details(callback: CallbackQuery, db: Database):
     time_str = match_details['match_datetime'].strftime("%H:%M")
 
     text_parts = [
-        LEXICON_RU["match_results_details_header"].format(
+        lexicon.templates["match_results_details_header"](
             opponent=match_details['opponent'], date=date_str, time=time_str
         ),
         "\n"
@@ -292,131 +301,191 @@ async def cmd_match_details(callback: CallbackQuery, db: Database):
 
     user_total_score = 0.0
     if player_scores:
-        text_parts.append("Очки игроков:")
+        text_parts.append(lexicon["match_player_scores_header"])
+        score_entry = lexicon.template("match_player_score_entry")
+        pick_share = lexicon.template("player_pick_share")
         for i, player in enumerate(player_scores):
             emoji = "🌟" if player['player_id'] in user_team_player_ids else ""
-            text_parts.append(
-                LEXICON_RU["match_player_score_entry"].format(
-                    i + 1,
-                    player_name=player['name'],
-                    points=round(player['points'], 2),
-                    emoji=emoji
-                )
+            entry = score_entry(
+                i + 1,
+                player_name=player['name'],
+                points=round(player['points'], 2),
+                emoji=emoji
             )
+            if pick_shares:
+                entry += pick_share(share=round(pick_shares.get(player['player_id'], 0)))
+            text_parts.append(entry)
             if player['player_id'] in user_team_player_ids:
                 user_total_score += player['points']
-        text_parts.append(f"\n{LEXICON_RU['match_total_user_score'].format(score=round(user_total_score, 2))}")
+        text_parts.append("\n" + lexicon.templates["match_total_user_score"](score=round(user_total_score, 2)))
     else:
-        text_parts.append("Нет данных по очкам игроков для этого матча.")
+        text_parts.append(lexicon["match_no_player_scores"])
         if user_team_player_ids:
             user_team_names = await db.get_player_names_from_ids(user_team_player_ids)
-            text_parts.append(f"Ваша команда на этот матч: {', '.join(user_team_names)}")
+            text_parts.append(lexicon.templates["match_user_team"](players=", ".join(user_team_names)))
         else:
-            text_parts.append(LEXICON_RU["match_no_team_selected"])
+            text_parts.append(lexicon["match_no_team_selected"])
 
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text="\n".join(text_parts),
-        reply_markup=match_details_keyboard(match_id, current_page_from_callback)
+        reply_markup=match_details_keyboard(match_id, page, lexicon)
     )
     await callback.answer()
 
 
-@router.callback_query(F.data == "leaderboard")
-async def cmd_leaderboard(event: Message | CallbackQuery, db: Database):
-    leaderboard_data = await db.get_leaderboard()
-    text = LEXICON_RU["leaderboard_header"]
-    if leaderboard_data:
-        for i, entry in enumerate(leaderboard_data):
-            text += LEXICON_RU["leaderboard_entry"].format(
-                i + 1,
+@router.message(Command("leaderboard"), flags={"throttle_cost": 2, "read_screen": "personal"})
+@callbacks.register(Cb.LEADERBOARD, throttle_cost=2, read_screen="personal")
+@callbacks.register(Cb.LEADERBOARD, fields=("cursor", "forward"), throttle_cost=2, read_screen="personal")
+async def cmd_leaderboard(event: Message | CallbackQuery, lexicon: Lexicon, db: Database,
+                          cursor: Optional[int] = None, forward: int = 1):
+    page = await db.get_leaderboard_page(cursor, bool(forward))
+    text = lexicon["leaderboard_header"]
+    if page["rows"]:
+        leaderboard_entry = lexicon.template("leaderboard_entry")
+        for entry in page["rows"]:
+            text += leaderboard_entry(
+                entry['rank'],
                 username=entry['username'],
                 score=round(entry['total_score'], 2)
             ) + "\n"
     else:
-        text += "Пока нет данных для общей таблицы лидеров."
+        text += lexicon["leaderboard_empty"]
+
+    user_id = await db.get_user_id(event.from_user.id)
+    standing = await db.get_user_standing(user_id) if user_id else None
+    if standing:
+        template = "leaderboard_my_position_approx" if standing['approximate'] else "leaderboard_my_position"
+        text += "\n" + lexicon.templates[template](
+            rank=standing['rank'], percentile=max(round(standing['percentile'], 1), 0.1),
+            score=round(standing['total_score'], 2)
+        )
 
+    rows = page["rows"]
+    reply_markup = leaderboard_keyboard(
+        rows[0]['id'] if rows else 0, rows[-1]['id'] if rows else 0, page["has_prev"], page["has_next"], lexicon
+    )
     if isinstance(event, Message):
-        await event.answer(text=text, reply_markup=main_menu_keyboard())
+        await event.answer(text=text, reply_markup=reply_markup)
     elif isinstance(event, CallbackQuery):
-        await event.message.edit_text(text=text, reply_markup=main_menu_keyboard())
+        await edit_text(event.message, text=text, reply_markup=reply_markup)
         await event.answer()
 
 
-@router.callback_query(F.data == "weekly_leaderboard")
-async def cmd_weekly_leaderboard(callback: CallbackQuery, db: Database):
+@router.message(Command("season"), flags={"throttle_cost": 2, "read_screen": "personal"})
+@callbacks.register(Cb.SEASON_HISTORY, throttle_cost=2, read_screen="personal")
+@callbacks.register(Cb.SEASON_HISTORY, fields=("cursor", "forward"), throttle_cost=2, read_screen="personal")
+async def cmd_season_history(event: Message | CallbackQuery, lexicon: Lexicon, db: Database,
+                             cursor: Optional[int] = None, forward: int = 1):
+    user_id = await db.get_user_id(event.from_user.id)
+    page = await db.get_season_history_page(user_id, cursor, bool(forward)) if user_id else None
+    rows = page["rows"] if page else []
+
+    text = lexicon["season_history_header"]
+    if rows:
+        season_entry = lexicon.template("season_history_entry")
+        for row in rows:
+            text += season_entry(
+                date=row['match_datetime'].strftime("%d.%m"),
+                opponent=row['opponent'],
+                score=round(row['score'], 2),
+                total=round(row['running_total'], 2)
+            ) + "\n"
+    else:
+        text += lexicon["season_history_empty"]
+
+    reply_markup = season_history_keyboard(
+        rows[0]['match_id'] if rows else 0, rows[-1]['match_id'] if rows else 0,
+        bool(page and page["has_prev"]), bool(page and page["has_next"]), lexicon
+    )
+    if isinstance(event, Message):
+        await event.answer(text=text, reply_markup=reply_markup)
+    elif isinstance(event, CallbackQuery):
+        await edit_text(event.message, text=text, reply_markup=reply_markup)
+        await event.answer()
+
+
+@callbacks.register(Cb.WEEKLY_LEADERBOARD, throttle_cost=3, read_screen="shared")
+async def cmd_weekly_leaderboard(callback: CallbackQuery, lexicon: Lexicon, db: Database):
     leaderboard_data = await db.get_weekly_leaderboard()
-    text = LEXICON_RU["weekly_leaderboard_header"]
+    text = lexicon["weekly_leaderboard_header"]
     if leaderboard_data:
+        leaderboard_entry = lexicon.template("leaderboard_entry")
         for i, entry in enumerate(leaderboard_data):
-            text += LEXICON_RU["leaderboard_entry"].format(
+            text += leaderboard_entry(
                 i + 1,
                 username=entry['username'],
                 score=round(entry['weekly_score'], 2)
             ) + "\n"
     else:
-        text += "Пока нет данных для недельного рейтинга."
+        text += lexicon["weekly_leaderboard_empty"]
 
-    await callback.message.edit_text(text=text, reply_markup=main_menu_keyboard())
+    await edit_text(callback.message, text=text, reply_markup=main_menu_keyboard(lexicon))
     await callback.answer()
 
 
-@router.message(Command("resetteam"))
-@router.callback_query(F.data == "resetteam")
-async def cmd_resetteam(event: Message | CallbackQuery, db: Database):
-    chat_id = event.from_user.id
-    user_id = (await db.get_user(chat_id))['id']
-
-    next_match = await db.get_next_match()
-    if not next_match:
-        await event.answer(LEXICON_RU["no_upcoming_matches"])
+@router.message(Command("resetteam"), flags={"critical": True})
+@callbacks.register(Cb.RESETTEAM, manual_answer=True, critical=True)
+async def cmd_resetteam(event: Message | CallbackQuery, lexicon: Lexicon, db: Database):
+    context = await db.get_pickteam_context(event.from_user.id)
+    if not context:
+        await event.answer(lexicon["error_general"])
         return
 
-    match_id = next_match['id']
-    deadline = next_match['match_datetime'] - timedelta(minutes=30)
+    if not context['match_id']:
+        await event.answer(lexicon["no_upcoming_matches"])
+        return
 
-    if naive_now() > deadline:
-        await event.answer(LEXICON_RU["deadline_passed"],
+    if context['deadline_passed']:
+        await event.answer(lexicon["deadline_passed"],
                            show_alert=True if isinstance(event, CallbackQuery) else False)
         if isinstance(event, CallbackQuery):
-            await event.message.edit_reply_markup(reply_markup=None)
+            await edit_reply_markup(event.message, reply_markup=None)
         return
 
-    user_team = await db.get_user_team(user_id, match_id)
-    if user_team:
-        await db.delete_user_team(user_id, match_id)
-        text = LEXICON_RU["resetteam_success"]
+    if context['player_ids'] is not None and await db.delete_user_team(context['user_id'], context['match_id']):
+        text = lexicon["resetteam_success"]
     else:
-        text = LEXICON_RU["resetteam_no_team"]
+        text = lexicon["resetteam_no_team"]
 
     if isinstance(event, Message):
-        await event.answer(text=text, reply_markup=main_menu_keyboard())
+        await event.answer(text=text, reply_markup=main_menu_keyboard(lexicon))
     elif isinstance(event, CallbackQuery):
-        await event.message.edit_text(text=text, reply_markup=main_menu_keyboard())
+        await edit_text(event.message, text=text, reply_markup=main_menu_keyboard(lexicon))
         await event.answer()
 
 
-@router.callback_query(F.data.startswith("select_position_"), StateFilter(PickTeamStates.choosing_position))
-async def process_position_selection(callback: CallbackQuery, state: FSMContext, db: Database):
-    position_key = callback.data.split("_")[-1]
+@callbacks.register(Cb.SELECT_POSITION, PickTeamStates.choosing_position, fields=("position",), manual_answer=True)
+async def process_position_selection(callback: CallbackQuery, lexicon: Lexicon,
+                                     state: FSMContext, db: Database, position: int):
+    position_key = get_position_key(position)
+    if not position_key:
+        await callback.answer(lexicon["error_general"], show_alert=True)
+        return
+    # alert нужен только при ошибке выше, дальше отвечаем сразу, до работы с БД
+    await callback.answer()
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
 
     players_by_position = await db.get_players_by_position(position_key)
+    match_id = data.get("match_id")
+    pick_shares = await db.get_pick_shares(match_id) if match_id else None
 
     await state.set_state(PickTeamStates.choosing_player)
     await state.update_data(current_position_players=players_by_position)
 
-    text = f"{Config.POSITIONS[position_key]}\n\n" + await get_team_display_text(selected_players_ids, db)
-    await callback.message.edit_text(
+    team_text = await get_team_display_text(selected_players_ids, db, lexicon)
+    text = f"{position_name(position_key, lexicon)}\n\n{team_text}"
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=create_players_keyboard(players_by_position, selected_players_ids)
+        reply_markup=create_players_keyboard(players_by_position, selected_players_ids, pick_shares, lexicon)
     )
-    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("player_select_"), StateFilter(PickTeamStates.choosing_player))
-async def process_player_selection(callback: CallbackQuery, state: FSMContext, db: Database):
-    player_id = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.PLAYER_SELECT, PickTeamStates.choosing_player, fields=("player_id",), manual_answer=True)
+async def process_player_selection(callback: CallbackQuery, lexicon: Lexicon,
+                                   state: FSMContext, db: Database, player_id: int):
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
 
@@ -426,47 +495,51 @@ async def process_player_selection(callback: CallbackQuery, state: FSMContext, d
         if len(selected_players_ids) < 5:
             selected_players_ids.append(player_id)
         else:
-            await callback.answer("Вы можете выбрать не более 5 игроков.", show_alert=True)
+            await callback.answer(lexicon["pickteam_max_players_error"], show_alert=True)
             return
 
     await state.update_data(selected_players=selected_players_ids)
+    await callback.answer()
 
     selected_count = len(selected_players_ids)
-    text = LEXICON_RU["pickteam_intro"] + f"\n{LEXICON_RU['picked_players_count'].format(selected_count)}"
-    text += "\n\n" + await get_team_display_text(selected_players_ids, db)
+    text = lexicon["pickteam_intro"] + "\n" + lexicon.templates["picked_players_count"](selected_count)
+    text += "\n\n" + await get_team_display_text(selected_players_ids, db, lexicon)
 
     await state.set_state(PickTeamStates.choosing_position)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=pickteam_positions_keyboard(selected_count)
+        reply_markup=pickteam_positions_keyboard(selected_count, lexicon)
     )
-    await callback.answer()
 
 
-@router.callback_query(F.data == "remove_player", StateFilter(PickTeamStates.choosing_position))
-async def process_remove_player_request(callback: CallbackQuery, state: FSMContext, db: Database):
+@callbacks.register(Cb.REMOVE_PLAYER, PickTeamStates.choosing_position, manual_answer=True)
+async def process_remove_player_request(callback: CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database):
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
 
     if not selected_players_ids:
-        await callback.answer(LEXICON_RU["pickteam_no_players_to_remove"], show_alert=True)
+        await callback.answer(lexicon["pickteam_no_players_to_remove"], show_alert=True)
         return
+    await callback.answer()
 
     all_players = await db.get_all_players_sorted()
     player_names_map = {p['id']: p['name'] for p in all_players}
-    players_to_remove = [(p_id, player_names_map.get(p_id, "Неизвестный игрок")) for p_id in selected_players_ids]
+    unknown_player = lexicon["pickteam_unknown_player"]
+    players_to_remove = [(p_id, player_names_map.get(p_id, unknown_player)) for p_id in selected_players_ids]
 
     await state.set_state(PickTeamStates.removing_player)
-    await callback.message.edit_text(
-        text=LEXICON_RU["pickteam_choose_player_to_remove"],
-        reply_markup=create_remove_players_keyboard(players_to_remove)
+    await edit_text(
+        callback.message,
+        text=lexicon["pickteam_choose_player_to_remove"],
+        reply_markup=create_remove_players_keyboard(players_to_remove, lexicon)
     )
-    await callback.answer()
 
 
-@router.callback_query(F.data.startswith("player_remove_"), StateFilter(PickTeamStates.removing_player))
-async def process_player_removal(callback: CallbackQuery, state: FSMContext, db: Database):
-    player_id_to_remove = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.PLAYER_REMOVE, PickTeamStates.removing_player,
+                    fields=("player_id_to_remove",), manual_answer=True)
+async def process_player_removal(callback: CallbackQuery, lexicon: Lexicon,
+                                 state: FSMContext, db: Database, player_id_to_remove: int):
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
 
@@ -474,60 +547,107 @@ async def process_player_removal(callback: CallbackQuery, state: FSMContext, db:
         selected_players_ids.remove(player_id_to_remove)
         await state.update_data(selected_players=selected_players_ids)
         removed_player_info = await db.get_player_by_id(player_id_to_remove)
-        player_name = removed_player_info['name'] if removed_player_info else "игрок"
-        await callback.answer(LEXICON_RU["pickteam_removed_player"].format(player_name))
+        player_name = removed_player_info['name'] if removed_player_info else lexicon["pickteam_removed_player_unknown"]
+        await callback.answer(lexicon.templates["pickteam_removed_player"](player_name))
     else:
-        await callback.answer("Этого игрока нет в вашем составе.", show_alert=True)
+        await callback.answer(lexicon["pickteam_player_not_in_team"], show_alert=True)
 
     selected_count = len(selected_players_ids)
-    text = LEXICON_RU["pickteam_intro"] + f"\n{LEXICON_RU['picked_players_count'].format(selected_count)}"
-    text += "\n\n" + await get_team_display_text(selected_players_ids, db)
+    text = lexicon["pickteam_intro"] + "\n" + lexicon.templates["picked_players_count"](selected_count)
+    text += "\n\n" + await get_team_display_text(selected_players_ids, db, lexicon)
 
     await state.set_state(PickTeamStates.choosing_position)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=pickteam_positions_keyboard(selected_count)
+        reply_markup=pickteam_positions_keyboard(selected_count, lexicon)
     )
 
 
-@router.callback_query(F.data == "cancel_remove_player", StateFilter(PickTeamStates.removing_player))
-async def cancel_player_removal(callback: CallbackQuery, state: FSMContext, db: Database):
+@callbacks.register(Cb.CANCEL_REMOVE_PLAYER, PickTeamStates.removing_player, manual_answer=True)
+async def cancel_player_removal(callback: CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database):
+    await callback.answer(lexicon["pickteam_remove_cancelled"])
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
     selected_count = len(selected_players_ids)
-    text = LEXICON_RU["pickteam_intro"] + f"\n{LEXICON_RU['picked_players_count'].format(selected_count)}"
-    text += "\n\n" + await get_team_display_text(selected_players_ids, db)
+    text = lexicon["pickteam_intro"] + "\n" + lexicon.templates["picked_players_count"](selected_count)
+    text += "\n\n" + await get_team_display_text(selected_players_ids, db, lexicon)
 
     await state.set_state(PickTeamStates.choosing_position)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=pickteam_positions_keyboard(selected_count)
+        reply_markup=pickteam_positions_keyboard(selected_count, lexicon)
     )
-    await callback.answer("Отмена удаления игрока.")
 
 
-@router.callback_query(F.data == "confirm_team", StateFilter(PickTeamStates.choosing_position))
-async def process_confirm_team(callback: CallbackQuery, state: FSMContext, db: Database):
+@callbacks.register(Cb.CONFIRM_TEAM, PickTeamStates.choosing_position, manual_answer=True, critical=True)
+async def process_confirm_team(callback: CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database):
     data = await state.get_data()
     selected_players_ids: list = data.get("selected_players", [])
     match_id = data.get("match_id")
-    chat_id = callback.from_user.id
-    user_id = (await db.get_user(chat_id))['id']
+    user_id = await db.get_user_id(callback.from_user.id)
 
     if len(selected_players_ids) != 5:
-        await callback.answer(LEXICON_RU["pickteam_not_5_players_error"], show_alert=True)
+        await callback.answer(lexicon["pickteam_not_5_players_error"], show_alert=True)
         return
 
-    await db.save_user_team(user_id, match_id, selected_players_ids)
-    await db.save_last_selected_team(user_id, selected_players_ids)
+    if not await db.save_user_team(user_id, match_id, selected_players_ids):
+        await callback.answer(lexicon["deadline_passed"], show_alert=True)
+        return
+    await db.queue_last_selected_team(user_id, selected_players_ids)
     await state.clear()
 
-    text = LEXICON_RU["team_picked_success"] + "\n\n" + await get_team_display_text(selected_players_ids, db)
-    await callback.message.edit_text(text=text, reply_markup=main_menu_keyboard())
-    await callback.answer("Состав сохранен!")
+    text = lexicon["team_picked_success"] + "\n\n" + await get_team_display_text(selected_players_ids, db, lexicon)
+    await edit_text(callback.message, text=text, reply_markup=main_menu_keyboard(lexicon))
+    await callback.answer(lexicon["team_saved_alert"])
+
+
+def player_button_text(player: dict) -> str:
+    return f"{player['name']} ({Config.POSITIONS.get(player['position'], player['position'])})"
+
+
+def player_line_text(player: dict) -> str:
+    return LEXICON_RU["admin_player_entry_view"].format(
+        id=player['id'],
+        name=player['name'],
+        position=Config.POSITIONS.get(player['position'], player['position'])
+    )
 
 
-@router.message(Command("admin"))
+def match_button_text(match: dict) -> str:
+    return f"{match['match_datetime'].strftime('%d.%m.%Y %H:%M')} - {match['opponent']}"
+
+
+def player_management_footer():
+    return admin_player_management_keyboard().inline_keyboard
+
+
+# Постраничные списки админки; номер списка попадает в callback_data перелистывания
+ADMIN_PLAYERS_VIEW = PagedList(1, "players", lambda db: db.get_all_players_sorted(),
+                               line_text=player_line_text, footer=player_management_footer)
+ADMIN_PLAYERS_TO_EDIT = PagedList(2, "players", lambda db: db.get_all_players_sorted(),
+                                  button_text=player_button_text, item_callback=Cb.ADMIN_EDIT_PLAYER_SELECTED)
+ADMIN_PLAYERS_TO_DELETE = PagedList(3, "players", lambda db: db.get_all_players_sorted(),
+                                    button_text=player_button_text, item_callback=Cb.ADMIN_DELETE_PLAYER_SELECTED)
+ADMIN_PLAYERS_TO_CORRECT = PagedList(4, "players", lambda db: db.get_all_players_sorted(),
+                                     button_text=player_button_text, item_callback=Cb.ADMIN_CORRECT_PLAYER_SELECTED)
+ADMIN_MATCHES_TO_EDIT = PagedList(5, "matches", lambda db: db.get_upcoming_matches(),
+                                  button_text=match_button_text, item_callback=Cb.ADMIN_EDIT_MATCH_SELECTED)
+ADMIN_MATCHES_TO_SCORE = PagedList(6, "matches", lambda db: db.get_finished_unscored_matches(),
+                                   button_text=match_button_text, item_callback=Cb.ADMIN_SCORE_MATCH_SELECTED)
+ADMIN_MATCHES_TO_CORRECT = PagedList(7, "matches", lambda db: db.get_scored_matches(Config.CORRECTABLE_MATCHES_LIMIT),
+                                     button_text=match_button_text, item_callback=Cb.ADMIN_CORRECT_MATCH_SELECTED)
+
+
+async def show_admin_list(callback: CallbackQuery, state: FSMContext, list_page: ListPage, header: str):
+    """Показывает страницу списка; заголовок запоминается для перелистывания."""
+    await state.update_data(admin_list_header=header)
+    text = f"{header}\n\n{list_page.text}" if list_page.text else header
+    await edit_text(callback.message, text, reply_markup=list_page.reply_markup)
+
+
+@router.message(Command("admin"), flags={"critical": True})
 async def cmd_admin(message: Message, state: FSMContext):
     # if message.from_user.id != Config.ADMIN_ID:
     #     await message.answer(LEXICON_RU["admin_unknown_command"])
@@ -549,69 +669,97 @@ async def process_admin_password(message: Message, state: FSMContext, db: Databa
         await message.answer(LEXICON_RU["admin_wrong_password"])
 
 
-@router.callback_query(F.data == "admin_back_to_main_menu", StateFilter(AdminStates))
+@callbacks.register(Cb.ADMIN_MENU, AdminStates)
 async def admin_back_to_main_menu_callback(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.admin_menu)
-    await callback.message.edit_text(LEXICON_RU["admin_panel_menu"], reply_markup=admin_main_menu_keyboard())
+    await edit_text(callback.message, LEXICON_RU["admin_panel_menu"], reply_markup=admin_main_menu_keyboard())
+    await callback.answer()
+
+
+@callbacks.register(Cb.ADMIN_LIST_PAGE, AdminStates, fields=("list_id", "page"))
+async def admin_list_page(callback: CallbackQuery, state: FSMContext, db: Database, list_id: int, page: int):
+    paged_list = PagedList.get(list_id)
+    if paged_list is None:
+        await callback.answer()
+        return
+    data = await state.get_data()
+    await show_admin_list(callback, state, await paged_list.page(db, page), data.get("admin_list_header", ""))
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_manage_players", StateFilter(AdminStates.admin_menu))
+@callbacks.register(Cb.ADMIN_MANAGE_PLAYERS, AdminStates.admin_menu)
 async def admin_manage_players_menu(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.managing_players)
-    await callback.message.edit_text(LEXICON_RU["admin_player_management_menu"],
-                                     reply_markup=admin_player_management_keyboard())
+    await edit_text(callback.message, LEXICON_RU["admin_player_management_menu"],
+                    reply_markup=admin_player_management_keyboard())
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_view_players", StateFilter(AdminStates.managing_players))
-async def admin_view_players(callback: CallbackQuery, db: Database):
-    all_players = await db.get_all_players_sorted()
-    text = LEXICON_RU["admin_view_all_players_header"] + "\n\n"
-    if all_players:
-        for player in all_players:
-            text += LEXICON_RU["admin_player_entry_view"].format(
-                id=player['id'],
-                name=player['name'],
-                position=Config.POSITIONS.get(player['position'], player['position'])
-            ) + "\n"
+@callbacks.register(Cb.ADMIN_VIEW_PLAYERS, AdminStates.managing_players)
+async def admin_view_players(callback: CallbackQuery, state: FSMContext, db: Database):
+    list_page = await ADMIN_PLAYERS_VIEW.page(db)
+    if list_page.empty:
+        await edit_text(callback.message, LEXICON_RU["admin_view_all_players_header"] + "\n\n" +
+                        LEXICON_RU["admin_no_players_found"], reply_markup=admin_player_management_keyboard())
     else:
-        text += LEXICON_RU["admin_no_players_found"]
-
-    await callback.message.edit_text(text, reply_markup=admin_player_management_keyboard())
+        await show_admin_list(callback, state, list_page, LEXICON_RU["admin_view_all_players_header"])
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_remove_all_players", StateFilter(AdminStates.managing_players))
+@callbacks.register(Cb.ADMIN_REMOVE_ALL_PLAYERS, AdminStates.managing_players)
 async def admin_remove_all_players_confirm(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.confirming_delete_all_players)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         LEXICON_RU["admin_confirm_remove_all_players"],
         reply_markup=admin_confirm_delete_all_players_keyboard()
     )
     await callback.answer()
 
 
-@router.callback_query(F.data == "confirm_delete_all_players_yes",
-                       StateFilter(AdminStates.confirming_delete_all_players))
+@callbacks.register(Cb.ADMIN_REMOVE_ALL_PLAYERS_CONFIRM, AdminStates.confirming_delete_all_players)
 async def admin_execute_remove_all_players(callback: CallbackQuery, state: FSMContext, db: Database):
     success = await db.delete_all_players()
     if success:
-        await callback.message.edit_text(LEXICON_RU["admin_all_players_removed_success"],
-                                         reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_all_players_removed_success"],
+                        reply_markup=admin_player_management_keyboard())
     else:
-        await callback.message.edit_text(LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
     await state.set_state(AdminStates.managing_players)
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_add_player", StateFilter(AdminStates.managing_players))
+@callbacks.register(Cb.ADMIN_ADD_PLAYER, AdminStates.managing_players)
 async def admin_add_player_start(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.adding_player_name)
-    await callback.message.edit_text(LEXICON_RU["admin_enter_player_name"])
+    await edit_text(callback.message, LEXICON_RU["admin_enter_player_name"])
+    await callback.answer()
+
+
+@callbacks.register(Cb.ADMIN_IMPORT_PLAYERS, AdminStates.managing_players)
+async def admin_import_players_start(callback: CallbackQuery, state: FSMContext):
+    await state.set_state(AdminStates.importing_players)
+    await edit_text(
+        callback.message,
+        LEXICON_RU["admin_import_players_prompt"].format(positions=", ".join(Config.POSITIONS))
+    )
     await callback.answer()
 
 
+@router.message(StateFilter(AdminStates.importing_players))
+async def admin_process_players_import(message: Message, state: FSMContext, db: Database, bot: Bot):
+    if message.document is None:
+        await message.answer(LEXICON_RU["admin_import_send_file"])
+        return
+
+    delimiter, chunks = await sniff_csv_delimiter(stream_document(bot, message.document))
+    report = await db.import_players(chunks, delimiter)
+
+    await state.set_state(AdminStates.managing_players)
+    text = LEXICON_RU["admin_import_result"].format(**report) if report else LEXICON_RU["admin_import_failed"]
+    await message.answer(text, reply_markup=admin_player_management_keyboard())
+
+
 @router.message(StateFilter(AdminStates.adding_player_name))
 async def admin_process_player_name(message: Message, state: FSMContext):
     player_name = message.text
@@ -620,58 +768,58 @@ async def admin_process_player_name(message: Message, state: FSMContext):
     await message.answer(LEXICON_RU["admin_choose_player_position"], reply_markup=create_positions_selection_keyboard())
 
 
-@router.callback_query(F.data.startswith("admin_select_position_"), StateFilter(AdminStates.adding_player_position))
-async def admin_process_player_position(callback: CallbackQuery, state: FSMContext, db: Database):
-    position_key = callback.data.split("_")[-1]
+@callbacks.register(Cb.ADMIN_ADD_PLAYER_POSITION, AdminStates.adding_player_position, fields=("position",))
+async def admin_process_player_position(callback: CallbackQuery, state: FSMContext, db: Database, position: int):
+    position_key = get_position_key(position)
     data = await state.get_data()
     player_name = data.get("new_player_name")
 
     if player_name and position_key:
         player = await db.add_player(player_name, position_key)
         if player:
-            await callback.message.edit_text(
+            await edit_text(
+                callback.message,
                 LEXICON_RU["admin_player_added_success"].format(
                     player_name=player_name, position_name=Config.POSITIONS[position_key]
                 ),
                 reply_markup=admin_player_management_keyboard()
             )
         else:
-            await callback.message.edit_text(LEXICON_RU["admin_player_already_exists"],
-                                             reply_markup=admin_player_management_keyboard())
+            await edit_text(callback.message, LEXICON_RU["admin_player_already_exists"],
+                            reply_markup=admin_player_management_keyboard())
     else:
-        await callback.message.edit_text(LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
     await state.set_state(AdminStates.managing_players)
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_edit_player", StateFilter(AdminStates.managing_players))
+@callbacks.register(Cb.ADMIN_EDIT_PLAYER, AdminStates.managing_players, manual_answer=True)
 async def admin_edit_player_start(callback: CallbackQuery, state: FSMContext, db: Database):
-    players = await db.get_all_players_sorted()
-    if not players:
+    list_page = await ADMIN_PLAYERS_TO_EDIT.page(db)
+    if list_page.empty:
         await callback.answer(LEXICON_RU["admin_no_players_found"], show_alert=True)
         return
 
     await state.set_state(AdminStates.selecting_player_to_edit)
-    await callback.message.edit_text(LEXICON_RU["admin_select_player_to_edit"],
-                                     reply_markup=create_players_list_keyboard(players, "admin_selected_player_edit"))
+    await show_admin_list(callback, state, list_page, LEXICON_RU["admin_select_player_to_edit"])
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("admin_selected_player_edit_"),
-                       StateFilter(AdminStates.selecting_player_to_edit))
-async def admin_selected_player_for_edit(callback: CallbackQuery, state: FSMContext, db: Database):
-    player_id = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.ADMIN_EDIT_PLAYER_SELECTED, AdminStates.selecting_player_to_edit,
+                    fields=("player_id",), manual_answer=True)
+async def admin_selected_player_for_edit(callback: CallbackQuery, state: FSMContext, db: Database, player_id: int):
     player_details = await db.get_player_by_id(player_id)
     if not player_details:
         await callback.answer(LEXICON_RU["admin_player_not_found"], show_alert=True)
         await state.set_state(AdminStates.managing_players)
-        await callback.message.edit_text(LEXICON_RU["admin_player_management_menu"],
-                                         reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_player_management_menu"],
+                        reply_markup=admin_player_management_keyboard())
         return
 
     await state.update_data(editing_player_id=player_id, original_player_name=player_details['name'])
     await state.set_state(AdminStates.editing_player_name)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         LEXICON_RU["admin_edit_player_name_prompt"].format(current_name=player_details['name']))
     await callback.answer()
 
@@ -684,12 +832,13 @@ async def admin_process_edited_player_name(message: Message, state: FSMContext):
     data = await state.get_data()
     original_name = data.get('original_player_name', '')
     await message.answer(LEXICON_RU["admin_edit_player_position_prompt"].format(current_name=original_name),
-                         reply_markup=create_positions_selection_keyboard(callback_prefix="admin_edited_position"))
+                         reply_markup=create_positions_selection_keyboard(callback_prefix=Cb.ADMIN_EDIT_PLAYER_POSITION))
 
 
-@router.callback_query(F.data.startswith("admin_edited_position_"), StateFilter(AdminStates.editing_player_position))
-async def admin_process_edited_player_position(callback: CallbackQuery, state: FSMContext, db: Database):
-    new_position = callback.data.split("_")[-1]
+@callbacks.register(Cb.ADMIN_EDIT_PLAYER_POSITION, AdminStates.editing_player_position, fields=("position",))
+async def admin_process_edited_player_position(callback: CallbackQuery, state: FSMContext, db: Database,
+                                               position: int):
+    new_position = get_position_key(position)
     data = await state.get_data()
     player_id = data.get("editing_player_id")
     new_name = data.get("edited_player_name")
@@ -697,81 +846,100 @@ async def admin_process_edited_player_position(callback: CallbackQuery, state: F
     if player_id and new_name and new_position:
         success = await db.update_player(player_id, new_name, new_position)
         if success:
-            await callback.message.edit_text(LEXICON_RU["admin_player_updated_success"].format(player_name=new_name),
-                                             reply_markup=admin_player_management_keyboard())
+            await edit_text(callback.message, LEXICON_RU["admin_player_updated_success"].format(player_name=new_name),
+                            reply_markup=admin_player_management_keyboard())
         else:
-            await callback.message.edit_text(LEXICON_RU["error_general"],
-                                             reply_markup=admin_player_management_keyboard())
+            await edit_text(callback.message, LEXICON_RU["error_general"],
+                            reply_markup=admin_player_management_keyboard())
     else:
-        await callback.message.edit_text(LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
     await state.set_state(AdminStates.managing_players)
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_delete_player", StateFilter(AdminStates.managing_players))
+@callbacks.register(Cb.ADMIN_DELETE_PLAYER, AdminStates.managing_players, manual_answer=True)
 async def admin_delete_player_start(callback: CallbackQuery, state: FSMContext, db: Database):
-    players = await db.get_all_players_sorted()
-    if not players:
+    list_page = await ADMIN_PLAYERS_TO_DELETE.page(db)
+    if list_page.empty:
         await callback.answer(LEXICON_RU["admin_no_players_found"], show_alert=True)
         return
 
     await state.set_state(AdminStates.selecting_player_to_delete)
-    await callback.message.edit_text(LEXICON_RU["admin_select_player_to_delete"],
-                                     reply_markup=create_players_list_keyboard(players, "admin_selected_player_delete"))
+    await show_admin_list(callback, state, list_page, LEXICON_RU["admin_select_player_to_delete"])
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("admin_selected_player_delete_"),
-                       StateFilter(AdminStates.selecting_player_to_delete))
-async def admin_confirm_delete_player(callback: CallbackQuery, state: FSMContext, db: Database):
-    player_id = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.ADMIN_DELETE_PLAYER_SELECTED, AdminStates.selecting_player_to_delete,
+                    fields=("player_id",), manual_answer=True)
+async def admin_confirm_delete_player(callback: CallbackQuery, state: FSMContext, db: Database, player_id: int):
     player_details = await db.get_player_by_id(player_id)
     if not player_details:
         await callback.answer(LEXICON_RU["admin_player_not_found"], show_alert=True)
         await state.set_state(AdminStates.managing_players)
-        await callback.message.edit_text(LEXICON_RU["admin_player_management_menu"],
-                                         reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_player_management_menu"],
+                        reply_markup=admin_player_management_keyboard())
         return
 
     await state.update_data(player_to_delete_id=player_id, player_to_delete_name=player_details['name'])
     await state.set_state(AdminStates.confirming_player_delete)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         LEXICON_RU["admin_confirm_delete_player"].format(player_name=player_details['name']),
         reply_markup=admin_confirm_delete_keyboard(player_id)
     )
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("confirm_delete_player_"), StateFilter(AdminStates.confirming_player_delete))
-async def admin_execute_delete_player(callback: CallbackQuery, state: FSMContext, db: Database):
-    player_id = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.ADMIN_DELETE_PLAYER_CONFIRM, AdminStates.confirming_player_delete, fields=("player_id",))
+async def admin_execute_delete_player(callback: CallbackQuery, state: FSMContext, db: Database, player_id: int):
     data = await state.get_data()
     player_name = data.get('player_to_delete_name', 'игрока')
 
     success = await db.delete_player(player_id)
     if success:
-        await callback.message.edit_text(LEXICON_RU["admin_player_deleted_success"].format(player_name=player_name),
-                                         reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_player_deleted_success"].format(player_name=player_name),
+                        reply_markup=admin_player_management_keyboard())
     else:
-        await callback.message.edit_text(LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["error_general"], reply_markup=admin_player_management_keyboard())
     await state.set_state(AdminStates.managing_players)
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_manage_matches", StateFilter(AdminStates.admin_menu))
+@callbacks.register(Cb.ADMIN_MANAGE_MATCHES, AdminStates.admin_menu)
 async def admin_manage_matches_menu(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.managing_matches)
-    await callback.message.edit_text(LEXICON_RU["admin_panel_menu"], reply_markup=admin_match_management_keyboard())
+    await edit_text(callback.message, LEXICON_RU["admin_panel_menu"], reply_markup=admin_match_management_keyboard())
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_add_match", StateFilter(AdminStates.managing_matches))
+@callbacks.register(Cb.ADMIN_ADD_MATCH, AdminStates.managing_matches)
 async def admin_add_match_start(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.adding_match_opponent)
-    await callback.message.edit_text(LEXICON_RU["admin_enter_match_opponent"])
+    await edit_text(callback.message, LEXICON_RU["admin_enter_match_opponent"])
     await callback.answer()
 
 
+@callbacks.register(Cb.ADMIN_IMPORT_MATCHES, AdminStates.managing_matches)
+async def admin_import_matches_start(callback: CallbackQuery, state: FSMContext):
+    await state.set_state(AdminStates.importing_matches)
+    await edit_text(callback.message, LEXICON_RU["admin_import_matches_prompt"])
+    await callback.answer()
+
+
+@router.message(StateFilter(AdminStates.importing_matches))
+async def admin_process_matches_import(message: Message, state: FSMContext, db: Database, bot: Bot):
+    if message.document is None:
+        await message.answer(LEXICON_RU["admin_import_send_file"])
+        return
+
+    delimiter, chunks = await sniff_csv_delimiter(stream_document(bot, message.document))
+    report = await db.import_matches(chunks, delimiter)
+
+    await state.set_state(AdminStates.managing_matches)
+    text = LEXICON_RU["admin_import_result"].format(**report) if report else LEXICON_RU["admin_import_failed"]
+    await message.answer(text, reply_markup=admin_match_management_keyboard())
+
+
 @router.message(StateFilter(AdminStates.adding_match_opponent))
 async def admin_process_match_opponent_add(message: Message, state: FSMContext):
     opponent = message.text
@@ -816,29 +984,26 @@ async def admin_process_match_datetime_add(message: Message, state: FSMContext,
     await state.set_state(AdminStates.managing_matches)
 
 
-@router.callback_query(F.data == "admin_edit_matches", StateFilter(AdminStates.managing_matches))
+@callbacks.register(Cb.ADMIN_EDIT_MATCHES, AdminStates.managing_matches, manual_answer=True)
 async def admin_edit_matches_start(callback: CallbackQuery, state: FSMContext, db: Database):
-    upcoming_matches = await db.get_upcoming_matches()
-    if not upcoming_matches:
+    list_page = await ADMIN_MATCHES_TO_EDIT.page(db)
+    if list_page.empty:
         await callback.answer(LEXICON_RU["admin_no_matches_found"], show_alert=True)
         return
 
     await state.set_state(AdminStates.selecting_match_to_edit)
-    await callback.message.edit_text(LEXICON_RU["admin_select_match_to_edit"],
-                                     reply_markup=create_matches_list_keyboard(upcoming_matches,
-                                                                               "admin_selected_match_edit"))
+    await show_admin_list(callback, state, list_page, LEXICON_RU["admin_select_match_to_edit"])
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("admin_selected_match_edit_"),
-                       StateFilter(AdminStates.selecting_match_to_edit))
-async def admin_selected_match_for_edit(callback: CallbackQuery, state: FSMContext, db: Database):
-    match_id = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.ADMIN_EDIT_MATCH_SELECTED, AdminStates.selecting_match_to_edit,
+                    fields=("match_id",), manual_answer=True)
+async def admin_selected_match_for_edit(callback: CallbackQuery, state: FSMContext, db: Database, match_id: int):
     match_details = await db.get_match_details(match_id)
     if not match_details:
         await callback.answer(LEXICON_RU["admin_match_not_found"], show_alert=True)
         await state.set_state(AdminStates.managing_matches)
-        await callback.message.edit_text(LEXICON_RU["admin_panel_menu"], reply_markup=admin_match_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_panel_menu"], reply_markup=admin_match_management_keyboard())
         return
 
     await state.update_data(
@@ -851,7 +1016,8 @@ async def admin_selected_match_for_edit(callback: CallbackQuery, state: FSMConte
     time_str = match_details['match_datetime'].strftime("%H:%M")
 
     await state.set_state(AdminStates.editing_match_opponent)
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         LEXICON_RU["admin_edit_match_opponent_prompt"].format(
             current_opponent=match_details['opponent'], current_date=date_str, current_time=time_str
         )
@@ -911,100 +1077,113 @@ async def admin_process_edited_match_datetime(message: Message, state: FSMContex
     await state.set_state(AdminStates.managing_matches)
 
 
-@router.callback_query(F.data == "admin_score_matches", StateFilter(AdminStates.admin_menu))
+@callbacks.register(Cb.ADMIN_SCORE_MATCHES, AdminStates.admin_menu)
 async def admin_select_match_to_score_start(callback: CallbackQuery, state: FSMContext, db: Database):
-    await state.set_state(AdminStates.selecting_match_to_score)
-    finished_unscored_matches = await db.get_finished_unscored_matches()
+    list_page = await ADMIN_MATCHES_TO_SCORE.page(db)
 
-    if not finished_unscored_matches:
-        await callback.message.edit_text("Нет завершенных матчей, для которых нужно ввести очки.",
-                                         reply_markup=admin_main_menu_keyboard())
+    if list_page.empty:
+        await edit_text(callback.message, "Нет завершенных матчей, для которых нужно ввести очки.",
+                        reply_markup=admin_main_menu_keyboard())
         await state.set_state(AdminStates.admin_menu)
         return
 
-    await callback.message.edit_text(
-        LEXICON_RU["admin_select_match_to_score"],
-        reply_markup=admin_matches_to_score_keyboard(finished_unscored_matches)
-    )
+    await state.set_state(AdminStates.selecting_match_to_score)
+    await show_admin_list(callback, state, list_page, LEXICON_RU["admin_select_match_to_score"])
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("admin_score_match_"), StateFilter(AdminStates.selecting_match_to_score))
-async def admin_select_match_for_scoring(callback: CallbackQuery, state: FSMContext, db: Database):
-    match_id = int(callback.data.split("_")[-1])
+@callbacks.register(Cb.ADMIN_SCORE_MATCH_SELECTED, AdminStates.selecting_match_to_score,
+                    fields=("match_id",), manual_answer=True)
+async def admin_select_match_for_scoring(callback: CallbackQuery, state: FSMContext, db: Database, match_id: int):
     match_details = await db.get_match_details(match_id)
 
     if not match_details:
         await callback.answer(LEXICON_RU["admin_match_not_found"], show_alert=True)
         await state.set_state(AdminStates.admin_menu)
-        await callback.message.edit_text(LEXICON_RU["admin_panel_menu"], reply_markup=admin_main_menu_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_panel_menu"], reply_markup=admin_main_menu_keyboard())
         return
 
     all_players = await db.get_all_players_sorted()
-    # all_players.sort(key=lambda p: (p['position'], p['name'])) # This sort is no longer needed if using order_index
 
     await state.update_data(
         admin_current_match_id=match_id,
         admin_match_details=match_details,
-        admin_players_to_score=all_players,
-        admin_current_player_index=0,
-        admin_player_points_data={}
+        admin_players_to_score=all_players
     )
     await state.set_state(AdminStates.entering_player_points)
 
-    current_player = all_players[0]
     date_str = match_details['match_datetime'].strftime("%d.%m.%Y")
     time_str = match_details['match_datetime'].strftime("%H:%M")
+    template = "\n".join(f"{html.escape(player['name'])};" for player in all_players)
 
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=LEXICON_RU["admin_match_info_score"].format(
             opponent=match_details['opponent'], date=date_str, time=time_str
-        ) + "\n\n" + LEXICON_RU["admin_enter_player_points"].format(player_name=current_player['name'])
+        ) + f"\n\n<code>{template}</code>"
     )
     await callback.answer()
 
 
-@router.message(StateFilter(AdminStates.entering_player_points))
-async def admin_process_player_points(message: Message, state: FSMContext, db: Database, bot: Bot):
+async def _read_points_input(message: Message, bot: Bot) -> Optional[str]:
+    """Текст таблицы очков из сообщения или приложенного CSV-файла; None, если файл не подходит."""
+    if message.document is None:
+        return message.text or ""
+    if (message.document.file_size or 0) > Config.POINTS_FILE_MAX_BYTES:
+        return None
+    content = await bot.download(message.document)
     try:
-        points = float(message.text.replace(',', '.'))
-    except ValueError:
-        await message.answer(LEXICON_RU["admin_invalid_points_format"])
+        return content.read().decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return None
+
+
+@router.message(StateFilter(AdminStates.entering_player_points))
+async def admin_process_player_points(message: Message, state: FSMContext, bot: Bot):
+    text = await _read_points_input(message, bot)
+    if text is None:
+        await message.answer(LEXICON_RU["admin_points_file_invalid"].format(
+            max_kb=Config.POINTS_FILE_MAX_BYTES // 1024))
         return
 
     data = await state.get_data()
-    admin_players_to_score: list = data.get("admin_players_to_score", [])
-    admin_current_player_index: int = data.get("admin_current_player_index", 0)
-    admin_player_points_data: dict = data.get("admin_player_points_data", {})
-    admin_current_match_id: int = data.get("admin_current_match_id")
+    players: list = data.get("admin_players_to_score", [])
+    table = parse_points_table(text, players)
 
-    current_player = admin_players_to_score[admin_current_player_index]
-    admin_player_points_data[current_player['id']] = points
-    await message.answer(
-        LEXICON_RU["admin_points_saved_success"].format(player_name=current_player['name'], points=points))
-
-    admin_current_player_index += 1
-    if admin_current_player_index < len(admin_players_to_score):
-        next_player = admin_players_to_score[admin_current_player_index]
-        await state.update_data(
-            admin_current_player_index=admin_current_player_index,
-            admin_player_points_data=admin_player_points_data
-        )
-        await message.answer(
-            LEXICON_RU["admin_enter_player_points"].format(player_name=next_player['name'])
-        )
-    else:
-        async with db.pool.acquire() as conn:
-            async with conn.transaction():
-                for player_id, pts in admin_player_points_data.items():
-                    await db.save_player_points(admin_current_match_id, player_id, pts)
-                await db.update_user_scores_for_match(admin_current_match_id)
+    if table.errors:
+        await message.answer(LEXICON_RU["admin_points_table_errors"].format(
+            errors=html.escape("\n".join(table.errors))))
+        return
+    if not table.points:
+        await message.answer(LEXICON_RU["admin_points_table_empty"])
+        return
 
-        await message.answer(LEXICON_RU["admin_all_points_entered"])
-        match_details = data.get("admin_match_details")
-        await state.update_data(admin_match_details=match_details)
-        await state.set_state(AdminStates.entering_notification_message)
-        await message.answer(LEXICON_RU["admin_prompt_notification_message"])
+    rows = "\n".join(
+        f"{html.escape(player['name'])} — {table.points[player['id']]:g}"
+        for player in players if player['id'] in table.points
+    )
+    preview = LEXICON_RU["admin_points_preview"].format(
+        opponent=html.escape(data["admin_match_details"]['opponent']), rows=rows
+    )
+    if table.missing:
+        preview += LEXICON_RU["admin_points_preview_missing"].format(names=html.escape(", ".join(table.missing)))
+
+    await state.update_data(admin_player_points_data={
+        player['id']: table.points.get(player['id'], 0.0) for player in players
+    })
+    await state.set_state(AdminStates.confirming_player_points)
+    await message.answer(preview, reply_markup=admin_confirm_points_keyboard())
+
+
+@callbacks.register(Cb.ADMIN_SCORE_CONFIRM, AdminStates.confirming_player_points)
+async def admin_confirm_player_points(callback: CallbackQuery, state: FSMContext, db: Database):
+    data = await state.get_data()
+    await db.score_match(data.get("admin_current_match_id"), data.get("admin_player_points_data", {}))
+
+    await edit_text(callback.message, LEXICON_RU["admin_all_points_entered"])
+    await state.set_state(AdminStates.entering_notification_message)
+    await callback.message.answer(LEXICON_RU["admin_prompt_notification_message"])
+    await callback.answer()
 
 
 @router.message(StateFilter(AdminStates.entering_notification_message))
@@ -1034,7 +1213,7 @@ async def admin_process_notification_message(message: Message, state: FSMContext
     )
 
 
-@router.callback_query(F.data == "admin_send_notification_yes", StateFilter(AdminStates.confirming_notification_send))
+@callbacks.register(Cb.ADMIN_SEND_NOTIFICATION, AdminStates.confirming_notification_send)
 async def admin_execute_send_notification(callback: CallbackQuery, state: FSMContext, db: Database, bot: Bot):
     data = await state.get_data()
     match_details = data.get("admin_match_details")
@@ -1053,32 +1232,160 @@ async def admin_execute_send_notification(callback: CallbackQuery, state: FSMCon
             final_notification_text = base_notification_text
 
         users_to_notify = await db.get_users_with_notifications_enabled()
-        for user in users_to_notify:
-            try:
-                await bot.send_message(user['telegram_id'], final_notification_text, reply_markup=main_menu_keyboard())
-            except Exception as e:
-                print(f"Не удалось отправить уведомление пользователю {user['telegram_id']}: {e}")
+        with outbound_lane(Lane.BROADCAST):
+            for user in users_to_notify:
+                try:
+                    await bot.send_message(user['telegram_id'], final_notification_text,
+                                           reply_markup=main_menu_keyboard())
+                except Exception as e:
+                    print(f"Не удалось отправить уведомление пользователю {user['telegram_id']}: {e}")
 
     await state.clear()
-    await callback.message.edit_text(LEXICON_RU["admin_notification_sent_success"],
-                                     reply_markup=admin_main_menu_keyboard())
+    await edit_text(callback.message, LEXICON_RU["admin_notification_sent_success"],
+                    reply_markup=admin_main_menu_keyboard())
     await callback.answer()
     await state.set_state(AdminStates.admin_menu)
 
 
-@router.callback_query(F.data == "admin_send_notification_no", StateFilter(AdminStates.confirming_notification_send))
+@callbacks.register(Cb.ADMIN_SKIP_NOTIFICATION, AdminStates.confirming_notification_send)
 async def admin_cancel_send_notification(callback: CallbackQuery, state: FSMContext):
     await state.clear()
-    await callback.message.edit_text(LEXICON_RU["admin_notification_cancelled"],
-                                     reply_markup=admin_main_menu_keyboard())
+    await edit_text(callback.message, LEXICON_RU["admin_notification_cancelled"],
+                    reply_markup=admin_main_menu_keyboard())
     await callback.answer()
     await state.set_state(AdminStates.admin_menu)
 
 
-@router.callback_query(F.data == "admin_change_password", StateFilter(AdminStates.admin_menu))
+@callbacks.register(Cb.ADMIN_CORRECT_POINTS, AdminStates.admin_menu, manual_answer=True)
+async def admin_correct_points_start(callback: CallbackQuery, state: FSMContext, db: Database):
+    list_page = await ADMIN_MATCHES_TO_CORRECT.page(db)
+    if list_page.empty:
+        await callback.answer(LEXICON_RU["admin_no_scored_matches"], show_alert=True)
+        return
+
+    await state.set_state(AdminStates.selecting_match_to_correct)
+    await show_admin_list(callback, state, list_page, LEXICON_RU["admin_select_match_to_correct"])
+    await callback.answer()
+
+
+@callbacks.register(Cb.ADMIN_CORRECT_MATCH_SELECTED, AdminStates.selecting_match_to_correct,
+                    fields=("match_id",), manual_answer=True)
+async def admin_select_match_for_correction(callback: CallbackQuery, state: FSMContext, db: Database, match_id: int):
+    match_details = await db.get_match_details(match_id)
+    if not match_details:
+        await callback.answer(LEXICON_RU["admin_match_not_found"], show_alert=True)
+        return
+
+    await state.update_data(correcting_match_id=match_id)
+    await state.set_state(AdminStates.selecting_player_to_correct)
+    await show_admin_list(
+        callback, state, await ADMIN_PLAYERS_TO_CORRECT.page(db),
+        LEXICON_RU["admin_select_player_to_correct"].format(
+            opponent=match_details['opponent'], date=match_details['match_datetime'].strftime("%d.%m.%Y")
+        )
+    )
+    await callback.answer()
+
+
+@callbacks.register(Cb.ADMIN_CORRECT_PLAYER_SELECTED, AdminStates.selecting_player_to_correct,
+                    fields=("player_id",), manual_answer=True)
+async def admin_select_player_for_correction(callback: CallbackQuery, state: FSMContext, db: Database,
+                                             player_id: int):
+    player = await db.get_player_by_id(player_id)
+    if not player:
+        await callback.answer(LEXICON_RU["admin_player_not_found"], show_alert=True)
+        return
+
+    data = await state.get_data()
+    current_points = await db.get_player_points(data.get("correcting_match_id"), player_id)
+    await state.update_data(correcting_player_id=player_id, correcting_player_name=player['name'])
+    await state.set_state(AdminStates.entering_corrected_points)
+    await edit_text(
+        callback.message,
+        LEXICON_RU["admin_enter_corrected_points"].format(
+            player_name=player['name'], points=current_points if current_points is not None else "—"
+        )
+    )
+    await callback.answer()
+
+
+@router.message(StateFilter(AdminStates.entering_corrected_points))
+async def admin_process_corrected_points(message: Message, state: FSMContext, db: Database):
+    try:
+        new_points = float(message.text.replace(',', '.'))
+    except (ValueError, AttributeError):
+        await message.answer(LEXICON_RU["admin_invalid_points_format"])
+        return
+
+    data = await state.get_data()
+    result = await db.correct_player_points(data.get("correcting_match_id"), data.get("correcting_player_id"),
+                                            new_points)
+
+    await state.set_state(AdminStates.admin_menu)
+    await message.answer(
+        LEXICON_RU["admin_points_corrected"].format(
+            player_name=data.get("correcting_player_name"),
+            old_points=result["old_points"] if result["old_points"] is not None else "—",
+            new_points=new_points,
+            affected=len(result["updated_users"])
+        ),
+        reply_markup=admin_main_menu_keyboard()
+    )
+
+
+@callbacks.register(Cb.ADMIN_EXPORT, AdminStates.admin_menu, manual_answer=True)
+async def admin_export_data(callback: CallbackQuery, db: Database, bot: Bot):
+    await callback.answer(LEXICON_RU["admin_export_started"])
+    try:
+        async for path, filename in export_to_gzip_files(db):
+            await bot.send_document(callback.message.chat.id, FSInputFile(path, filename=filename))
+    except Exception as e:
+        print(f"Ошибка при экспорте данных: {e}")
+        await callback.message.answer(LEXICON_RU["admin_export_failed"], reply_markup=admin_main_menu_keyboard())
+        return
+    await callback.message.answer(LEXICON_RU["admin_export_done"], reply_markup=admin_main_menu_keyboard())
+
+
+@callbacks.register(Cb.ADMIN_CLOSE_SEASON, AdminStates.admin_menu)
+async def admin_close_season_start(callback: CallbackQuery, state: FSMContext):
+    await state.set_state(AdminStates.entering_season_name)
+    await edit_text(
+        callback.message,
+        LEXICON_RU["admin_close_season_prompt"],
+        reply_markup=InlineKeyboardMarkup(inline_keyboard=cancel_footer())
+    )
+    await callback.answer()
+
+
+@router.message(StateFilter(AdminStates.entering_season_name), flags={"critical": True})
+async def admin_process_close_season(message: Message, state: FSMContext, db: Database):
+    name = (message.text or "").strip()
+    if not name:
+        await message.answer(LEXICON_RU["admin_close_season_prompt"])
+        return
+
+    result = await db.close_season(name[:255])
+    await state.set_state(AdminStates.admin_menu)
+    error = result.get("error")
+    if error == "no_matches":
+        text = LEXICON_RU["admin_close_season_no_matches"]
+    elif error == "unscored":
+        text = LEXICON_RU["admin_close_season_unscored"].format(unscored=result["unscored"])
+    elif error:
+        text = LEXICON_RU["admin_close_season_failed"]
+    else:
+        text = LEXICON_RU["admin_close_season_done"].format(
+            name=html.escape(name), matches=result["matches"], participants=result["participants"]
+        )
+        if result["detached"]:
+            text += LEXICON_RU["admin_close_season_detached"].format(seasons=", ".join(map(str, result["detached"])))
+    await message.answer(text, reply_markup=admin_main_menu_keyboard())
+
+
+@callbacks.register(Cb.ADMIN_CHANGE_PASSWORD, AdminStates.admin_menu)
 async def admin_change_password_start(callback: CallbackQuery, state: FSMContext):
     await state.set_state(AdminStates.changing_password)
-    await callback.message.edit_text(LEXICON_RU["admin_enter_new_password"])
+    await edit_text(callback.message, LEXICON_RU["admin_enter_new_password"])
     await callback.answer()
 
 
@@ -1093,63 +1400,88 @@ async def admin_process_new_password(message: Message, state: FSMContext, db: Da
     )
 
 
-@router.callback_query(F.data == "admin_exit", StateFilter(AdminStates.admin_menu))
+@callbacks.register(Cb.ADMIN_EXIT, AdminStates.admin_menu)
 async def admin_exit_panel(callback: CallbackQuery, state: FSMContext):
     await state.clear()
-    await callback.message.edit_text(LEXICON_RU["admin_exit_button"], reply_markup=main_menu_keyboard())
+    await edit_text(callback.message, LEXICON_RU["admin_exit_button"], reply_markup=main_menu_keyboard())
     await callback.answer()
 
 
-@router.callback_query(F.data == "admin_cancel_admin_flow", StateFilter(AdminStates))
+@callbacks.register(Cb.ADMIN_CANCEL, AdminStates)
 async def admin_cancel_flow(callback: CallbackQuery, state: FSMContext):
     current_state = await state.get_state()
     if current_state.startswith("AdminStates:managing_players"):
         await state.set_state(AdminStates.managing_players)
-        await callback.message.edit_text(LEXICON_RU["admin_player_management_menu"],
-                                         reply_markup=admin_player_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_player_management_menu"],
+                        reply_markup=admin_player_management_keyboard())
     elif current_state.startswith("AdminStates:managing_matches"):
         await state.set_state(AdminStates.managing_matches)
-        await callback.message.edit_text(LEXICON_RU["admin_panel_menu"], reply_markup=admin_match_management_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_panel_menu"], reply_markup=admin_match_management_keyboard())
     else:
         await state.set_state(AdminStates.admin_menu)
-        await callback.message.edit_text(LEXICON_RU["admin_cancel_admin_flow"], reply_markup=admin_main_menu_keyboard())
+        await edit_text(callback.message, LEXICON_RU["admin_cancel_admin_flow"], reply_markup=admin_main_menu_keyboard())
     await callback.answer()
 
 
-@router.callback_query(F.data == "notifications")
-async def cmd_notifications(callback: CallbackQuery, db: Database):
+@callbacks.register(Cb.NOTIFICATIONS)
+async def cmd_notifications(callback: CallbackQuery, lexicon: Lexicon, db: Database):
     user = await db.get_user(callback.from_user.id)
     notifications_enabled = user['receive_notifications']
 
-    status_text = LEXICON_RU["notifications_enabled"] if notifications_enabled else LEXICON_RU["notifications_disabled"]
-    text = f"{LEXICON_RU['notifications_header']}\n\n{status_text}"
+    status_text = lexicon["notifications_enabled"] if notifications_enabled else lexicon["notifications_disabled"]
+    text = f"{lexicon['notifications_header']}\n\n{status_text}"
 
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=notifications_keyboard(notifications_enabled)
+        reply_markup=notifications_keyboard(notifications_enabled, lexicon)
     )
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("notifications_toggle_"))
-async def toggle_notifications(callback: CallbackQuery, db: Database):
-    user_id = (await db.get_user(callback.from_user.id))['id']
-    toggle_action = callback.data.split("_")[-1]
-    new_preference = True if toggle_action == "on" else False
+@callbacks.register(Cb.NOTIFICATIONS_TOGGLE, fields=("enabled",), manual_answer=True, critical=True)
+async def toggle_notifications(callback: CallbackQuery, lexicon: Lexicon, db: Database, enabled: int):
+    user_id = await db.get_user_id(callback.from_user.id)
+    new_preference = bool(enabled)
 
     await db.update_user_notification_preference(user_id, new_preference)
 
-    status_message = LEXICON_RU["notifications_success_on"] if new_preference else LEXICON_RU[
+    status_message = lexicon["notifications_success_on"] if new_preference else lexicon[
         "notifications_success_off"]
 
     user = await db.get_user(callback.from_user.id)
     notifications_enabled = user['receive_notifications']
 
-    status_text = LEXICON_RU["notifications_enabled"] if notifications_enabled else LEXICON_RU["notifications_disabled"]
-    text = f"{LEXICON_RU['notifications_header']}\n\n{status_text}"
+    status_text = lexicon["notifications_enabled"] if notifications_enabled else lexicon["notifications_disabled"]
+    text = f"{lexicon['notifications_header']}\n\n{status_text}"
 
-    await callback.message.edit_text(
+    await edit_text(
+        callback.message,
         text=text,
-        reply_markup=notifications_keyboard(notifications_enabled)
+        reply_markup=notifications_keyboard(notifications_enabled, lexicon)
     )
     await callback.answer(status_message)
+
+
+@callbacks.register(Cb.NOOP)
+async def noop_callback(callback: CallbackQuery):
+    await callback.answer()
+
+
+@callbacks.fallback
+async def stale_callback(callback: CallbackQuery, lexicon: Lexicon, state: FSMContext, db: Database, bot: Bot):
+    # Кнопка без маршрута (старый формат callback_data или чужой шаг): отвечаем и возвращаем в главное меню
+    print(f"DEBUG: unrouted callback '{callback.data}' from user {callback.from_user.id}")
+    if await state.get_state() in AdminStates:
+        await callback.answer()
+        return
+    if isinstance(callback.message, Message):
+        await back_to_main_menu_handler(callback, lexicon, state, db)
+        return
+    # Сообщение слишком старое, чтобы его редактировать: меню приходит новым сообщением
+    await callback.answer()
+    await state.clear()
+    await bot.send_message(callback.from_user.id, lexicon["welcome"], reply_markup=main_menu_keyboard(lexicon))
+
+
+callbacks.attach(router)
@@ -1,7 +1,10 @@
 # from .set_menu import main_menu_keyboard
-from .flow_kb import pickteam_positions_keyboard, admin_matches_to_score_keyboard, admin_confirm_points_keyboard, \
-    admin_main_menu_keyboard, admin_player_management_keyboard, create_players_list_keyboard, \
-    create_positions_selection_keyboard, admin_match_management_keyboard, create_matches_list_keyboard, \
-    admin_confirm_delete_keyboard, admin_confirm_delete_all_players_keyboard, main_menu_keyboard,match_results_keyboard, match_details_keyboard, notifications_keyboard, admin_confirm_notification_keyboard
+from .flow_kb import pickteam_positions_keyboard, admin_confirm_points_keyboard, \
+    admin_main_menu_keyboard, admin_player_management_keyboard, \
+    create_positions_selection_keyboard, admin_match_management_keyboard, \
+    admin_confirm_delete_keyboard, admin_confirm_delete_all_players_keyboard, main_menu_keyboard,match_results_keyboard, match_details_keyboard, notifications_keyboard, admin_confirm_notification_keyboard, \
+    leaderboard_keyboard, season_history_keyboard
+from .paged_list import ListPage, PagedList, cancel_footer
 
 from .keyboard_utils import create_inline_kb, create_players_keyboard, create_remove_players_keyboard
+from .callback_data import Cb, pack, unpack, position_key, position_index
@@ -0,0 +1,103 @@
+from enum import Enum
+from typing import Optional, Tuple
+
+from config import Config
+
+SEPARATOR = ":"
+
+
+class Cb(str, Enum):
+    """
+    Префиксы callback_data. Формат: "<префикс>[:<int>[:<int>...]]",
+    например "ps:17" вместо "player_select_17".
+    """
+    # Главное меню
+    MAIN_MENU = "mm"
+    PICKTEAM = "pt"
+    MYTEAM = "mt"
+    SCHEDULE = "sc"
+    LEADERBOARD = "lb"
+    WEEKLY_LEADERBOARD = "wl"
+    MATCH_RESULTS = "mr"
+    MATCH_DETAILS = "md"
+    SEASON_HISTORY = "sh"
+    NOOP = "nop"
+    NOTIFICATIONS = "nt"
+    NOTIFICATIONS_TOGGLE = "ntt"
+
+    # Выбор состава
+    RESETTEAM = "rt"
+    SELECT_POSITION = "sp"
+    PLAYER_SELECT = "ps"
+    BACK_TO_PICKTEAM = "bp"
+    REMOVE_PLAYER = "rp"
+    PLAYER_REMOVE = "pr"
+    CANCEL_REMOVE_PLAYER = "crp"
+    CONFIRM_TEAM = "ct"
+
+    # Админ-панель
+    ADMIN_MENU = "a"
+    ADMIN_CANCEL = "ax"
+    ADMIN_EXIT = "aq"
+    ADMIN_CHANGE_PASSWORD = "apw"
+    ADMIN_MANAGE_PLAYERS = "amp"
+    ADMIN_VIEW_PLAYERS = "avp"
+    ADMIN_ADD_PLAYER = "aap"
+    ADMIN_ADD_PLAYER_POSITION = "aapp"
+    ADMIN_EDIT_PLAYER = "aep"
+    ADMIN_EDIT_PLAYER_SELECTED = "aeps"
+    ADMIN_EDIT_PLAYER_POSITION = "aepp"
+    ADMIN_DELETE_PLAYER = "adp"
+    ADMIN_DELETE_PLAYER_SELECTED = "adps"
+    ADMIN_DELETE_PLAYER_CONFIRM = "adpc"
+    ADMIN_REMOVE_ALL_PLAYERS = "arp"
+    ADMIN_REMOVE_ALL_PLAYERS_CONFIRM = "arpc"
+    ADMIN_IMPORT_PLAYERS = "aip"
+    ADMIN_MANAGE_MATCHES = "amm"
+    ADMIN_ADD_MATCH = "aam"
+    ADMIN_EDIT_MATCHES = "aem"
+    ADMIN_EDIT_MATCH_SELECTED = "aems"
+    ADMIN_IMPORT_MATCHES = "aim"
+    ADMIN_SCORE_MATCHES = "asm"
+    ADMIN_SCORE_MATCH_SELECTED = "asms"
+    ADMIN_SCORE_CONFIRM = "asc"
+    ADMIN_SEND_NOTIFICATION = "asn"
+    ADMIN_SKIP_NOTIFICATION = "asx"
+    ADMIN_CORRECT_POINTS = "acp"
+    ADMIN_CORRECT_MATCH_SELECTED = "acpm"
+    ADMIN_CORRECT_PLAYER_SELECTED = "acpp"
+    ADMIN_EXPORT = "aex"
+    ADMIN_CLOSE_SEASON = "acs"
+    ADMIN_LIST_PAGE = "alp"
+
+
+def pack(prefix: Cb, *args: int) -> str:
+    """Собирает callback_data из префикса и целочисленных аргументов."""
+    if not args:
+        return prefix.value
+    return SEPARATOR.join((prefix.value, *(str(int(arg)) for arg in args)))
+
+
+def unpack(data: str) -> Optional[Tuple[str, Tuple[int, ...]]]:
+    """
+    Разбирает callback_data на префикс и кортеж целых чисел.
+    Возвращает None, если данные не соответствуют формату.
+    """
+    prefix, *raw_args = data.split(SEPARATOR)
+    try:
+        return prefix, tuple(int(arg) for arg in raw_args)
+    except ValueError:
+        return None
+
+
+POSITION_KEYS = list(Config.POSITIONS)
+
+
+def position_index(position_key: str) -> int:
+    return POSITION_KEYS.index(position_key)
+
+
+def position_key(index: int) -> Optional[str]:
+    if 0 <= index < len(POSITION_KEYS):
+        return POSITION_KEYS[index]
+    return None
@@ -2,60 +2,62 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from lexicon import LEXICON_RU
 from config import Config
-from typing import List
+from .callback_data import Cb, pack, position_index
+from typing import List, Mapping
 
 
-def main_menu_keyboard() -> InlineKeyboardMarkup:
+def main_menu_keyboard(lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     print("DEBUG: main_menu_keyboard() is being called!")  # <-- Эта строка уже была, но проверьте ее наличие
     kb_builder = InlineKeyboardBuilder()
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_pickteam"], callback_data="pickteam"),
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_myteam"], callback_data="myteam"),
+        InlineKeyboardButton(text=lexicon["main_menu_button_pickteam"], callback_data=pack(Cb.PICKTEAM)),
+        InlineKeyboardButton(text=lexicon["main_menu_button_myteam"], callback_data=pack(Cb.MYTEAM)),
         width=2
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_schedule"], callback_data="schedule"),
+        InlineKeyboardButton(text=lexicon["main_menu_button_schedule"], callback_data=pack(Cb.SCHEDULE)),
         width=1
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_leaderboard"], callback_data="leaderboard"),
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_weekly_leaderboard"],
-                             callback_data="weekly_leaderboard"),
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_match_results"], callback_data="match_results"),
+        InlineKeyboardButton(text=lexicon["main_menu_button_leaderboard"], callback_data=pack(Cb.LEADERBOARD)),
+        InlineKeyboardButton(text=lexicon["main_menu_button_weekly_leaderboard"],
+                             callback_data=pack(Cb.WEEKLY_LEADERBOARD)),
+        InlineKeyboardButton(text=lexicon["main_menu_button_match_results"], callback_data=pack(Cb.MATCH_RESULTS)),
+        InlineKeyboardButton(text=lexicon["main_menu_button_season"], callback_data=pack(Cb.SEASON_HISTORY)),
         width=1
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["main_menu_button_notifications"], callback_data="notifications"),
+        InlineKeyboardButton(text=lexicon["main_menu_button_notifications"], callback_data=pack(Cb.NOTIFICATIONS)),
         width=1
     )
     return kb_builder.as_markup()
 
 
-def pickteam_positions_keyboard(selected_count: int) -> InlineKeyboardMarkup:
+def pickteam_positions_keyboard(selected_count: int, lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     for position_key, position_text in Config.POSITIONS.items():
         kb_builder.button(
-            text=position_text,
-            callback_data=f"select_position_{position_key}"
+            text=lexicon.get(f"position_{position_key}", position_text),
+            callback_data=pack(Cb.SELECT_POSITION, position_index(position_key))
         )
     kb_builder.adjust(1)
 
     confirm_button = InlineKeyboardButton(
-        text=LEXICON_RU["pickteam_confirm_button"],
-        callback_data="confirm_team"
+        text=lexicon["pickteam_confirm_button"],
+        callback_data=pack(Cb.CONFIRM_TEAM)
     )
     remove_button = InlineKeyboardButton(
-        text=LEXICON_RU["pickteam_remove_button"],
-        callback_data="remove_player"
+        text=lexicon["pickteam_remove_button"],
+        callback_data=pack(Cb.REMOVE_PLAYER)
     )
 
     reset_button = InlineKeyboardButton(
-        text=LEXICON_RU["main_menu_button_resetteam"],
-        callback_data="resetteam"
+        text=lexicon["main_menu_button_resetteam"],
+        callback_data=pack(Cb.RESETTEAM)
     )
     kb_builder.row(confirm_button, remove_button, reset_button, width=3)
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data="back_to_main_menu"),
+        InlineKeyboardButton(text=lexicon["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)),
         width=1
     )
     return kb_builder.as_markup()
@@ -68,10 +70,10 @@ def create_players_keyboard(players: List[dict], selected_player_ids: List[int])
         status_emoji = "✅ " if is_selected else ""
         kb_builder.button(
             text=f"{status_emoji}{player['name']}",
-            callback_data=f"player_select_{player['id']}"
+            callback_data=pack(Cb.PLAYER_SELECT, player['id'])
         )
     kb_builder.adjust(2)
-    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data="back_to_main_menu"),
+    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)),
                    width=1)
     return kb_builder.as_markup()
 
@@ -81,10 +83,10 @@ def create_remove_players_keyboard(players_to_remove: List[tuple]) -> InlineKeyb
     for player_id, player_name in players_to_remove:
         kb_builder.button(
             text=player_name,
-            callback_data=f"player_remove_{player_id}"
+            callback_data=pack(Cb.PLAYER_REMOVE, player_id)
         )
     kb_builder.adjust(1)
-    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data="back_to_main_menu"),
+    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)),
                    width=1)
     return kb_builder.as_markup()
 
@@ -92,17 +94,26 @@ def create_remove_players_keyboard(players_to_remove: List[tuple]) -> InlineKeyb
 def admin_main_menu_keyboard() -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_manage_players_button"], callback_data="admin_manage_players"),
-        InlineKeyboardButton(text=LEXICON_RU["admin_manage_matches_button"], callback_data="admin_manage_matches"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_manage_players_button"], callback_data=pack(Cb.ADMIN_MANAGE_PLAYERS)),
+        InlineKeyboardButton(text=LEXICON_RU["admin_manage_matches_button"], callback_data=pack(Cb.ADMIN_MANAGE_MATCHES)),
         width=2
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_score_matches_button"], callback_data="admin_score_matches"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_score_matches_button"], callback_data=pack(Cb.ADMIN_SCORE_MATCHES)),
+        width=1
+    )
+    kb_builder.row(
+        InlineKeyboardButton(text=LEXICON_RU["admin_correct_points_button"], callback_data=pack(Cb.ADMIN_CORRECT_POINTS)),
         width=1
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_change_password_button"], callback_data="admin_change_password"),
-        InlineKeyboardButton(text=LEXICON_RU["admin_exit_button"], callback_data="admin_exit"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_export_button"], callback_data=pack(Cb.ADMIN_EXPORT)),
+        InlineKeyboardButton(text=LEXICON_RU["admin_close_season_button"], callback_data=pack(Cb.ADMIN_CLOSE_SEASON)),
+        width=1
+    )
+    kb_builder.row(
+        InlineKeyboardButton(text=LEXICON_RU["admin_change_password_button"], callback_data=pack(Cb.ADMIN_CHANGE_PASSWORD)),
+        InlineKeyboardButton(text=LEXICON_RU["admin_exit_button"], callback_data=pack(Cb.ADMIN_EXIT)),
         width=2
     )
     return kb_builder.as_markup()
@@ -111,22 +122,24 @@ def admin_main_menu_keyboard() -> InlineKeyboardMarkup:
 def admin_player_management_keyboard() -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_view_players_button"], callback_data="admin_view_players"),
-        InlineKeyboardButton(text=LEXICON_RU["admin_add_player_button"], callback_data="admin_add_player"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_view_players_button"], callback_data=pack(Cb.ADMIN_VIEW_PLAYERS)),
+        InlineKeyboardButton(text=LEXICON_RU["admin_add_player_button"], callback_data=pack(Cb.ADMIN_ADD_PLAYER)),
         width=2
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_edit_player_button"], callback_data="admin_edit_player"),
-        InlineKeyboardButton(text=LEXICON_RU["admin_delete_player_button"], callback_data="admin_delete_player"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_edit_player_button"], callback_data=pack(Cb.ADMIN_EDIT_PLAYER)),
+        InlineKeyboardButton(text=LEXICON_RU["admin_delete_player_button"], callback_data=pack(Cb.ADMIN_DELETE_PLAYER)),
         width=2
     )
     kb_builder.row(
+        InlineKeyboardButton(text=LEXICON_RU["admin_import_players_button"],
+                             callback_data=pack(Cb.ADMIN_IMPORT_PLAYERS)),
         InlineKeyboardButton(text=LEXICON_RU["admin_remove_all_players_button"],
-                             callback_data="admin_remove_all_players"),
-        width=1
+                             callback_data=pack(Cb.ADMIN_REMOVE_ALL_PLAYERS)),
+        width=2
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_back_to_admin_menu"], callback_data="admin_back_to_main_menu"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_back_to_admin_menu"], callback_data=pack(Cb.ADMIN_MENU)),
         width=1
     )
     return kb_builder.as_markup()
@@ -135,79 +148,44 @@ def admin_player_management_keyboard() -> InlineKeyboardMarkup:
 def admin_match_management_keyboard() -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_add_match_button"], callback_data="admin_add_match"),
-        InlineKeyboardButton(text="Редактировать матч", callback_data="admin_edit_matches"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_add_match_button"], callback_data=pack(Cb.ADMIN_ADD_MATCH)),
+        InlineKeyboardButton(text="Редактировать матч", callback_data=pack(Cb.ADMIN_EDIT_MATCHES)),
         width=2
     )
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_back_to_admin_menu"], callback_data="admin_back_to_main_menu"),
+        InlineKeyboardButton(text=LEXICON_RU["admin_import_matches_button"],
+                             callback_data=pack(Cb.ADMIN_IMPORT_MATCHES)),
         width=1
     )
-    return kb_builder.as_markup()
-
-
-def create_players_list_keyboard(players: List[dict], callback_prefix: str) -> InlineKeyboardMarkup:
-    kb_builder = InlineKeyboardBuilder()
-    for player in players:
-        kb_builder.button(
-            text=f"{player['name']} ({Config.POSITIONS.get(player['position'], player['position'])})",
-            callback_data=f"{callback_prefix}_{player['id']}"
-        )
-    kb_builder.adjust(1)
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data="admin_cancel_admin_flow"))
+        InlineKeyboardButton(text=LEXICON_RU["admin_back_to_admin_menu"], callback_data=pack(Cb.ADMIN_MENU)),
+        width=1
+    )
     return kb_builder.as_markup()
 
 
-def create_positions_selection_keyboard(callback_prefix: str = "admin_select_position") -> InlineKeyboardMarkup:
+def create_positions_selection_keyboard(callback_prefix: Cb = Cb.ADMIN_ADD_PLAYER_POSITION) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     for position_key, position_text in Config.POSITIONS.items():
         kb_builder.button(
             text=position_text,
-            callback_data=f"{callback_prefix}_{position_key}"
+            callback_data=pack(callback_prefix, position_index(position_key))
         )
     kb_builder.adjust(2)
     kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data="admin_cancel_admin_flow"))
+        InlineKeyboardButton(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data=pack(Cb.ADMIN_CANCEL)))
     return kb_builder.as_markup()
 
 
-def create_matches_list_keyboard(matches: List[dict], callback_prefix: str) -> InlineKeyboardMarkup:
+def match_results_keyboard(matches: List[dict], current_page: int, total_pages: int,
+                           lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
-    for match in matches:
-        date_str = match['match_datetime'].strftime("%d.%m.%Y %H:%M")
-        kb_builder.button(
-            text=f"{date_str} - {match['opponent']}",
-            callback_data=f"{callback_prefix}_{match['id']}"
-        )
-    kb_builder.adjust(1)
-    kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data="admin_cancel_admin_flow"))
-    return kb_builder.as_markup()
-
 
-def admin_matches_to_score_keyboard(matches: List[dict]) -> InlineKeyboardMarkup:
-    kb_builder = InlineKeyboardBuilder()
     for match in matches:
         date_str = match['match_datetime'].strftime("%d.%m.%Y %H:%M")
         kb_builder.button(
             text=f"{date_str} - {match['opponent']}",
-            callback_data=f"admin_score_match_{match['id']}"
-        )
-    kb_builder.adjust(1)
-    kb_builder.row(
-        InlineKeyboardButton(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data="admin_cancel_admin_flow"))
-    return kb_builder.as_markup()
-
-
-def match_results_keyboard(matches: List[dict], current_page: int, total_pages: int) -> InlineKeyboardMarkup:
-    kb_builder = InlineKeyboardBuilder()
-
-    for match in matches:
-        date_str = match['match_datetime'].strftime("%d.%m.%Y %H:%M")
-        kb_builder.button(
-            text=f"{date_str} - {match['opponent']}",
-            callback_data=f"match_details_{match['id']}_{current_page}"
+            callback_data=pack(Cb.MATCH_DETAILS, match['id'], current_page)
         )
     kb_builder.adjust(1)
 
@@ -215,64 +193,99 @@ def match_results_keyboard(matches: List[dict], current_page: int, total_pages:
     if total_pages > 1:
         if current_page > 0:
             pagination_buttons.append(
-                InlineKeyboardButton(text="⬅️ Назад", callback_data=f"match_results_page_{current_page - 1}"))
+                InlineKeyboardButton(text=lexicon["page_prev_button"], callback_data=pack(Cb.MATCH_RESULTS, current_page - 1)))
         pagination_buttons.append(
-            InlineKeyboardButton(text=f"{current_page + 1}/{total_pages}", callback_data="match_results_current_page"))
+            InlineKeyboardButton(text=f"{current_page + 1}/{total_pages}", callback_data=pack(Cb.NOOP)))
         if current_page < total_pages - 1:
             pagination_buttons.append(
-                InlineKeyboardButton(text="Вперед ➡️", callback_data=f"match_results_page_{current_page + 1}"))
+                InlineKeyboardButton(text=lexicon["page_next_button"], callback_data=pack(Cb.MATCH_RESULTS, current_page + 1)))
         kb_builder.row(*pagination_buttons)
 
-    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data="back_to_main_menu"))
+    kb_builder.row(InlineKeyboardButton(text=lexicon["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)))
+    return kb_builder.as_markup()
+
+
+def match_details_keyboard(match_id: int, current_page: int,
+                           lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
+    kb_builder = InlineKeyboardBuilder()
+    kb_builder.row(InlineKeyboardButton(text=lexicon["match_back_to_list_button"],
+                                        callback_data=pack(Cb.MATCH_RESULTS, current_page)))
+    kb_builder.row(InlineKeyboardButton(text=lexicon["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)))
+    return kb_builder.as_markup()
+
+
+def leaderboard_keyboard(first_id: int, last_id: int, has_prev: bool, has_next: bool,
+                         lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
+    kb_builder = InlineKeyboardBuilder()
+    pagination_buttons = []
+    if has_prev:
+        pagination_buttons.append(
+            InlineKeyboardButton(text=lexicon["page_prev_button"], callback_data=pack(Cb.LEADERBOARD, first_id, 0)))
+    if has_next:
+        pagination_buttons.append(
+            InlineKeyboardButton(text=lexicon["page_next_button"], callback_data=pack(Cb.LEADERBOARD, last_id, 1)))
+    if pagination_buttons:
+        kb_builder.row(*pagination_buttons)
+    kb_builder.row(InlineKeyboardButton(text=lexicon["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)))
     return kb_builder.as_markup()
 
 
-def match_details_keyboard(match_id: int, current_page: int) -> InlineKeyboardMarkup:
+def season_history_keyboard(first_id: int, last_id: int, has_prev: bool, has_next: bool,
+                            lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
-    kb_builder.row(InlineKeyboardButton(text="⬅️ К списку матчей", callback_data=f"match_results_page_{current_page}"))
-    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data="back_to_main_menu"))
+    pagination_buttons = []
+    if has_prev:
+        pagination_buttons.append(
+            InlineKeyboardButton(text=lexicon["season_history_prev_button"], callback_data=pack(Cb.SEASON_HISTORY, first_id, 0)))
+    if has_next:
+        pagination_buttons.append(
+            InlineKeyboardButton(text=lexicon["season_history_next_button"], callback_data=pack(Cb.SEASON_HISTORY, last_id, 1)))
+    if pagination_buttons:
+        kb_builder.row(*pagination_buttons)
+    kb_builder.row(InlineKeyboardButton(text=lexicon["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)))
     return kb_builder.as_markup()
 
 
-def notifications_keyboard(notifications_enabled: bool) -> InlineKeyboardMarkup:
+def notifications_keyboard(notifications_enabled: bool,
+                           lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     if notifications_enabled:
-        kb_builder.button(text=LEXICON_RU["notifications_disabled"], callback_data="notifications_toggle_off")
+        kb_builder.button(text=lexicon["notifications_disabled"], callback_data=pack(Cb.NOTIFICATIONS_TOGGLE, 0))
     else:
-        kb_builder.button(text=LEXICON_RU["notifications_enabled"], callback_data="notifications_toggle_on")
+        kb_builder.button(text=lexicon["notifications_enabled"], callback_data=pack(Cb.NOTIFICATIONS_TOGGLE, 1))
     kb_builder.adjust(1)
-    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_main_menu_button"], callback_data="back_to_main_menu"))
+    kb_builder.row(InlineKeyboardButton(text=lexicon["back_to_main_menu_button"], callback_data=pack(Cb.MAIN_MENU)))
     return kb_builder.as_markup()
 
 
 def admin_confirm_notification_keyboard() -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
-    kb_builder.button(text=LEXICON_RU["admin_send_notification_button"], callback_data="admin_send_notification_yes")
+    kb_builder.button(text=LEXICON_RU["admin_send_notification_button"], callback_data=pack(Cb.ADMIN_SEND_NOTIFICATION))
     kb_builder.button(text=LEXICON_RU["admin_dont_send_notification_button"],
-                      callback_data="admin_send_notification_no")
+                      callback_data=pack(Cb.ADMIN_SKIP_NOTIFICATION))
     kb_builder.adjust(2)
     return kb_builder.as_markup()
 
 
 def admin_confirm_points_keyboard() -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
-    kb_builder.button(text="Продолжить", callback_data="admin_next_player")
-    kb_builder.button(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data="admin_cancel_admin_flow")
+    kb_builder.button(text=LEXICON_RU["admin_confirm_points_button"], callback_data=pack(Cb.ADMIN_SCORE_CONFIRM))
+    kb_builder.button(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data=pack(Cb.ADMIN_CANCEL))
     kb_builder.adjust(2)
     return kb_builder.as_markup()
 
 
 def admin_confirm_delete_keyboard(player_id: int) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
-    kb_builder.button(text="Да, удалить", callback_data=f"confirm_delete_player_{player_id}")
-    kb_builder.button(text="Отмена", callback_data="admin_cancel_admin_flow")
+    kb_builder.button(text="Да, удалить", callback_data=pack(Cb.ADMIN_DELETE_PLAYER_CONFIRM, player_id))
+    kb_builder.button(text="Отмена", callback_data=pack(Cb.ADMIN_CANCEL))
     kb_builder.adjust(2)
     return kb_builder.as_markup()
 
 
 def admin_confirm_delete_all_players_keyboard() -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
-    kb_builder.button(text="Да, удалить всех", callback_data="confirm_delete_all_players_yes")
-    kb_builder.button(text="Отмена", callback_data="admin_cancel_admin_flow")
+    kb_builder.button(text="Да, удалить всех", callback_data=pack(Cb.ADMIN_REMOVE_ALL_PLAYERS_CONFIRM))
+    kb_builder.button(text="Отмена", callback_data=pack(Cb.ADMIN_CANCEL))
     kb_builder.adjust(2)
     return kb_builder.as_markup()
@@ -1,8 +1,9 @@
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from typing import List, Dict, Tuple
+from typing import List, Dict, Mapping, Optional, Tuple
 
 from lexicon import LEXICON_RU
+from .callback_data import Cb, pack
 
 
 def create_inline_kb(
@@ -25,39 +26,46 @@ def create_inline_kb(
 
 
 def create_pagination_kb(
-        current_page: int, total_pages: int, callback_prefix: str
+        current_page: int, total_pages: int, callback_prefix: Cb
 ) -> InlineKeyboardMarkup:
     builder = InlineKeyboardBuilder()
     if current_page > 1:
-        builder.button(text="⬅️", callback_data=f"{callback_prefix}_page_{current_page - 1}")
-    builder.button(text=f"{current_page}/{total_pages}", callback_data="current_page_info")
+        builder.button(text="⬅️", callback_data=pack(callback_prefix, current_page - 1))
+    builder.button(text=f"{current_page}/{total_pages}", callback_data=pack(Cb.NOOP))
     if current_page < total_pages:
-        builder.button(text="➡️", callback_data=f"{callback_prefix}_page_{current_page + 1}")
+        builder.button(text="➡️", callback_data=pack(callback_prefix, current_page + 1))
     builder.adjust(3)
     return builder.as_markup()
 
 
-def create_players_keyboard(players: List[Dict], selected_player_ids: List[int]) -> InlineKeyboardMarkup:
+def create_players_keyboard(players: List[Dict], selected_player_ids: List[int],
+                            pick_shares: Optional[Dict[int, float]] = None,
+                            lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     for player in players:
         text = f"✅ {player['name']}" if player['id'] in selected_player_ids else player['name']
+        if pick_shares:
+            # Доля составов на матч с этим игроком
+            text += f" · {round(pick_shares.get(player['id'], 0))}%"
         kb_builder.button(
             text=text,
-            callback_data=f"player_select_{player['id']}"
+            callback_data=pack(Cb.PLAYER_SELECT, player['id'])
         )
     kb_builder.adjust(2)
-    kb_builder.row(InlineKeyboardButton(text=LEXICON_RU["back_to_pickteam_button"], callback_data="back_to_pickteam"),
+    kb_builder.row(InlineKeyboardButton(text=lexicon["back_to_pickteam_button"], callback_data=pack(Cb.BACK_TO_PICKTEAM)),
                    width=1)
     return kb_builder.as_markup()
 
 
-def create_remove_players_keyboard(selected_players_names: List[Tuple[int, str]]) -> InlineKeyboardMarkup:
+def create_remove_players_keyboard(selected_players_names: List[Tuple[int, str]],
+                                   lexicon: Mapping[str, str] = LEXICON_RU) -> InlineKeyboardMarkup:
     kb_builder = InlineKeyboardBuilder()
     for player_id, player_name in selected_players_names:
         kb_builder.button(
             text=player_name,
-            callback_data=f"player_remove_{player_id}"
+            callback_data=pack(Cb.PLAYER_REMOVE, player_id)
         )
     kb_builder.adjust(2)
-    kb_builder.row(InlineKeyboardButton(text="Отмена", callback_data="cancel_remove_player"))
+    kb_builder.row(InlineKeyboardButton(text=lexicon["pickteam_remove_cancel_button"],
+                                        callback_data=pack(Cb.CANCEL_REMOVE_PLAYER)))
     return kb_builder.as_markup()
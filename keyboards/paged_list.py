@@ -0,0 +1,102 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from config import Config
+from lexicon import LEXICON_RU
+from .callback_data import Cb, pack
+
+
+@dataclass(frozen=True)
+class ListPage:
+    text: str
+    reply_markup: InlineKeyboardMarkup
+    page: int
+    pages: int
+    empty: bool
+
+
+def cancel_footer() -> List[List[InlineKeyboardButton]]:
+    return [[InlineKeyboardButton(text=LEXICON_RU["admin_cancel_admin_flow"], callback_data=pack(Cb.ADMIN_CANCEL))]]
+
+
+class PagedList:
+    """
+    Постраничный список для админки: строки текста и/или кнопки выбора по
+    page_size элементов, навигация "назад / n из m / вперед" и нижние кнопки.
+
+    Строки загружаются через fetch(db) один раз на версию данных
+    (db.data_versions[source]), отрисованные страницы кэшируются до
+    изменения версии. ttl ограничивает жизнь кэша для списков, которые
+    меняются со временем (предстоящие и сыгранные матчи).
+    """
+
+    _registry: Dict[int, "PagedList"] = {}
+
+    def __init__(self, list_id: int, source: str, fetch: Callable[[Any], Awaitable[List[dict]]],
+                 line_text: Optional[Callable[[dict], str]] = None,
+                 button_text: Optional[Callable[[dict], str]] = None, item_callback: Optional[Cb] = None,
+                 footer: Callable[[], List[List[InlineKeyboardButton]]] = cancel_footer,
+                 page_size: int = Config.ADMIN_LIST_PAGE_SIZE, ttl: float = Config.ADMIN_LIST_CACHE_TTL):
+        if list_id in self._registry:
+            raise ValueError(f"Список {list_id} уже зарегистрирован")
+        self.list_id = list_id
+        self.source = source
+        self.fetch = fetch
+        self.line_text = line_text
+        self.button_text = button_text
+        self.item_callback = item_callback
+        self.footer = footer
+        self.page_size = page_size
+        self.ttl = ttl
+        self._rows: List[dict] = []
+        self._version: Optional[int] = None
+        self._loaded_at = 0.0
+        self._pages: Dict[int, ListPage] = {}
+        self._registry[list_id] = self
+
+    @classmethod
+    def get(cls, list_id: int) -> Optional["PagedList"]:
+        return cls._registry.get(list_id)
+
+    async def page(self, db, page: int = 0) -> ListPage:
+        version = db.data_versions[self.source]
+        if self._version != version or time.monotonic() - self._loaded_at > self.ttl:
+            rows = await self.fetch(db)
+            self._rows, self._version, self._loaded_at = rows, version, time.monotonic()
+            self._pages = {}
+
+        pages = max(1, math.ceil(len(self._rows) / self.page_size))
+        page = min(max(page, 0), pages - 1)
+        rendered = self._pages.get(page)
+        if rendered is None:
+            rendered = self._pages[page] = self._render(page, pages)
+        return rendered
+
+    def _render(self, page: int, pages: int) -> ListPage:
+        rows = self._rows[page * self.page_size:(page + 1) * self.page_size]
+        text = "\n".join(self.line_text(row) for row in rows) if self.line_text else ""
+
+        kb_builder = InlineKeyboardBuilder()
+        if self.item_callback is not None:
+            for row in rows:
+                kb_builder.row(InlineKeyboardButton(text=self.button_text(row),
+                                                    callback_data=pack(self.item_callback, row['id'])))
+        if pages > 1:
+            pagination_buttons = []
+            if page > 0:
+                pagination_buttons.append(InlineKeyboardButton(
+                    text="⬅️ Назад", callback_data=pack(Cb.ADMIN_LIST_PAGE, self.list_id, page - 1)))
+            pagination_buttons.append(InlineKeyboardButton(text=f"{page + 1}/{pages}", callback_data=pack(Cb.NOOP)))
+            if page < pages - 1:
+                pagination_buttons.append(InlineKeyboardButton(
+                    text="Вперед ➡️", callback_data=pack(Cb.ADMIN_LIST_PAGE, self.list_id, page + 1)))
+            kb_builder.row(*pagination_buttons)
+        for footer_row in self.footer():
+            kb_builder.row(*footer_row)
+
+        return ListPage(text=text, reply_markup=kb_builder.as_markup(), page=page, pages=pages, empty=not self._rows)
@@ -10,5 +10,6 @@ async def set_main_menu(bot: Bot):
         BotCommand(command='/pickteam', description='Выбор состава'),
         BotCommand(command='/resetteam', description='Сбросить состав'),
         BotCommand(command='/leaderboard', description='Таблица рейтинга'),
+        BotCommand(command='/season', description='Мой сезон'),
     ]
     await bot.set_my_commands(main_menu_commands)
@@ -1 +1,5 @@
-from .lexicon_ru import LEXICON_RU
\ No newline at end of file
+from .lexicon_ru import LEXICON_RU
+from .templates import CompiledTemplates, Lexicon, compile_template, get_lexicon
+
+# Русский пакет по умолчанию: для админки, рассылок и кода без языка пользователя
+LEXICON = get_lexicon("ru")
@@ -0,0 +1,103 @@
+LEXICON_EN = {
+    "welcome": (
+        "Hi! This is Liverpool Fantasy.\n"
+        "Pick a team of 5 Liverpool players for the next match and "
+        "compete with other participants on the leaderboard.\n"
+        "You can check the fixtures, pick your lineup, follow your "
+        "points and the overall standings."
+    ),
+    "main_menu_button_pickteam": "Change lineup",
+    "main_menu_button_myteam": "My lineup",
+    "main_menu_button_schedule": "Fixtures",
+    "main_menu_button_leaderboard": "Overall standings",
+    "main_menu_button_weekly_leaderboard": "Weekly standings",
+    "main_menu_button_match_results": "Match results",
+    "main_menu_button_season": "📅 My season",
+    "back_to_main_menu_button": "⬅️ Main menu",
+    "back_to_pickteam_button": "⬅️ Back",
+    "team_picked_success": "Your lineup for the match has been saved!",
+    "team_not_found": "You don't have a lineup for this match yet. Pick one with /pickteam.",
+    "pickteam_intro": "Pick exactly 5 players for your team.",
+    "picked_players_count": "Selected: {}/5.",
+    "pickteam_positions_header": "Choose a position to add a player:",
+    "pickteam_confirm_button": "✅ Confirm lineup",
+    "pickteam_remove_button": "⚽ Remove player",
+    "main_menu_button_resetteam": "❌ Reset lineup",
+    "pickteam_not_5_players_error": "You must pick exactly 5 players!",
+    "pickteam_player_already_chosen": "This player is already in your lineup! Pick another one or remove him.",
+    "pickteam_no_players_to_remove": "There are no players in your lineup to remove yet.",
+    "pickteam_choose_player_to_remove": "Choose the player you want to remove:",
+    "pickteam_removed_player": "Player {} has been removed from your lineup.",
+    "deadline_passed": "The lineup deadline for this match has passed. You can no longer change your lineup.",
+    "no_upcoming_matches": "There is no information about upcoming matches yet.",
+    "upcoming_match_info": (
+        "Next match:\n"
+        "⚽️ Liverpool vs {opponent}\n"
+        "🗓️ Date: {date}\n"
+        "⏰ Time: {time}\n"
+        "⏳ Kick-off in: {time_left}\n"
+        "⚠️ Lineup deadline: {deadline_time} ({deadline_countdown} left)"
+    ),
+    "matches_for_month": "\n\nMatches in the coming month:\n",
+    "match_entry": "🗓️ {date} - Liverpool vs {opponent}",
+    "leaderboard_header": "🏆 Overall leaderboard:\n",
+    "weekly_leaderboard_header": "🏆 Standings for the last week:\n",
+    "season_history_header": "📅 My season:\n",
+    "season_history_entry": "{date} — {opponent}: {score} pts (total {total})",
+    "season_history_empty": "You have no points from scored matches yet.",
+    "leaderboard_entry": "{}. {username} — {score} pts",
+    "leaderboard_my_position": "📍 You are #{rank} (top {percentile}%): {score} pts",
+    "leaderboard_my_position_approx": "📍 You are about #{rank} (top {percentile}%): {score} pts",
+    "resetteam_success": "Your lineup for the next match has been reset.",
+    "resetteam_no_team": "You have no lineup for the next match to reset.",
+    "error_general": "Something went wrong. Please try again later.",
+    "throttled": "Too many requests. Please wait a couple of seconds.",
+    "load_busy": "The bot is overloaded right now. Please try again in a minute.",
+    "load_data_delayed": "⏳ Data may be delayed.",
+    "duration_days": "{}d",
+    "duration_hours": "{}h",
+    "duration_minutes": "{}min",
+    "duration_less_than_minute": "less than a minute",
+    "position_goalkeeper": "Goalkeepers 🧤",
+    "position_defender": "Defenders 🛡️",
+    "position_midfielder": "Midfielders ⚙️",
+    "position_forward": "Forwards 🎯",
+    "team_empty": "Your lineup is empty.",
+    "team_current_header": "Your current lineup:",
+    "pickteam_max_players_error": "You can pick at most 5 players.",
+    "pickteam_player_not_in_team": "This player is not in your lineup.",
+    "pickteam_remove_cancelled": "Player removal cancelled.",
+    "pickteam_remove_cancel_button": "Cancel",
+    "pickteam_unknown_player": "Unknown player",
+    "pickteam_removed_player_unknown": "player",
+    "team_saved_alert": "Lineup saved!",
+    "leaderboard_empty": "There is no data for the overall leaderboard yet.",
+    "weekly_leaderboard_empty": "There is no data for the weekly standings yet.",
+    "page_prev_button": "⬅️ Back",
+    "page_next_button": "Next ➡️",
+    "season_history_prev_button": "⬅️ Earlier",
+    "season_history_next_button": "Later ➡️",
+    "finished_matches_header": "Finished matches:",
+    "no_finished_matches": "No finished matches to show.",
+    "finished_matches_choose": "Choose a match to see the details:",
+    "match_not_found": "Match not found.",
+    "match_back_to_list_button": "⬅️ Back to matches",
+    "match_results_details_header": "Match result: {opponent} ({date} {time})",
+    "match_player_score_entry": "{}. {player_name} - {points} pts {emoji}",
+    "player_pick_share": " · picked by {share}%",
+    "match_player_scores_header": "Player points:",
+    "match_no_player_scores": "There are no player points for this match.",
+    "match_user_team": "Your team for this match: {players}",
+    "match_total_user_score": "Your team scored: {score} pts.",
+    "match_no_team_selected": "You didn't pick a team for this match.",
+    "main_menu_button_notifications": "Notifications",
+    "notifications_header": "Notification settings",
+    "notifications_enabled": "Notifications are on ✅",
+    "notifications_disabled": "Notifications are off ❌",
+    "notifications_toggle_on": "Turn notifications on",
+    "notifications_toggle_off": "Turn notifications off",
+    "notifications_success_on": "Notifications are on. You will get messages about match results.",
+    "notifications_success_off": "Notifications are off. You won't get messages about match results.",
+    "notifications_match_scored_message": "⚽️ Results of the match {opponent} ({date} {time}) are in! You can "
+                                          "view them in the \"Match results\" section.",
+}
@@ -12,6 +12,7 @@ LEXICON_RU = {
     "main_menu_button_leaderboard": "Общий рейтинг",
     "main_menu_button_weekly_leaderboard": "Рейтинг за неделю",
     "main_menu_button_match_results": "Результаты матчей",
+    "main_menu_button_season": "📅 Мой сезон",
     "back_to_main_menu_button": "⬅️ В главное меню",
     "back_to_pickteam_button": "⬅️ Назад",
     "team_picked_success": "Ваш состав успешно сохранен на матч!",
@@ -41,10 +42,41 @@ LEXICON_RU = {
     "match_entry": "🗓️ {date} - Ливерпуль vs {opponent}",
     "leaderboard_header": "🏆 Общая таблица лидеров:\n",
     "weekly_leaderboard_header": "🏆 Рейтинг за последнюю неделю:\n",
+    "season_history_header": "📅 Мой сезон:\n",
+    "season_history_entry": "{date} — {opponent}: {score} очков (всего {total})",
+    "season_history_empty": "У вас пока нет очков за оцененные матчи.",
     "leaderboard_entry": "{}. {username} — {score} очков",
+    "leaderboard_my_position": "📍 Вы на {rank}-м месте (топ {percentile}%): {score} очков",
+    "leaderboard_my_position_approx": "📍 Вы примерно на {rank}-м месте (топ {percentile}%): {score} очков",
     "resetteam_success": "Ваш состав на ближайший матч успешно сброшен.",
     "resetteam_no_team": "У вас нет состава на ближайший матч, чтобы его сбрасывать.",
     "error_general": "Произошла ошибка. Попробуйте еще раз позже.",
+    "throttled": "Слишком много запросов. Подождите пару секунд.",
+    "load_busy": "Бот сейчас перегружен. Попробуйте через минуту.",
+    "load_data_delayed": "⏳ Данные могут быть с задержкой.",
+    "duration_days": "{} д.",
+    "duration_hours": "{} ч.",
+    "duration_minutes": "{} мин.",
+    "duration_less_than_minute": "менее минуты",
+    "position_goalkeeper": "Вратари 🧤",
+    "position_defender": "Защитники 🛡️",
+    "position_midfielder": "Полузащитники ⚙️",
+    "position_forward": "Нападающие 🎯",
+    "team_empty": "Ваш состав пуст.",
+    "team_current_header": "Ваш текущий состав:",
+    "pickteam_max_players_error": "Вы можете выбрать не более 5 игроков.",
+    "pickteam_player_not_in_team": "Этого игрока нет в вашем составе.",
+    "pickteam_remove_cancelled": "Отмена удаления игрока.",
+    "pickteam_remove_cancel_button": "Отмена",
+    "pickteam_unknown_player": "Неизвестный игрок",
+    "pickteam_removed_player_unknown": "игрок",
+    "team_saved_alert": "Состав сохранен!",
+    "leaderboard_empty": "Пока нет данных для общей таблицы лидеров.",
+    "weekly_leaderboard_empty": "Пока нет данных для недельного рейтинга.",
+    "page_prev_button": "⬅️ Назад",
+    "page_next_button": "Вперед ➡️",
+    "season_history_prev_button": "⬅️ Раньше",
+    "season_history_next_button": "Позже ➡️",
     "admin_enter_password": "Введите пароль для входа в админ-панель.",
     "admin_wrong_password": "Неверный пароль.",
     "admin_panel_menu": "Админ-панель.",
@@ -70,12 +102,39 @@ LEXICON_RU = {
     "admin_edit_match_datetime_prompt": "Введите новую дату и время для матча '{current_opponent}' ({current_date} {"
                                         "current_time}) (ГГГГ-ММ-ДД ЧЧ:ММ):",
     "admin_select_match_to_score": "Выберите матч, чтобы ввести очки игрокам:",
-    "admin_match_info_score": "Вы выбрали матч: {opponent} ({date} {time}).\nТеперь введите очки для каждого игрока "
-                              "поочередно.",
-    "admin_enter_player_points": "Введите очки для игрока {player_name}:",
+    "admin_match_info_score": "Вы выбрали матч: {opponent} ({date} {time}).\nОтправьте очки всех игроков одним "
+                              "сообщением (строка на игрока: «Имя;очки») или CSV-файлом. Шаблон:",
     "admin_invalid_points_format": "Неверный формат очков. Пожалуйста, введите число (целое или десятичное).",
-    "admin_points_saved_success": "Очки для игрока {player_name} ({points}) сохранены.",
+    "admin_points_table_errors": "В таблице есть ошибки, исправьте их и отправьте таблицу заново:\n{errors}",
+    "admin_points_table_empty": "Не найдено ни одной строки с очками. Отправьте таблицу текстом или CSV-файлом.",
+    "admin_points_file_invalid": "Не удалось прочитать файл. Нужен текстовый CSV в UTF-8 размером до {max_kb} КБ.",
+    "admin_points_preview": "Проверьте очки за матч {opponent}:\n\n{rows}",
+    "admin_points_preview_missing": "\n\nНе указаны (будет 0 очков): {names}",
+    "admin_confirm_points_button": "Сохранить очки",
     "admin_all_points_entered": "Очки для всех игроков матча сохранены. Рейтинги пользователей обновлены.",
+    "admin_correct_points_button": "Исправить очки игрока",
+    "admin_export_button": "Экспорт данных (CSV)",
+    "admin_export_started": "Готовлю выгрузку, файлы придут отдельными сообщениями.",
+    "admin_export_done": "Экспорт завершен: пользователи, составы и очки.",
+    "admin_export_failed": "Не удалось выгрузить данные, попробуйте позже.",
+    "admin_close_season_button": "Закрыть сезон",
+    "admin_close_season_prompt": "Все уже начавшиеся матчи войдут в закрываемый сезон, будущие останутся в следующем. "
+                                 "Итоги пользователей сохранятся, "
+                                 "а общий рейтинг обнулится. Это действие необратимо.\n\n"
+                                 "Чтобы закрыть сезон, введите его название (например, 2025/26):",
+    "admin_close_season_done": "Сезон «{name}» закрыт: матчей — {matches}, участников — {participants}. "
+                               "Общий рейтинг обнулен.",
+    "admin_close_season_detached": "\nОтсоединены партиции сезонов: {seasons}.",
+    "admin_close_season_no_matches": "В текущем сезоне нет оцененных матчей — закрывать нечего.",
+    "admin_close_season_unscored": "Среди прошедших матчей есть неоцененные матчи с составами ({unscored}). "
+                                   "Сначала введите по ним очки или перенесите их на будущую дату.",
+    "admin_close_season_failed": "Не удалось закрыть сезон, попробуйте позже.",
+    "admin_select_match_to_correct": "Выберите матч, в котором нужно исправить очки:",
+    "admin_no_scored_matches": "Нет матчей с введенными очками.",
+    "admin_select_player_to_correct": "Матч: {opponent} ({date}). Выберите игрока:",
+    "admin_enter_corrected_points": "Игрок {player_name}, текущие очки: {points}. Введите новые очки:",
+    "admin_points_corrected": "Очки игрока {player_name} исправлены: {old_points} → {new_points}. "
+                              "Пересчитано пользователей: {affected}.",
     "admin_match_scoring_done": "Ввод очков завершен. Возврат в главное меню.",
     "admin_cancel": "Отменено.",
     "admin_cancel_admin_flow": "Отменить действие",
@@ -86,6 +145,19 @@ LEXICON_RU = {
     "admin_delete_player_button": "Удалить игрока",
     "admin_view_players_button": "Показать всех игроков",
     "admin_remove_all_players_button": "Удалить всех игроков",
+    "admin_import_players_button": "Импорт из CSV",
+    "admin_import_players_prompt": "Отправьте CSV-файл с игроками. Первая строка — заголовок, дальше по строке на "
+                                   "игрока: имя;позиция.\nПозиции: {positions}.\nУ существующих игроков обновится "
+                                   "позиция, новые добавятся в конец списка.",
+    "admin_import_matches_button": "Импорт расписания из CSV",
+    "admin_import_matches_prompt": "Отправьте CSV-файл с матчами. Первая строка — заголовок, дальше по строке на "
+                                   "матч: соперник;ГГГГ-ММ-ДД ЧЧ:ММ.\nУже существующие матчи будут пропущены, "
+                                   "матчи в прошлом — отклонены.",
+    "admin_import_send_file": "Нужен CSV-файл, отправьте его документом.",
+    "admin_import_result": "Импорт завершен.\nДобавлено: {inserted}\nОбновлено: {updated}\n"
+                           "Без изменений: {unchanged}\nОтклонено: {rejected}",
+    "admin_import_failed": "Не удалось импортировать файл. Проверьте формат (CSV в UTF-8, даты ГГГГ-ММ-ДД ЧЧ:ММ) и "
+                           "попробуйте еще раз.",
     "admin_enter_player_name": "Введите имя и фамилию игрока:",
     "admin_choose_player_position": "Выберите позицию для игрока:",
     "admin_player_added_success": "Игрок '{player_name}' ({position_name}) успешно добавлен.",
@@ -102,6 +174,9 @@ LEXICON_RU = {
     "admin_no_matches_found": "Матчи не найдены.",
     "finished_matches_header": "Завершенные матчи:",
     "no_finished_matches": "Нет завершенных матчей для отображения.",
+    "finished_matches_choose": "Выберите матч для просмотра деталей:",
+    "match_not_found": "Матч не найден.",
+    "match_back_to_list_button": "⬅️ К списку матчей",
     "admin_view_all_players_header": "Все игроки:",
     "admin_player_entry_view": "ID: {id}, Имя: {name}, Позиция: {position}",
     "admin_confirm_remove_all_players": "ВНИМАНИЕ! Вы собираетесь удалить ВСЕХ игроков из базы данных. Это действие "
@@ -109,6 +184,10 @@ LEXICON_RU = {
     "admin_all_players_removed_success": "Все игроки успешно удалены.",
     "match_results_details_header": "Результаты матча: {opponent} ({date} {time})",
     "match_player_score_entry": "{}. {player_name} - {points} очков {emoji}",
+    "player_pick_share": " · выбрали {share}%",
+    "match_player_scores_header": "Очки игроков:",
+    "match_no_player_scores": "Нет данных по очкам игроков для этого матча.",
+    "match_user_team": "Ваша команда на этот матч: {players}",
     "match_total_user_score": "Ваша команда набрала: {score} очков.",
     "match_no_team_selected": "Вы не выбрали команду на этот матч.",
     "main_menu_button_notifications": "Уведомления",
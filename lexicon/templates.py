@@ -0,0 +1,130 @@
+import importlib
+import keyword
+from string import Formatter
+from typing import Callable, Dict, Iterator, Mapping, Optional
+
+from config import Config
+
+# Язык -> модуль пакета lexicon с переменной LEXICON_<ЯЗЫК>
+LANGUAGE_MODULES = {
+    "ru": "lexicon.lexicon_ru",
+    "en": "lexicon.lexicon_en",
+}
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Превращает шаблон str.format в функцию с f-строкой внутри: разбор
+    шаблона происходит один раз, а не при каждом рендере. Шаблоны с полями,
+    которые не укладываются в f-строку (атрибуты, индексы, вложенные
+    спецификаторы), остаются на str.format.
+    """
+    body = []
+    positional = []
+    named = []
+    auto_index = 0
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field_name is None:
+            continue
+        if field_name == "":
+            field_name = str(auto_index)
+            auto_index += 1
+        if field_name.isdigit():
+            variable = f"_{field_name}"
+            if variable not in positional:
+                positional.extend(f"_{i}" for i in range(len(positional), int(field_name) + 1))
+        elif field_name.isidentifier() and not keyword.iskeyword(field_name) and not field_name.startswith("_"):
+            variable = field_name
+            if variable not in named:
+                named.append(variable)
+        else:
+            return template.format
+        if "{" in (format_spec or ""):
+            return template.format
+        body.append("{" + variable + (f"!{conversion}" if conversion else "") +
+                    (f":{format_spec}" if format_spec else "") + "}")
+
+    params = ", ".join([*positional, "*_args", *named, "**_kwargs"])
+    source = f"def _render({params}):\n    return f{''.join(body)!r}\n"
+    namespace: Dict[str, Callable[..., str]] = {}
+    exec(compile(source, f"<lexicon template {template[:30]!r}>", "exec"), {}, namespace)
+    return namespace["_render"]
+
+
+class CompiledTemplates(dict):
+    """
+    Скомпилированные шаблоны пакета по ключу: шаблон компилируется при
+    первом обращении и дальше достается обычным поиском в dict, без
+    вызова методов и переупаковки аргументов.
+    """
+
+    def __init__(self, lexicon: "Lexicon"):
+        super().__init__()
+        self._lexicon = lexicon
+
+    def __missing__(self, key: str) -> Callable[..., str]:
+        formatter = self[key] = compile_template(self._lexicon[key])
+        return formatter
+
+
+class Lexicon(Mapping):
+    """
+    Языковой пакет: словарь строк, как LEXICON_RU, плюс templates[key] —
+    шаблоны, скомпилированные при первом использовании. Ключи, которых нет
+    в пакете, берутся из fallback (русского пакета).
+    """
+
+    def __init__(self, language: str, strings: Mapping[str, str], fallback: Optional["Lexicon"] = None):
+        self.language = language
+        self._strings = strings
+        self._fallback = fallback
+        # В горячих местах: lexicon.templates["key"](...) — быстрее str.format
+        self.templates = CompiledTemplates(self)
+
+    def __getitem__(self, key: str) -> str:
+        if key in self._strings:
+            return self._strings[key]
+        if self._fallback is not None:
+            return self._fallback[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._strings
+        if self._fallback is not None:
+            yield from (key for key in self._fallback if key not in self._strings)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def template(self, key: str) -> Callable[..., str]:
+        """Скомпилированный шаблон; в циклах лучше взять его один раз до цикла."""
+        return self.templates[key]
+
+    def render(self, key: str, /, *args, **kwargs) -> str:
+        """
+        Удобная обертка для редких строк: переупаковка аргументов делает ее
+        медленнее str.format, поэтому на горячих путях — templates[key](...).
+        """
+        return self.templates[key](*args, **kwargs)
+
+
+_loaded: Dict[str, Lexicon] = {}
+
+
+def get_lexicon(language_code: Optional[str] = None) -> Lexicon:
+    """
+    Пакет для языка пользователя ("en", "en-US", ...). Модуль языка
+    импортируется при первом обращении; неизвестные языки получают пакет
+    по умолчанию.
+    """
+    language = (language_code or "").split("-")[0].lower()
+    if language not in LANGUAGE_MODULES:
+        language = Config.DEFAULT_LANGUAGE
+    lexicon = _loaded.get(language)
+    if lexicon is None:
+        module = importlib.import_module(LANGUAGE_MODULES[language])
+        strings = getattr(module, f"LEXICON_{language.upper()}")
+        fallback = None if language == Config.DEFAULT_LANGUAGE else get_lexicon(Config.DEFAULT_LANGUAGE)
+        lexicon = _loaded[language] = Lexicon(language, strings, fallback)
+    return lexicon
@@ -1,25 +1,94 @@
-import asyncio
 import logging
+import multiprocessing
+import signal
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.enums import ParseMode
 
 from config import Config
-from database import create_db_pool, create_tables, insert_initial_data, Database
+from database import create_db_pool, create_tables, insert_initial_data, Database, LastSelectedTeamBuffer, \
+    InstrumentedPool
 from keyboards.set_menu import set_main_menu
-from middlewares import DatabaseMiddleware
+from middlewares import DatabaseMiddleware, OutboundLaneMiddleware, LexiconMiddleware, CallbackAckMiddleware, \
+    UserSerializationMiddleware, ThrottlingMiddleware, AdmissionController, LoadSheddingMiddleware
+from utils.outbound import OutboundScheduler, ScheduledAiohttpSession
+from utils.runtime import RuntimeProfile, get_runtime_profile
 from handlers import private_user
+from services import CacheInvalidationListener, DeadlineLockScheduler, STOP, run_intake, run_worker
 
 logging.basicConfig(level=logging.INFO)
 
 
-async def main():
-    bot = Bot(Config.BOT_TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+def create_bot(profile: RuntimeProfile, workers: int = 1) -> Bot:
+    # лимит Bot API общий на весь бот, поэтому каждый воркер получает свою долю
+    scheduler = OutboundScheduler(rate=Config.OUTBOUND_GLOBAL_RATE / workers,
+                                  burst=max(1.0, Config.OUTBOUND_GLOBAL_BURST / workers))
+    session = ScheduledAiohttpSession(scheduler, **profile.session_kwargs())
+    return Bot(Config.BOT_TOKEN, session=session, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+
+
+async def open_database(db_pool) -> Database:
+    db = Database(InstrumentedPool(db_pool))
+    await db.refresh_score_histogram()
+    db.last_team_buffer = LastSelectedTeamBuffer(db)
+    db.last_team_buffer.start()
+    # кэши других процессов сбрасываются по уведомлениям из Postgres
+    db.cache_listener = CacheInvalidationListener(db)
+    db.cache_listener.start()
+    return db
+
+
+def create_dispatcher(db: Database, bot: Bot) -> Dispatcher:
     storage = MemoryStorage()
     dp = Dispatcher(storage=storage)
 
+    # апдейты пользователя по очереди, повторные нажатия схлопываются
+    user_serialization = UserSerializationMiddleware()
+    dp.message.outer_middleware(user_serialization)
+    dp.callback_query.outer_middleware(user_serialization)
+
+    # лимит частоты — до всех остальных middleware, отброшенный апдейт не тратит ресурсы
+    throttling = ThrottlingMiddleware()
+    dp.message.middleware(throttling)
+    dp.callback_query.middleware(throttling)
+
+    # при перегрузке пула БД экраны для чтения отдаются из кэша, лишняя работа отклоняется
+    load_shedding = LoadSheddingMiddleware(AdmissionController(db.pool))
+    bot.session.middleware(load_shedding.remember_screen)
+    dp.message.middleware(load_shedding)
+    dp.callback_query.middleware(load_shedding)
+
+    # ранний ответ на callback — до остальных middleware
+    callback_ack = CallbackAckMiddleware()
+    bot.session.middleware(callback_ack.skip_repeated_answer)
+    dp.callback_query.middleware(callback_ack)
+
+    # middleware для передачи db в хэндлеры
+    dp.message.middleware(DatabaseMiddleware(db, bot))
+    dp.callback_query.middleware(DatabaseMiddleware(db, bot))
+    dp.message.middleware(OutboundLaneMiddleware())
+    dp.callback_query.middleware(OutboundLaneMiddleware())
+    dp.message.middleware(LexiconMiddleware())
+    dp.callback_query.middleware(LexiconMiddleware())
+
+    dp.include_router(private_user.router)
+    return dp
+
+
+async def close_database(db: Database, db_pool) -> None:
+    # дописываем отложенные составы и закрываем пул БД при завершении работы
+    await db.cache_listener.close()
+    await db.last_team_buffer.close()
+    await db.flush_usernames()
+    await db_pool.close()
+
+
+async def main(profile: RuntimeProfile):
+    bot = create_bot(profile)
+
     db_pool = await create_db_pool()
     if not db_pool:
         logging.error("Не удалось подключиться к базе данных. Завершение работы.")
@@ -29,25 +98,112 @@ async def main():
         await create_tables(conn)
         await insert_initial_data(conn)
 
-    db = Database(db_pool)
+    db = await open_database(db_pool)
+    deadline_lock = DeadlineLockScheduler(db)
+    deadline_lock.start()
+    dp = create_dispatcher(db, bot)
 
-    # middleware для передачи db в хэндлеры
-    dp.message.middleware(DatabaseMiddleware(db, bot))
-    dp.callback_query.middleware(DatabaseMiddleware(db, bot))
-
-    dp.include_router(private_user.router)
     await set_main_menu(bot)
     logging.info("Запуск бота...")
     await bot.delete_webhook(drop_pending_updates=True)
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await deadline_lock.close()
+        await close_database(db, db_pool)
+    logging.info("Бот остановлен.")
+
 
-    # close пул БД при завершении работы
+async def worker_main(profile: RuntimeProfile, index: int, workers: int, updates_queue, metrics_queue):
+    bot = create_bot(profile, workers)
+    db_pool = await create_db_pool(min_size=max(1, Config.DB_POOL_MIN_SIZE // workers),
+                                   max_size=max(1, Config.DB_POOL_MAX_SIZE // workers))
+    if not db_pool:
+        logging.error("Воркер %s: не удалось подключиться к базе данных.", index)
+        return
+
+    db = await open_database(db_pool)
+    # заморозка составов — общая для всех, достаточно одного планировщика
+    deadline_lock = DeadlineLockScheduler(db) if index == 0 else None
+    if deadline_lock:
+        deadline_lock.start()
+    dp = create_dispatcher(db, bot)
+
+    logging.info("Воркер %s запущен.", index)
+    try:
+        await run_worker(index, bot, dp, updates_queue, metrics_queue)
+    finally:
+        if deadline_lock:
+            await deadline_lock.close()
+        await close_database(db, db_pool)
+        await bot.session.close()
+    logging.info("Воркер %s остановлен.", index)
+
+
+def worker_process(index: int, workers: int, updates_queue, metrics_queue):
+    """Точка входа процесса-воркера; останавливается по STOP из приемника, а не по Ctrl+C."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    profile = get_runtime_profile()
+    profile.run(worker_main(profile, index, workers, updates_queue, metrics_queue))
+
+
+async def prepare_database() -> bool:
+    db_pool = await create_db_pool(min_size=1, max_size=1)
+    if not db_pool:
+        logging.error("Не удалось подключиться к базе данных. Завершение работы.")
+        return False
+    async with db_pool.acquire() as conn:
+        await create_tables(conn)
+        await insert_initial_data(conn)
     await db_pool.close()
-    logging.info("Бот остановлен.")
+    return True
+
+
+async def intake_main(profile: RuntimeProfile, queues, metrics_queue, processes):
+    bot = Bot(Config.BOT_TOKEN, session=AiohttpSession(**profile.session_kwargs()))
+    try:
+        await set_main_menu(bot)
+        await bot.delete_webhook(drop_pending_updates=True)
+        logging.info("Запуск бота: %s воркеров...", len(queues))
+        await run_intake(bot, private_user.router.resolve_used_update_types(), queues, metrics_queue, processes)
+    finally:
+        await bot.session.close()
+
+
+def run_sharded(profile: RuntimeProfile, workers: int):
+    """
+    Приемник в этом процессе и workers процессов-воркеров. Апдейты делятся
+    по пользователю, поэтому FSM каждого пользователя живет в одном воркере.
+    """
+    if not profile.run(prepare_database()):
+        return
+
+    context = multiprocessing.get_context("spawn")
+    queues = [context.Queue() for _ in range(workers)]
+    metrics_queue = context.Queue()
+    processes = [context.Process(target=worker_process, args=(index, workers, queues[index], metrics_queue),
+                                 name=f"worker-{index}")
+                 for index in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        profile.run(intake_main(profile, queues, metrics_queue, processes))
+    finally:
+        for updates_queue in queues:
+            updates_queue.put(STOP)
+        for process in processes:
+            process.join()
+        logging.info("Бот остановлен.")
 
 
 if __name__ == "__main__":
+    runtime_profile = get_runtime_profile()
+    logging.info("Профиль выполнения %s: цикл %s, JSON %s", runtime_profile.name,
+                 runtime_profile.loop_name, runtime_profile.json_name)
     try:
-        asyncio.run(main())
+        if Config.WORKERS > 1:
+            run_sharded(runtime_profile, Config.WORKERS)
+        else:
+            runtime_profile.run(main(runtime_profile))
     except (KeyboardInterrupt, SystemExit):
-        logging.info("Бот выключен.")
\ No newline at end of file
+        logging.info("Бот выключен.")
@@ -1 +1,7 @@
 from .database import DatabaseMiddleware
+from .outbound import OutboundLaneMiddleware
+from .lexicon import LexiconMiddleware
+from .callback_ack import CallbackAckMiddleware
+from .user_serialization import UserSerializationMiddleware
+from .throttling import ThrottlingMiddleware
+from .load_shedding import AdmissionController, LoadSheddingMiddleware
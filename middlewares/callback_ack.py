@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import Callable, Dict, Any, Awaitable
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.exceptions import TelegramAPIError
+from aiogram.methods import AnswerCallbackQuery, TelegramMethod
+from aiogram.types import CallbackQuery, TelegramObject
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackAckMiddleware(BaseMiddleware):
+    """
+    Отвечает на callback-запрос сразу, параллельно с хэндлером: крутилка
+    на кнопке пропадает через один запрос к Bot API, а не после всей работы
+    с БД и редактирования сообщения.
+
+    Маршруты с флагом manual_answer (хэндлеры, которые показывают alert или
+    текст) отвечают сами. Для остальных до Bot API доходит только первый
+    ответ, повторный callback.answer() хэндлера отбрасывает
+    skip_repeated_answer — middleware сессии бота.
+    """
+
+    def __init__(self):
+        # id callback-запроса -> ответ уже отправлен
+        self._early: Dict[str, bool] = {}
+        self.acked_early = 0
+        self.skipped_answers = 0
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        route = data.get("callback_route")
+        if not isinstance(event, CallbackQuery) or route is None or route.flags.get("manual_answer"):
+            return await handler(event, data)
+
+        self._early[event.id] = False
+        ack = asyncio.ensure_future(event.answer())
+        self.acked_early += 1
+        try:
+            return await handler(event, data)
+        finally:
+            try:
+                await ack
+            except TelegramAPIError as e:
+                logger.warning("Не удалось ответить на callback %s: %s", event.id, e)
+            self._early.pop(event.id, None)
+
+    async def skip_repeated_answer(self, make_request: Callable[..., Awaitable[Any]], bot: Bot,
+                                   method: TelegramMethod) -> Any:
+        if isinstance(method, AnswerCallbackQuery) and method.callback_query_id in self._early:
+            if self._early[method.callback_query_id]:
+                self.skipped_answers += 1
+                if method.text:
+                    logger.warning("Текст ответа на callback %s потерян: маршрут без manual_answer",
+                                   method.callback_query_id)
+                return True
+            self._early[method.callback_query_id] = True
+        return await make_request(bot, method)
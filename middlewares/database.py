@@ -1,14 +1,17 @@
-from typing import Callable, Dict, Any, Awaitable
+import asyncio
+from typing import Callable, Dict, Any, Awaitable, Optional
 from aiogram import BaseMiddleware
-from aiogram.types import TelegramObject
+from aiogram.types import TelegramObject, User
 
 from database import Database
+from utils.users import display_username
 
 
 class DatabaseMiddleware(BaseMiddleware):
     def __init__(self, db_session: Database, bot):
         self.db_session = db_session
         self.bot = bot
+        self._username_flush: Optional[asyncio.Task] = None
 
     async def __call__(
             self,
@@ -18,4 +21,11 @@ class DatabaseMiddleware(BaseMiddleware):
     ) -> Any:
         data["db"] = self.db_session
         data["bot"] = self.bot
+
+        user: Optional[User] = data.get("event_from_user")
+        if user:
+            self.db_session.note_username(user.id, display_username(user))
+            if self.db_session.usernames_flush_due() and (self._username_flush is None or self._username_flush.done()):
+                self._username_flush = asyncio.create_task(self.db_session.flush_usernames())
+
         return await handler(event, data)
@@ -0,0 +1,19 @@
+from typing import Callable, Dict, Any, Awaitable
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from lexicon import get_lexicon
+
+
+class LexiconMiddleware(BaseMiddleware):
+    """Передает в хэндлеры языковой пакет пользователя по language_code из Telegram."""
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        user = data.get("event_from_user")
+        data["lexicon"] = get_lexicon(user.language_code if user else None)
+        return await handler(event, data)
@@ -0,0 +1,140 @@
+import logging
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Callable, Dict, Any, Awaitable, Hashable, Optional, Tuple
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.methods import EditMessageText, SendMessage, TelegramMethod
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message, TelegramObject
+
+from config import Config
+from database import InstrumentedPool, PoolBusyError, db_access
+from lexicon import get_lexicon
+from states import AdminStates
+from utils.edit_dedup import edit_text
+
+logger = logging.getLogger(__name__)
+
+# Ключ экрана, который сейчас рисует хэндлер: его ответ запоминается в кэше
+_screen_key: ContextVar[Optional[Hashable]] = ContextVar("screen_key", default=None)
+
+
+class AdmissionController:
+    """
+    Решает, перегружен ли процесс: слишком много апдейтов в работе или
+    соединений пула БД ждут дольше порога.
+    """
+
+    def __init__(self, pool: InstrumentedPool, max_in_flight: int = Config.SHED_MAX_IN_FLIGHT,
+                 max_pool_wait: float = Config.SHED_POOL_WAIT, max_pool_waiters: int = Config.SHED_POOL_WAITERS):
+        self.pool = pool
+        self.max_in_flight = max_in_flight
+        self.max_pool_wait = max_pool_wait
+        self.max_pool_waiters = max_pool_waiters
+        self.in_flight = 0
+
+    @property
+    def overloaded(self) -> bool:
+        return (self.in_flight >= self.max_in_flight
+                or self.pool.waiting >= self.max_pool_waiters
+                or self.pool.wait_ewma >= self.max_pool_wait)
+
+
+class LoadSheddingMiddleware(BaseMiddleware):
+    """
+    Деградация под нагрузкой по флагам хэндлера:
+    - read_screen="shared"/"personal" — экран только для чтения (расписание,
+      рейтинг, результаты). Последний показанный вариант кэшируется (общий
+      для всех или на пользователя), при перегрузке отдается из кэша с
+      пометкой о возможной задержке данных;
+    - critical=True — запись (сохранение состава, сброс, регистрация),
+      выполняется всегда и может брать резервные соединения пула;
+    - остальное при перегрузке сразу получает ответ "бот перегружен".
+    Некритичный хэндлер ждет соединение пула не дольше
+    DB_READ_ACQUIRE_TIMEOUT секунд, а не дождавшись, отвечает так же, как
+    при перегрузке. Админ-панель не ограничивается.
+    """
+
+    def __init__(self, admission: AdmissionController, cache_size: int = Config.SHED_SCREEN_CACHE_SIZE):
+        self.admission = admission
+        self.cache_size = cache_size
+        self._screens: "OrderedDict[Hashable, Tuple[str, Optional[InlineKeyboardMarkup]]]" = OrderedDict()
+        self.served_cached = 0
+        self.rejected = 0
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        user = data.get("event_from_user")
+        raw_state = data.get("raw_state")
+        if user is None or (raw_state and raw_state in AdminStates):
+            return await self._run(handler, event, data)
+
+        route = data.get("callback_route")
+        flags = route.flags if route is not None else data["handler"].flags
+        read_screen = flags.get("read_screen")
+        key = None
+        if read_screen:
+            handler_name = (route.handler if route is not None else data["handler"]).callback.__name__
+            args = tuple(sorted(data.get("callback_args", {}).items()))
+            key = (handler_name, args, user.language_code, user.id if read_screen == "personal" else None)
+
+        critical = bool(flags.get("critical"))
+        if not critical and self.admission.overloaded:
+            return await self._degrade(event, user.language_code, key)
+
+        token = _screen_key.set(key)
+        try:
+            with db_access(critical, None if critical else Config.DB_READ_ACQUIRE_TIMEOUT):
+                return await self._run(handler, event, data)
+        except PoolBusyError as e:
+            logger.warning(f"Пул БД занят, апдейт пользователя {user.id} обслужен в деградации: {e}")
+        finally:
+            _screen_key.reset(token)
+        return await self._degrade(event, user.language_code, key)
+
+    async def _degrade(self, event: TelegramObject, language_code: Optional[str], key: Optional[Hashable]) -> None:
+        lexicon = get_lexicon(language_code)
+        cached = self._screens.get(key) if key is not None else None
+        if cached is not None:
+            self.served_cached += 1
+            text, reply_markup = cached
+            await self._reply(event, lexicon["load_data_delayed"] + "\n\n" + text, reply_markup)
+        else:
+            self.rejected += 1
+            await self._reply(event, lexicon["load_busy"], None, toast=True)
+
+    async def _run(self, handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+                   event: TelegramObject, data: Dict[str, Any]) -> Any:
+        self.admission.in_flight += 1
+        try:
+            return await handler(event, data)
+        finally:
+            self.admission.in_flight -= 1
+
+    @staticmethod
+    async def _reply(event: TelegramObject, text: str, reply_markup: Optional[InlineKeyboardMarkup],
+                     toast: bool = False) -> None:
+        if isinstance(event, Message):
+            await event.answer(text=text, reply_markup=reply_markup)
+        elif isinstance(event, CallbackQuery):
+            if toast:
+                await event.answer(text)
+                return
+            await edit_text(event.message, text=text, reply_markup=reply_markup)
+            await event.answer()
+
+    async def remember_screen(self, make_request: Callable[..., Awaitable[Any]], bot: Bot,
+                              method: TelegramMethod) -> Any:
+        """Middleware сессии бота: запоминает ответ хэндлера экрана для чтения."""
+        result = await make_request(bot, method)
+        key = _screen_key.get()
+        if key is not None and isinstance(method, (SendMessage, EditMessageText)) and method.text:
+            self._screens[key] = (method.text, method.reply_markup)
+            self._screens.move_to_end(key)
+            if len(self._screens) > self.cache_size:
+                self._screens.popitem(last=False)
+        return result
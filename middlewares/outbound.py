@@ -0,0 +1,21 @@
+from typing import Callable, Dict, Any, Awaitable
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from states import AdminStates
+from utils.outbound import Lane, set_outbound_lane
+
+
+class OutboundLaneMiddleware(BaseMiddleware):
+    """Ответы в админ-панели идут в очередь ADMIN, остальные — в INTERACTIVE."""
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        raw_state = data.get("raw_state")
+        if raw_state and raw_state in AdminStates:
+            set_outbound_lane(Lane.ADMIN)
+        return await handler(event, data)
@@ -0,0 +1,105 @@
+import logging
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Any, Awaitable, Set
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import CallbackQuery, Message, TelegramObject
+
+from config import Config
+from lexicon import get_lexicon
+from states import AdminStates
+from utils.outbound import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """
+    Token bucket на пользователя: THROTTLE_RATE токенов в секунду, запас
+    THROTTLE_BURST. Обычный апдейт стоит 1 токен, тяжелые запросы к БД —
+    throttle_cost из флагов хэндлера (callbacks.register(..., throttle_cost=N)
+    или router.message(..., flags={"throttle_cost": N})).
+
+    Апдейт сверх лимита не доходит до хэндлера и не занимает соединение
+    пула: на callback приходит короткий ответ, на сообщение — одно
+    предупреждение на серию. Админ-панель не ограничивается.
+    Счетчики отброшенных апдейтов периодически пишутся в лог.
+    """
+
+    def __init__(self, rate: float = Config.THROTTLE_RATE, burst: float = Config.THROTTLE_BURST,
+                 max_users: int = Config.THROTTLE_MAX_USERS):
+        self.rate = rate
+        self.burst = burst
+        self.max_users = max_users
+        self._buckets: "OrderedDict[int, TokenBucket]" = OrderedDict()
+        # Пользователи, которым уже сказали подождать в текущей серии
+        self._warned: Set[int] = set()
+        self.throttled = 0
+        self.throttled_by_handler: Counter = Counter()
+        self.throttled_by_user: Counter = Counter()
+        self._reported_at = time.monotonic()
+
+    def _bucket(self, user_id: int) -> TokenBucket:
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            bucket = self._buckets[user_id] = TokenBucket(self.rate, self.burst)
+            if len(self._buckets) > self.max_users:
+                evicted, _ = self._buckets.popitem(last=False)
+                self._warned.discard(evicted)
+        else:
+            self._buckets.move_to_end(user_id)
+        return bucket
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        user = data.get("event_from_user")
+        raw_state = data.get("raw_state")
+        if user is None or (raw_state and raw_state in AdminStates):
+            return await handler(event, data)
+
+        route = data.get("callback_route")
+        if route is not None:
+            cost = route.flags.get("throttle_cost", 1)
+            handler_name = route.handler.callback.__name__
+        else:
+            cost = get_flag(data, "throttle_cost", default=1)
+            handler_name = data["handler"].callback.__name__
+
+        if self._bucket(user.id).try_take(cost):
+            self._warned.discard(user.id)
+            return await handler(event, data)
+
+        self.throttled += 1
+        self.throttled_by_handler[handler_name] += 1
+        self.throttled_by_user[user.id] += 1
+        self._report()
+
+        text = get_lexicon(user.language_code)["throttled"]
+        if isinstance(event, CallbackQuery):
+            await event.answer(text)
+        elif isinstance(event, Message) and user.id not in self._warned:
+            self._warned.add(user.id)
+            await event.answer(text)
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "throttled": self.throttled,
+            "handlers": dict(self.throttled_by_handler.most_common(5)),
+            "top_users": dict(self.throttled_by_user.most_common(5)),
+            "tracked_users": len(self._buckets),
+        }
+
+    def _report(self) -> None:
+        if time.monotonic() - self._reported_at < Config.THROTTLE_REPORT_INTERVAL:
+            return
+        logger.info("Ограничение частоты: отброшено %(throttled)s апдейтов, по хэндлерам %(handlers)s, "
+                    "чаще всего у %(top_users)s; пользователей в учете %(tracked_users)s", self.snapshot())
+        self.throttled_by_user.clear()
+        self._reported_at = time.monotonic()
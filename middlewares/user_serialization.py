@@ -0,0 +1,64 @@
+import asyncio
+from typing import Callable, Dict, Any, Awaitable, Set, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, TelegramObject
+
+
+class UserSerializationMiddleware(BaseMiddleware):
+    """
+    Апдейты одного пользователя обрабатываются строго по очереди: пока
+    работает хэндлер, следующие апдейты этого пользователя ждут. Иначе
+    быстрые нажатия гоняются на state.get_data()/update_data().
+
+    Одинаковые нажатия (та же кнопка того же сообщения), которые еще ждут
+    своей очереди, схлопываются в одно: лишние только получают ответ на
+    callback, без хэндлера, запросов к БД и редактирования.
+
+    Регистрируется как outer middleware message/callback_query: состояние
+    FSM перечитывается уже под блокировкой, чтобы фильтры маршрутов видели
+    результат предыдущего апдейта.
+    """
+
+    def __init__(self):
+        self._locks: Dict[int, asyncio.Lock] = {}
+        self._users: Dict[int, int] = {}
+        self._pending: Set[Tuple[int, int, str]] = set()
+        self.coalesced = 0
+
+    async def __call__(
+            self,
+            handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+            event: TelegramObject,
+            data: Dict[str, Any]
+    ) -> Any:
+        user = data.get("event_from_user")
+        if user is None:
+            return await handler(event, data)
+
+        key = None
+        if isinstance(event, CallbackQuery) and event.message is not None:
+            key = (user.id, event.message.message_id, event.data)
+            if key in self._pending:
+                self.coalesced += 1
+                await event.answer()
+                return None
+            self._pending.add(key)
+
+        lock = self._locks.get(user.id)
+        if lock is None:
+            lock = self._locks[user.id] = asyncio.Lock()
+        self._users[user.id] = self._users.get(user.id, 0) + 1
+        try:
+            async with lock:
+                self._pending.discard(key)
+                state = data.get("state")
+                if state is not None:
+                    data["raw_state"] = await state.get_state()
+                return await handler(event, data)
+        finally:
+            self._pending.discard(key)
+            self._users[user.id] -= 1
+            if not self._users[user.id]:
+                del self._users[user.id]
+                del self._locks[user.id]
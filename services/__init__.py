@@ -0,0 +1,4 @@
+from .deadline_lock import DeadlineLockScheduler
+from .export import export_to_gzip_files
+from .sharding import STOP, run_intake, run_worker, shard_index
+from .cache_invalidation import CacheInvalidationListener
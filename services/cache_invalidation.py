@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from typing import Optional
+
+from config import Config
+from database import create_db_connection
+
+
+class CacheInvalidationListener:
+    """
+    Слушает канал CACHE_NOTIFY_CHANNEL на отдельном подключении (вне пула) и
+    сбрасывает кэши этого процесса, когда данные поменял другой процесс:
+    поднимает db.data_versions, а на "scores" перестраивает гистограмму очков.
+    Уведомления самого процесса пропускаются — он сбросил кэши при записи.
+
+    Пока подключения нет, уведомления теряются, поэтому после переподключения
+    сбрасывается все сразу.
+    """
+
+    def __init__(self, db, channel: str = Config.CACHE_NOTIFY_CHANNEL,
+                 reconnect_delay: float = Config.CACHE_LISTENER_RECONNECT):
+        self.db = db
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.received = 0
+        self._task: Optional[asyncio.Task] = None
+        self._histogram_task: Optional[asyncio.Task] = None
+        self._histogram_stale = False
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        for task in (self._task, self._histogram_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._histogram_task = None
+
+    async def _run(self) -> None:
+        connected_before = False
+        while True:
+            conn = None
+            try:
+                conn = await create_db_connection()
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(self.channel, self._on_notification)
+                if connected_before:
+                    self._invalidate_all()
+                connected_before = True
+                logging.info(f"Слушатель изменений подключен к каналу {self.channel}")
+                await lost.wait()
+                print("Слушатель изменений потерял подключение к базе данных")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Ошибка слушателя изменений: {e}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notification(self, _conn, _pid: int, _channel: str, payload: str) -> None:
+        source, _, instance_id = payload.rpartition(":")
+        if not source or instance_id == self.db.instance_id:
+            return
+        self.received += 1
+        self._invalidate(source)
+
+    def _invalidate(self, source: str) -> None:
+        self.db.bump_data_version(source)
+        if source == "scores":
+            self._refresh_histogram()
+
+    def _invalidate_all(self) -> None:
+        for source in {"players", "matches", "settings", *self.db.data_versions}:
+            self.db.bump_data_version(source)
+        self._refresh_histogram()
+
+    def _refresh_histogram(self) -> None:
+        # Пачка уведомлений подряд (импорт, оценка нескольких матчей) — одна-две перестройки, а не по одной на каждое
+        self._histogram_stale = True
+        if self._histogram_task is None or self._histogram_task.done():
+            self._histogram_task = asyncio.create_task(self._rebuild_histogram())
+
+    async def _rebuild_histogram(self) -> None:
+        while self._histogram_stale:
+            self._histogram_stale = False
+            try:
+                await self.db.refresh_score_histogram()
+            except Exception as e:
+                print(f"Ошибка при перестройке гистограммы очков: {e}")
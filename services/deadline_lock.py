@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from typing import Optional
+
+from config import Config
+from utils.timezone import naive_now
+
+
+class DeadlineLockScheduler:
+    """
+    Фоновая задача, которая в дедлайн каждого матча (начало матча минус
+    TEAM_DEADLINE_MINUTES) замораживает составы в lineup_snapshots.
+    Спит не дольше DEADLINE_LOCK_RECHECK секунд, чтобы подхватить перенос
+    матча или новый матч, добавленный админом.
+    """
+
+    def __init__(self, db, recheck_interval: float = Config.DEADLINE_LOCK_RECHECK):
+        self.db = db
+        self.recheck_interval = recheck_interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                match = await self.db.get_next_match_to_lock()
+                if not match:
+                    await asyncio.sleep(self.recheck_interval)
+                    continue
+
+                delay = (match['deadline'] - naive_now()).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(min(delay, self.recheck_interval))
+                    continue
+
+                locked_count = await self.db.lock_match_lineups(match['id'])
+                if locked_count is not None:
+                    logging.info(f"Составы на матч {match['id']} заморожены: {locked_count}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Ошибка при заморозке составов: {e}")
+                await asyncio.sleep(self.recheck_interval)
@@ -0,0 +1,25 @@
+import gzip
+import os
+import tempfile
+from typing import AsyncIterator, Tuple
+
+from database import Database
+from utils.timezone import naive_now
+
+
+async def export_to_gzip_files(db: Database) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Пишет каждую выгрузку Database.EXPORT_QUERIES во временный .csv.gz по
+    мере получения данных из COPY и отдает (путь, имя файла для отправки).
+    Файл удаляется, когда вызывающий код переходит к следующему.
+    """
+    stamp = naive_now().strftime("%Y%m%d_%H%M")
+    for name in db.EXPORT_QUERIES:
+        fd, path = tempfile.mkstemp(suffix=".csv.gz")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                async for chunk in db.stream_export(name):
+                    gz.write(chunk)
+            yield path, f"{name}_{stamp}.csv.gz"
+        finally:
+            os.remove(path)
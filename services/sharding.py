@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import queue
+import time
+import zlib
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from aiogram import Bot, Dispatcher
+from aiogram.exceptions import TelegramNetworkError, TelegramRetryAfter, TelegramServerError
+from aiogram.types import Update
+from aiogram.utils.backoff import Backoff, BackoffConfig
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Сигнал воркеру, что новых апдейтов не будет
+STOP = None
+
+# Паузы между повторами getUpdates после сетевых ошибок — как у dp.start_polling
+INTAKE_BACKOFF = BackoffConfig(min_delay=1.0, max_delay=5.0, factor=1.3, jitter=0.1)
+
+
+def update_user_id(update: Update) -> int:
+    """telegram_id автора апдейта; для апдейтов без пользователя — id чата или 0."""
+    event = update.event
+    user = getattr(event, "from_user", None)
+    if user is not None:
+        return user.id
+    chat = getattr(event, "chat", None)
+    return chat.id if chat is not None else 0
+
+
+def shard_index(user_id: int, workers: int) -> int:
+    """Номер воркера для пользователя: стабилен между перезапусками, в отличие от hash()."""
+    return zlib.crc32(user_id.to_bytes(8, "little", signed=True)) % workers
+
+
+class WorkerMetrics:
+    """Счетчики одного воркера, которые он периодически отправляет в приемник."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.handled = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._reported_handled = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def started(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finished(self, latency: float, ok: bool) -> None:
+        self.in_flight -= 1
+        self.handled += 1
+        if not ok:
+            self.failed += 1
+        self._latency_total += latency
+        self._latency_max = max(self._latency_max, latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Метрики за период с прошлого снимка (кроме накопительных handled/failed)."""
+        period_handled = self.handled - self._reported_handled
+        snapshot = {
+            "worker": self.index,
+            "handled": self.handled,
+            "failed": self.failed,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "avg_ms": round(1000 * self._latency_total / period_handled, 1) if period_handled else 0.0,
+            "max_ms": round(1000 * self._latency_max, 1),
+        }
+        self._reported_handled = self.handled
+        self._latency_total = self._latency_max = 0.0
+        self.max_in_flight = self.in_flight
+        return snapshot
+
+
+async def run_worker(index: int, bot: Bot, dp: Dispatcher, updates: "queue.Queue",
+                     metrics_queue: "queue.Queue") -> None:
+    """
+    Цикл воркера: забирает апдейты своей доли пользователей из очереди
+    процесса и отдает их диспетчеру. Как и при обычном polling, каждый апдейт
+    обрабатывается в отдельной задаче.
+    """
+    loop = asyncio.get_running_loop()
+    metrics = WorkerMetrics(index)
+    tasks: Set[asyncio.Task] = set()
+    reported_at = time.monotonic()
+
+    async def handle(raw_update: Dict[str, Any], routed_at: float) -> None:
+        metrics.started()
+        ok = True
+        try:
+            await dp.feed_raw_update(bot, raw_update)
+        except Exception:
+            ok = False
+            logger.exception("Воркер %s: ошибка при обработке апдейта %s", index, raw_update.get("update_id"))
+        finally:
+            # Время между приемом апдейта в приемнике и концом обработки, включая ожидание в очереди
+            metrics.finished(time.time() - routed_at, ok)
+
+    while True:
+        try:
+            item = await loop.run_in_executor(None, updates.get, True, Config.WORKER_METRICS_INTERVAL)
+        except queue.Empty:
+            pass
+        else:
+            if item is STOP:
+                break
+            raw_update, routed_at = item
+            task = asyncio.create_task(handle(raw_update, routed_at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        if time.monotonic() - reported_at >= Config.WORKER_METRICS_INTERVAL:
+            metrics_queue.put(metrics.snapshot())
+            reported_at = time.monotonic()
+
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    metrics_queue.put(metrics.snapshot())
+
+
+async def run_intake(bot: Bot, allowed_updates: List[str], queues: List["queue.Queue"],
+                     metrics_queue: "queue.Queue", processes: Sequence[BaseProcess] = ()) -> None:
+    """
+    Приемник: один long polling на весь бот. Каждый апдейт уходит в очередь
+    воркера по хэшу from_user.id, поэтому FSM и порядок апдейтов пользователя
+    всегда в одном процессе. Метрики воркеров пишутся в лог.
+
+    Ошибки сети и Bot API переживаются с паузой и тем же offset. Если какой-то
+    воркер из processes завершился, приемник останавливается: апдейты его доли
+    пользователей некому обрабатывать.
+    """
+    workers = len(queues)
+    routed = [0] * workers
+    offset: Optional[int] = None
+    logged_at = time.monotonic()
+    backoff = Backoff(INTAKE_BACKOFF)
+
+    while True:
+        dead = [process.name for process in processes if not process.is_alive()]
+        if dead:
+            raise RuntimeError(f"Воркеры завершились: {', '.join(dead)}")
+
+        try:
+            updates = await bot.get_updates(offset=offset, timeout=Config.POLLING_TIMEOUT,
+                                            allowed_updates=allowed_updates)
+        except TelegramRetryAfter as e:
+            logger.warning("Приемник: Bot API просит подождать %s с", e.retry_after)
+            await asyncio.sleep(e.retry_after)
+            continue
+        except (TelegramNetworkError, TelegramServerError) as e:
+            logger.error("Приемник: не удалось получить апдейты - %s: %s", type(e).__name__, e)
+            await backoff.asleep()
+            continue
+        backoff.reset()
+
+        for update in updates:
+            offset = update.update_id + 1
+            index = shard_index(update_user_id(update), workers)
+            queues[index].put((update.model_dump(mode="json", exclude_none=True), time.time()))
+            routed[index] += 1
+
+        while True:
+            try:
+                snapshot = metrics_queue.get_nowait()
+            except queue.Empty:
+                break
+            logger.info("Воркер %(worker)s: обработано %(handled)s (ошибок %(failed)s), в работе %(in_flight)s "
+                        "(макс. %(max_in_flight)s), задержка ср. %(avg_ms)s мс / макс. %(max_ms)s мс", snapshot)
+
+        if time.monotonic() - logged_at >= Config.WORKER_METRICS_INTERVAL:
+            logger.info("Приемник: распределено апдейтов по воркерам %s", routed)
+            logged_at = time.monotonic()
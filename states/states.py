@@ -19,6 +19,7 @@ class AdminStates(StatesGroup):
     selecting_match_to_edit = State()
     editing_match_opponent = State()
     editing_match_datetime = State()
+    importing_matches = State()
 
     # Player Management
     managing_players = State()
@@ -31,9 +32,19 @@ class AdminStates(StatesGroup):
     selecting_player_to_delete = State()
     confirming_player_delete = State()
     confirming_delete_all_players = State()
+    importing_players = State()
 
     # Score Management
     selecting_match_to_score = State()
     entering_player_points = State()
+    confirming_player_points = State()
     entering_notification_message = State()
     confirming_notification_send = State()
+
+    # Score Correction
+    selecting_match_to_correct = State()
+    selecting_player_to_correct = State()
+    entering_corrected_points = State()
+
+    # Seasons
+    entering_season_name = State()
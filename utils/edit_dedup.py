@@ -0,0 +1,88 @@
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import InlineKeyboardMarkup, Message
+
+MAX_CHATS = 10000
+MESSAGES_PER_CHAT = 4
+
+
+def content_digest(text: Optional[str], reply_markup: Optional[InlineKeyboardMarkup]) -> bytes:
+    markup_json = reply_markup.model_dump_json(exclude_none=True) if reply_markup else ""
+    return hashlib.blake2b(f"{text or ''}\0{markup_json}".encode(), digest_size=16).digest()
+
+
+class EditDeduplicator:
+    """
+    LRU по чатам: message_id -> хэш текста и клавиатуры, которые сейчас
+    показаны в сообщении. Позволяет не отправлять edit_text с тем же
+    содержимым (лишний запрос к Bot API и ошибка "message is not modified").
+    """
+
+    def __init__(self, max_chats: int = MAX_CHATS, messages_per_chat: int = MESSAGES_PER_CHAT):
+        self.max_chats = max_chats
+        self.messages_per_chat = messages_per_chat
+        self._chats: "OrderedDict[int, OrderedDict[int, bytes]]" = OrderedDict()
+        self.skipped = 0
+
+    def get(self, chat_id: int, message_id: int) -> Optional[bytes]:
+        messages = self._chats.get(chat_id)
+        if messages is None:
+            return None
+        self._chats.move_to_end(chat_id)
+        return messages.get(message_id)
+
+    def remember(self, chat_id: int, message_id: int, digest: bytes) -> None:
+        messages = self._chats.get(chat_id)
+        if messages is None:
+            messages = self._chats[chat_id] = OrderedDict()
+            if len(self._chats) > self.max_chats:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        messages[message_id] = digest
+        messages.move_to_end(message_id)
+        if len(messages) > self.messages_per_chat:
+            messages.popitem(last=False)
+
+    def forget(self, chat_id: int, message_id: int) -> None:
+        messages = self._chats.get(chat_id)
+        if messages is not None:
+            messages.pop(message_id, None)
+
+
+edit_deduplicator = EditDeduplicator()
+
+
+def _shown_digest(message: Message) -> Optional[bytes]:
+    """Хэш того, что показано в сообщении сейчас: из LRU или из самого апдейта."""
+    digest = edit_deduplicator.get(message.chat.id, message.message_id)
+    if digest is None and message.text is not None:
+        digest = content_digest(message.html_text, message.reply_markup)
+    return digest
+
+
+async def edit_text(message: Message, text: str, reply_markup: Optional[InlineKeyboardMarkup] = None) -> bool:
+    """
+    edit_text, который пропускает редактирование, если сообщение уже
+    показывает тот же текст и клавиатуру. Возвращает True, если запрос ушел.
+    """
+    digest = content_digest(text, reply_markup)
+    if _shown_digest(message) == digest:
+        edit_deduplicator.skipped += 1
+        return False
+    try:
+        await message.edit_text(text=text, reply_markup=reply_markup)
+    except TelegramBadRequest as e:
+        if "message is not modified" not in e.message:
+            raise
+    edit_deduplicator.remember(message.chat.id, message.message_id, digest)
+    return True
+
+
+async def edit_reply_markup(message: Message, reply_markup: Optional[InlineKeyboardMarkup] = None) -> None:
+    """edit_reply_markup, который сбрасывает запомненный хэш сообщения."""
+    edit_deduplicator.forget(message.chat.id, message.message_id)
+    await message.edit_reply_markup(reply_markup=reply_markup)
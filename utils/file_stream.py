@@ -0,0 +1,72 @@
+import csv
+from typing import AsyncIterable, AsyncIterator, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.types import Document
+
+CSV_DELIMITERS = (";", ",", "\t")
+
+
+async def stream_document(bot: Bot, document: Document, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    """Содержимое документа из Telegram по частям, без загрузки файла целиком в память."""
+    file = await bot.get_file(document.file_id)
+    url = bot.session.api.file_url(bot.token, file.file_path)
+    async for chunk in bot.session.stream_content(url=url, chunk_size=chunk_size):
+        yield chunk
+
+
+async def sniff_csv_delimiter(chunks: AsyncIterator[bytes]) -> Tuple[str, AsyncIterator[bytes]]:
+    """
+    Определяет разделитель CSV по первой строке (Excel с русской локалью
+    сохраняет через ";"). Возвращает разделитель и поток с тем же содержимым.
+    """
+    try:
+        head = await chunks.__anext__()
+    except StopAsyncIteration:
+        head = b""
+
+    first_line = head.split(b"\n", 1)[0].decode("utf-8", errors="ignore")
+    delimiter = max(CSV_DELIMITERS, key=first_line.count)
+
+    async def replay() -> AsyncIterator[bytes]:
+        if head:
+            yield head
+        async for chunk in chunks:
+            yield chunk
+
+    return delimiter, replay()
+
+
+def parse_csv_line(raw: bytes, delimiter: str, width: int) -> Tuple[Optional[str], ...]:
+    """
+    Поля одной строки CSV или кортеж из None, если строка битая: не UTF-8,
+    незакрытые кавычки, NUL или не то число колонок.
+    """
+    try:
+        line = raw.rstrip(b"\r").decode("utf-8")
+        if "\x00" in line:
+            raise ValueError("NUL в строке")
+        fields = next(csv.reader([line], delimiter=delimiter, strict=True))
+    except (UnicodeDecodeError, ValueError, csv.Error):
+        return (None,) * width
+    return tuple(fields) if len(fields) == width else (None,) * width
+
+
+async def csv_rows(chunks: AsyncIterable[bytes], delimiter: str, width: int) -> AsyncIterator[Tuple[Optional[str], ...]]:
+    """
+    Строки CSV после заголовка, по одной на строку файла, для
+    copy_records_to_table. Битые строки приходят полями None, чтобы импорт
+    посчитал их отклоненными, а не падал целиком; пустые строки пропускаются.
+    """
+    tail = b""
+    header = True
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for raw in lines:
+            if header:
+                header = False
+            elif raw.strip():
+                yield parse_csv_line(raw, delimiter, width)
+    if tail.strip() and not header:
+        yield parse_csv_line(tail, delimiter, width)
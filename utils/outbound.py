@@ -0,0 +1,179 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from config import Config
+
+
+class Lane(IntEnum):
+    """Приоритет исходящих запросов: чем меньше значение, тем раньше уходит запрос."""
+    INTERACTIVE = 0
+    ADMIN = 1
+    BROADCAST = 2
+
+
+_current_lane: ContextVar[Lane] = ContextVar("outbound_lane", default=Lane.INTERACTIVE)
+
+
+@contextmanager
+def outbound_lane(lane: Lane):
+    """Все запросы к Bot API внутри блока уходят с указанным приоритетом."""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def set_outbound_lane(lane: Lane) -> None:
+    _current_lane.set(lane)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self) -> float:
+        """Сколько секунд ждать до появления целого токена."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+    def try_take(self, cost: float = 1) -> bool:
+        """Берет cost токенов, если они есть; иначе ничего не меняет."""
+        self._refill()
+        if self.tokens < cost:
+            return False
+        self.tokens -= cost
+        return True
+
+    def reserve(self) -> float:
+        """Берет токен в долг и возвращает, сколько нужно подождать до его появления."""
+        self._refill()
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def pause(self, seconds: float) -> None:
+        self._refill()
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+class OutboundScheduler:
+    """
+    Планировщик исходящих запросов к Bot API:
+    общий token bucket на весь бот, темп не выше OUTBOUND_CHAT_INTERVAL на
+    один чат и очереди приоритетов (интерактив > админка > рассылка).
+    Пока в общем ведре нет токенов, первым получает слот запрос с самым
+    высоким приоритетом, поэтому большая рассылка не вытесняет ответы
+    обычным пользователям.
+    """
+
+    def __init__(self, rate: float = Config.OUTBOUND_GLOBAL_RATE, burst: float = Config.OUTBOUND_GLOBAL_BURST,
+                 chat_interval: float = Config.OUTBOUND_CHAT_INTERVAL, chat_burst: float = Config.OUTBOUND_CHAT_BURST):
+        self._global = TokenBucket(rate, burst)
+        self._chat_rate = 1 / chat_interval
+        self._chat_burst = chat_burst
+        self._chats: Dict[int, TokenBucket] = {}
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._pump_task: Optional[asyncio.Task] = None
+        self.waited: Dict[Lane, int] = {lane: 0 for lane in Lane}
+
+    async def acquire(self, chat_id: int, lane: Lane) -> None:
+        chat_delay = self._chat_bucket(chat_id).reserve()
+        if chat_delay > 0:
+            await asyncio.sleep(chat_delay)
+
+        if not self._waiters and self._global.delay() == 0:
+            self._global.take()
+            return
+
+        self.waited[lane] += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (lane, next(self._seq), future))
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump())
+        await future
+
+    def pause(self, seconds: float) -> None:
+        """Telegram ответил RetryAfter — останавливаем все исходящие на это время."""
+        self._global.pause(seconds)
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) > 10000:
+                self._prune_chats()
+            bucket = self._chats[chat_id] = TokenBucket(self._chat_rate, self._chat_burst)
+        return bucket
+
+    def _prune_chats(self) -> None:
+        for chat_id in [c for c, b in self._chats.items() if b.delay() == 0 and b.tokens >= b.capacity]:
+            del self._chats[chat_id]
+
+    async def _pump(self) -> None:
+        while self._waiters:
+            delay = self._global.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._global.take()
+            future.set_result(None)
+
+
+class ScheduledAiohttpSession(AiohttpSession):
+    """
+    AiohttpSession, пропускающая запросы к чатам через OutboundScheduler,
+    с настроенным пулом соединений и keep-alive.
+    Служебные методы без chat_id (getUpdates, answerCallbackQuery и т.п.)
+    идут в обход планировщика.
+    """
+
+    def __init__(self, scheduler: OutboundScheduler, limit: int = Config.BOT_SESSION_LIMIT,
+                 keepalive_timeout: float = Config.BOT_SESSION_KEEPALIVE, **kwargs):
+        super().__init__(limit=limit, **kwargs)
+        self.scheduler = scheduler
+        self._connector_init.update(
+            keepalive_timeout=keepalive_timeout,
+            limit_per_host=limit,
+        )
+
+    async def make_request(self, bot: Bot, method: TelegramMethod[TelegramType],
+                           timeout: Optional[int] = None) -> TelegramType:
+        chat_id = getattr(method, "chat_id", None)
+        if not isinstance(chat_id, int):
+            return await super().make_request(bot, method, timeout)
+
+        lane = _current_lane.get()
+        for attempt in range(Config.OUTBOUND_MAX_RETRIES + 1):
+            await self.scheduler.acquire(chat_id, lane)
+            try:
+                return await super().make_request(bot, method, timeout)
+            except TelegramRetryAfter as e:
+                self.scheduler.pause(e.retry_after)
+                if attempt == Config.OUTBOUND_MAX_RETRIES:
+                    raise
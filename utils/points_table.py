@@ -0,0 +1,60 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping
+
+# "Имя Фамилия;7.5", "Имя Фамилия, 7,5", "Имя Фамилия<TAB>7" или "Имя Фамилия 7"
+_LINE_RE = re.compile(r"""^\s*(?P<name>.+?)[\s;,:=\t]+["']?(?P<points>[-+]?\d+(?:[.,]\d+)?)["']?\s*$""")
+# Имя в строке без очков: все до первого разделителя ("Имя Фамилия;" из шаблона бота)
+_NAME_ONLY_RE = re.compile(r"""^\s*["']?(?P<name>[^;,:=\t"']+)""")
+
+
+def normalize_player_name(name: str) -> str:
+    return " ".join(name.replace("ё", "е").replace("Ё", "Е").split()).casefold()
+
+
+@dataclass
+class PointsTable:
+    """Результат разбора таблицы очков: очки по player_id и найденные проблемы."""
+    points: Dict[int, float] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+
+def _is_roster_line(line: str, roster: Mapping[str, Mapping]) -> bool:
+    name = _NAME_ONLY_RE.match(line)
+    return name is not None and normalize_player_name(name.group("name")) in roster
+
+
+def parse_points_table(text: str, players: Iterable[Mapping]) -> PointsTable:
+    """
+    Разбирает вставленную таблицу или CSV ("игрок;очки" в строке) за один
+    проход и сверяет её с составом. Первая строка без числа в конце считается
+    заголовком, если в ней не игрок из состава (шаблон бота с пустыми очками
+    у первого игрока — ошибка, а не заголовок). Игроки, которых нет в таблице,
+    попадают в missing.
+    """
+    roster = {normalize_player_name(p['name']): p for p in players}
+    result = PointsTable()
+
+    for line_no, line in enumerate(text.lstrip("\ufeff").splitlines(), start=1):
+        if not line.strip():
+            continue
+        match = _LINE_RE.match(line)
+        if match is None:
+            if line_no > 1 or _is_roster_line(line, roster):
+                result.errors.append(f"Строка {line_no}: не удалось разобрать «{line.strip()}»")
+            continue
+
+        name = match.group("name").strip().strip("\"'")
+        player = roster.get(normalize_player_name(name))
+        if player is None:
+            result.errors.append(f"Строка {line_no}: игрок «{name}» не найден")
+            continue
+        if player['id'] in result.points:
+            result.errors.append(f"Строка {line_no}: игрок «{player['name']}» указан повторно")
+            continue
+
+        result.points[player['id']] = float(match.group("points").replace(",", "."))
+
+    result.missing = [p['name'] for p in roster.values() if p['id'] not in result.points]
+    return result
@@ -0,0 +1,102 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(obj: Any) -> str:
+    # aiogram кладет результат json_dumps в поля формы, поэтому нужна строка, а не bytes
+    return orjson.dumps(obj).decode()
+
+
+@dataclass(frozen=True)
+class RuntimeProfile:
+    """
+    Набор реализаций, на которых работает бот: цикл событий и JSON для
+    сессии Bot API. Библиотеки, которых нет в окружении, заменяются
+    стандартными, поэтому профиль "fast" всегда можно включить.
+    """
+    name: str
+    loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None
+    json_loads: Callable[..., Any] = json.loads
+    json_dumps: Callable[..., str] = json.dumps
+
+    @property
+    def loop_name(self) -> str:
+        return "uvloop" if self.loop_factory is not None else "asyncio"
+
+    @property
+    def json_name(self) -> str:
+        return "orjson" if self.json_loads is not json.loads else "json"
+
+    def session_kwargs(self) -> dict:
+        """Аргументы для конструктора сессии aiogram (json_loads/json_dumps)."""
+        return {"json_loads": self.json_loads, "json_dumps": self.json_dumps}
+
+    def run(self, main: Coroutine[Any, Any, T]) -> T:
+        """
+        asyncio.run на цикле событий профиля. asyncio.Runner(loop_factory=...)
+        появился только в Python 3.11, а образ собирается на 3.10, поэтому
+        чужой цикл запускается и закрывается вручную так же, как это делает asyncio.run.
+        """
+        if self.loop_factory is None:
+            return asyncio.run(main)
+
+        loop = self.loop_factory()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(main)
+        finally:
+            try:
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                if tasks:
+                    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.run_until_complete(loop.shutdown_default_executor())
+            finally:
+                asyncio.set_event_loop(None)
+                loop.close()
+
+
+STANDARD_PROFILE = RuntimeProfile("standard")
+
+
+def get_runtime_profile(name: Optional[str] = None) -> RuntimeProfile:
+    """Профиль по имени из Config.RUNTIME_PROFILE: "standard" или "fast"."""
+    name = (name or Config.RUNTIME_PROFILE).lower()
+    if name == "standard":
+        return STANDARD_PROFILE
+    if name != "fast":
+        logger.warning("Неизвестный профиль выполнения %r, используется standard", name)
+        return STANDARD_PROFILE
+
+    profile = RuntimeProfile(
+        "fast",
+        loop_factory=uvloop.new_event_loop if uvloop is not None else None,
+        json_loads=orjson.loads if orjson is not None else json.loads,
+        json_dumps=_orjson_dumps if orjson is not None else json.dumps,
+    )
+    missing = [module for module, installed in (("uvloop", uvloop), ("orjson", orjson)) if installed is None]
+    if missing:
+        logger.warning("Профиль fast: не установлены %s, вместо них используются стандартные модули",
+                       ", ".join(missing))
+    return profile
@@ -0,0 +1,6 @@
+from aiogram.types import User
+
+
+def display_username(user: User) -> str:
+    """Имя пользователя для хранения в БД: username или заглушка по telegram_id."""
+    return user.username or f"user_{user.id}"